@@ -0,0 +1,92 @@
+'''
+Все замеры graphNet одним запуском, результаты сохраняются в JSON для сравнения между версиями:
+
+    python -m Benchmarks --output benchmarks.json
+    python -m Benchmarks --output new.json --compare benchmarks.json
+
+При сравнении выводятся замеры, медиана которых выросла больше чем в threshold раз,
+и возвращается код 1, если такие есть.
+'''
+from pathlib import Path
+import argparse
+import json
+import platform
+import subprocess
+import sys
+
+from Benchmarks import startup
+
+
+
+def environment() -> dict[str, str]:
+    '''
+    Версии, от которых зависят замеры.
+    '''
+    import dearpygui
+    import numpy
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            "dearpygui": dearpygui.__version__, "numpy": numpy.__version__, "commit": commit}
+
+
+def medians(results: dict, prefix: str = "") -> dict[str, float]:
+    '''
+    Медианы всех замеров с путями вида "compile_graph/100/cold".
+    '''
+    found = {}
+    for name, value in results.items():
+        if not isinstance(value, dict): continue
+        path = f"{prefix}{name}"
+        if "median" in value: found[path] = value["median"]
+        else: found |= medians(value, f"{path}/")
+    return found
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    '''
+    Замеры, которые стали медленнее baseline больше чем в threshold раз.
+    '''
+    before = medians(baseline)
+    regressions = []
+
+    for path, value in medians(current).items():
+        if path in before and before[path] > 0 and value / before[path] > threshold:
+            regressions.append(f"{path}: {before[path]:.6f} -> {value:.6f} с (x{value / before[path]:.2f})")
+
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="Benchmarks", description="Замеры запуска и редактора graphNet")
+    parser.add_argument("--repeat", type=int, default=5, help="количество повторов каждого замера")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="размеры синтетических графов")
+    parser.add_argument("--output", type=Path, help="файл для результатов в формате JSON")
+    parser.add_argument("--compare", type=Path, help="прошлые результаты для поиска регрессий")
+    parser.add_argument("--threshold", type=float, default=1.2, help="допустимый рост медианы, раз")
+    args = parser.parse_args(argv)
+
+    # Холодный запуск меряется в отдельных интерпретаторах до того, как редактор загружен в этот процесс
+    results = {"environment": environment(), "startup": startup.measure(args.repeat)}
+
+    from Benchmarks import editor
+    results |= editor.measure(args.repeat, tuple(args.sizes))
+
+    text = json.dumps(results, ensure_ascii=False, indent=4)
+    if args.output: args.output.write_text(text, encoding="utf-8")
+    print(text)
+
+    if not args.compare: return 0
+
+    regressions = compare(results, json.loads(args.compare.read_text(encoding="utf-8")), args.threshold)
+    for regression in regressions:
+        print(f"Регрессия {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+'''
+Замеры редактора без окна: контекст DearPyGui создаётся так же, как в DPGUnitTest.
+
+    python -m Benchmarks.editor --repeat 5 --sizes 10 100 1000
+
+Измеряется построение списка узлов (NodeBuilder.build_list), построение каждого узла из списка
+(NodeBuilder.build_node) и сборка синтетических графов (NodeBuilder.compile_graph).
+'''
+from contextlib import contextmanager
+from typing import Callable, Iterator
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+
+import dearpygui.dearpygui as dpg
+
+from Src.node_editor import NodeEditor
+from Src.Config import NodeAnnotation, Parameter
+from Src.Config.Annotations import AInteger
+from Src.Config.node_list import node_catalog
+from Src.Enums import AttrType
+from Src.Managers import ThemeManager
+from Src.Nodes import AbstractNode
+
+
+
+# Дешёвый узел для синтетических графов: замер показывает накладные расходы редактора и планировщика, а не Keras
+BENCH_NODE = NodeAnnotation(
+    label="Benchmark",
+    node_type=AbstractNode,
+    logic=lambda *inputs, value: value + sum(inputs),
+    annotations={"value": Parameter(AttrType.INPUT, AInteger, default=1)},
+    input=AbstractNode,
+    docs="Узел синтетического графа"
+)
+
+
+def stats(values: list[float]) -> dict[str, float]:
+    return {"median": statistics.median(values), "min": min(values), "max": max(values)}
+
+
+def timed(func: Callable, repeat: int, setup: Callable = None) -> dict[str, float]:
+    '''
+    Время выполнения func за repeat повторов. setup вызывается перед каждым повтором и в замер не входит.
+    '''
+    values = []
+    for _ in range(repeat):
+        if setup: setup()
+        start = time.perf_counter()
+        func()
+        values.append(time.perf_counter() - start)
+    return stats(values)
+
+
+@contextmanager
+def editor_context() -> Iterator[NodeEditor]:
+    '''
+    Контекст DearPyGui без показа окна и редактор в нём.
+    '''
+    dpg.create_context()
+    dpg.create_viewport(title="benchmark")
+    ThemeManager.load_themes("Assets/themes.json")
+    try:
+        editor = NodeEditor()
+        with dpg.window(tag="benchmark"):
+            editor.show("benchmark")
+        yield editor
+    finally:
+        dpg.destroy_context()
+
+
+def bench_build_list(editor: NodeEditor, repeat: int) -> dict[str, float]:
+    parent = dpg.add_window()
+    return timed(lambda: editor.builder.build_list(parent), repeat,
+                 setup=lambda: dpg.delete_item(parent, children_only=True))
+
+
+def bench_build_node(editor: NodeEditor, repeat: int) -> dict[str, dict[str, float]]:
+    '''
+    Время построения каждого узла из списка узлов. Узел удаляется после замера.
+    '''
+    results = {}
+
+    for label, annotation in node_catalog.items():
+        values = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            node_id = editor.builder.build_node(annotation, "node_editor")
+            values.append(time.perf_counter() - start)
+            editor.delete_node(node_id)
+        results[label] = stats(values)
+
+    return results
+
+
+def synthetic_graph(editor: NodeEditor, size: int, seed: int = 0) -> list[AbstractNode]:
+    '''
+    Построить в редакторе случайный DAG из size узлов: каждый узел связан с предыдущим
+    и, начиная с третьего, ещё с одним случайным более ранним узлом.
+
+    Returns:
+        list[AbstractNode] - узлы без входящих связей
+    '''
+    generator = random.Random(seed)
+    nodes: list[AbstractNode] = []
+
+    for index in range(size):
+        node: AbstractNode = dpg.get_item_user_data(editor.builder.build_node(BENCH_NODE, "node_editor"))
+        sources = {index - 1, generator.randrange(index - 1)} if index >= 2 else {index - 1} if index else set()
+
+        for source in sorted(sources):
+            editor.link_callback("node_editor", (nodes[source].attribute("OUTPUT"), node.attribute("INPUT")))
+        nodes.append(node)
+
+    return nodes[:1]
+
+
+def bench_compile(editor: NodeEditor, size: int, repeat: int) -> dict[str, dict[str, float]]:
+    '''
+    Сборка синтетического графа: cold - все узлы изменены, warm - граф не менялся и узлы берут прошлый результат.
+    '''
+    editor.clear()
+    start_nodes = synthetic_graph(editor, size)
+    nodes = [dpg.get_item_user_data(node_id) for node_id in dpg.get_item_children("node_editor", slot=1)]
+
+    def invalidate():
+        for node in nodes: node.invalidate()
+
+    cold = timed(lambda: editor.builder.compile_graph(start_nodes), repeat, setup=invalidate)
+    warm = timed(lambda: editor.builder.compile_graph(start_nodes), repeat)
+
+    if len(editor.builder.scheduler.visited) != size:
+        raise RuntimeError(f"Синтетический граф из {size} узлов собран не полностью")
+
+    editor.clear()
+    return {"cold": cold, "warm": warm}
+
+
+def measure(repeat: int = 5, sizes: tuple[int, ...] = (10, 100, 1000)) -> dict[str, object]:
+    with editor_context() as editor:
+        return {
+            "build_list": bench_build_list(editor, repeat),
+            "build_node": bench_build_node(editor, repeat),
+            "compile_graph": {str(size): bench_compile(editor, size, repeat) for size in sizes},
+        }
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="Benchmarks.editor", description="Замеры редактора graphNet")
+    parser.add_argument("--repeat", type=int, default=5, help="количество повторов каждого замера")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="размеры синтетических графов")
+    args = parser.parse_args(argv)
+
+    print(json.dumps(measure(args.repeat, tuple(args.sizes)), ensure_ascii=False, indent=4))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
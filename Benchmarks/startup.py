@@ -0,0 +1,84 @@
+'''
+Замер запуска приложения. Каждый запуск выполняется в новом интерпретаторе, чтобы импорт был холодным:
+
+    python -m Benchmarks.startup --repeat 5 --output startup.json
+
+Измеряется время импорта редактора, время до готового окна редактора (контекст DearPyGui, viewport,
+список узлов и узел входа) и время фонового прогрева TensorFlow после этого.
+'''
+from pathlib import Path
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+
+# Выполняется в отдельном интерпретаторе, печатает замеры одной строкой JSON
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+
+import dearpygui.dearpygui as dpg
+from Src.node_editor import NodeEditor
+from Src.Managers import ThemeManager
+from Src.Utils import warm_up
+imported = time.perf_counter()
+
+dpg.create_context()
+dpg.create_viewport(title="benchmark")
+ThemeManager.load_themes("Assets/themes.json")
+editor = NodeEditor()
+ready = time.perf_counter()
+keras_loaded = "keras" in sys.modules
+
+warm_up("keras").join()
+warmed = time.perf_counter()
+dpg.destroy_context()
+
+print(json.dumps({"import_editor": imported - start, "editor_ready": ready - start,
+                  "warm_up": warmed - ready, "keras_loaded": keras_loaded}))
+"""
+
+
+def probe(root: Path) -> dict[str, object]:
+    '''
+    Один холодный запуск редактора в новом интерпретаторе.
+    '''
+    completed = subprocess.run([sys.executable, "-c", PROBE], cwd=root, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def measure(repeat: int = 5, root: Path = Path(".")) -> dict[str, object]:
+    '''
+    Медиана, минимум и максимум каждого замера по repeat запускам.
+    '''
+    runs = [probe(root) for _ in range(repeat)]
+    results = {}
+
+    for name in ("import_editor", "editor_ready", "warm_up"):
+        values = [run[name] for run in runs]
+        results[name] = {"median": statistics.median(values), "min": min(values), "max": max(values)}
+
+    results["keras_loaded"] = any(run["keras_loaded"] for run in runs)
+    results["repeat"] = repeat
+    return results
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="Benchmarks.startup", description="Замер запуска редактора graphNet")
+    parser.add_argument("--repeat", type=int, default=5, help="количество холодных запусков")
+    parser.add_argument("--output", type=Path, help="файл для результатов в формате JSON")
+    args = parser.parse_args(argv)
+
+    results = measure(args.repeat)
+    text = json.dumps(results, ensure_ascii=False, indent=4)
+
+    if args.output: args.output.write_text(text, encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
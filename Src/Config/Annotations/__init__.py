@@ -8,5 +8,7 @@ from Src.Config.Annotations.anot_string import AString
 from Src.Config.Annotations.anot_node import ANode
 from Src.Config.Annotations.anot_sequence import ASequence
 from Src.Config.Annotations.anot_enum import AEnum
+from Src.Config.Annotations.anot_enum_list import AEnumList
+from Src.Config.Annotations.anot_plot import APlot
 
 from Src.Config.Annotations.single import Single
\ No newline at end of file
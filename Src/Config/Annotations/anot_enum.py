@@ -53,10 +53,13 @@ class AEnum(Annotation):
         return dpg.get_value(input_id)
 
 
-    def set(self, input_id: str | int, value: enum.Enum) -> bool:
+    def set(self, input_id: str | int, value: enum.Enum | str) -> bool:
         """
-        Устанавливает значение для dpg.add_combo.
+        Устанавливает значение для dpg.add_combo. Принимает элемент Enum или его значение (как возвращает get).
         """
+        if not isinstance(value, enum.Enum) and value in self.items:
+            value = self.source(value)
+
         if not isinstance(value, enum.Enum) or \
             value.value not in self.items or \
             DPGType(dpg.get_item_type(input_id)) != DPGType.COMBO:
@@ -0,0 +1,60 @@
+import enum
+
+import dearpygui.dearpygui as dpg
+
+from Src.Config.Annotations.annotation import Annotation
+from Src.Enums import DPGType
+
+
+class AEnumList(Annotation):
+    """
+    Аннотация для выбора нескольких значений Enum: флажок на каждое значение (dpg.add_checkbox в dpg.group).
+    Значение поля - список выбранных значений в порядке Enum.
+    """
+
+
+    def __class_getitem__(cls, enum_source: type):
+        return cls(source=enum_source)
+
+
+    def __init__(self, source: enum.Enum):
+        self.source = source
+        self.items = [member.value for member in source]
+
+
+    def build(self, *args, **kwargs):
+        kwargs = Annotation.check_kwargs(dpg.group, kwargs)
+        kwargs.pop('width', None)
+
+        with dpg.group(*args, **kwargs) as item:
+            for value in self.items:
+                dpg.add_checkbox(label=value, user_data=value)
+
+            # Если отсутсвует label, то создаст пустой текст
+            dpg.add_text(kwargs.get('label') or '')
+
+        return item
+
+
+    def get(self, input_id: int | str) -> list[str]:
+        if DPGType(dpg.get_item_type(input_id)) != DPGType.GROUP:
+            raise Exception(f"Incompatable item for AEnumList.get - {dpg.get_item_type(input_id)}")
+
+        return [dpg.get_item_user_data(checkbox) for checkbox in dpg.get_item_children(input_id)[1][:-1]
+                if dpg.get_value(checkbox)]
+
+
+    def set(self, input_id: str | int, value: list) -> bool:
+        """
+        Отметить значения из списка. Принимает элементы Enum или их значения (как возвращает get).
+        """
+        if not isinstance(value, list | tuple) or DPGType(dpg.get_item_type(input_id)) != DPGType.GROUP:
+            return False
+
+        selected = {item.value if isinstance(item, enum.Enum) else item for item in value}
+        if not selected <= set(self.items):
+            return False
+
+        for checkbox in dpg.get_item_children(input_id)[1][:-1]:
+            dpg.set_value(checkbox, dpg.get_item_user_data(checkbox) in selected)
+        return True
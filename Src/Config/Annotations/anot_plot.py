@@ -0,0 +1,51 @@
+import dearpygui.dearpygui as dpg
+
+from Src.Config.Annotations.annotation import Annotation
+from Src.Enums import DPGType
+
+
+
+
+class APlot(Annotation):
+    '''
+    График с одной линией (dpg.plot). Используется для полей вывода, значение - пара (x, y).
+    '''
+    HEIGHT = 160
+
+
+    @staticmethod
+    def build(*args, **kwargs):
+        kwargs = Annotation.check_kwargs(dpg.plot, kwargs)
+        kwargs.setdefault('height', APlot.HEIGHT)
+
+        with dpg.plot(**kwargs) as item:
+            dpg.add_plot_axis(dpg.mvXAxis, auto_fit=True)
+            with dpg.plot_axis(dpg.mvYAxis, auto_fit=True):
+                dpg.add_line_series([], [])
+
+        return item
+
+
+    @staticmethod
+    def series(input_id: int | str) -> int | str:
+        y_axis = dpg.get_item_children(input_id, slot=1)[1]
+        return dpg.get_item_children(y_axis, slot=1)[0]
+
+
+    @staticmethod
+    def get(input_id: int | str):
+        if DPGType(dpg.get_item_type(input_id)) != DPGType.PLOT:
+            raise Exception(f"Incompatable item for APlot.get - {dpg.get_item_type(input_id)}")
+
+        return dpg.get_value(APlot.series(input_id))[:2]
+
+
+    @staticmethod
+    def set(input_id: str | int, value: tuple) -> bool:
+        if not (isinstance(value, tuple) and len(value) == 2) or \
+            DPGType(dpg.get_item_type(input_id)) != DPGType.PLOT:
+            return False
+
+        x, y = value
+        dpg.set_value(APlot.series(input_id), [list(map(float, x)), list(map(float, y))])
+        return True
@@ -52,8 +52,8 @@ class ASequence(Annotation):
         return result
     
 
-    def set(self, input_id: str| int, value: tuple) -> bool:
-        if not isinstance(value, tuple) or len(value) > len(self.shape) or \
+    def set(self, input_id: str| int, value: tuple | list) -> bool:
+        if not isinstance(value, tuple | list) or len(value) > len(self.shape) or \
             DPGType(dpg.get_item_type(input_id)) != DPGType.GROUP:
             return False
         
@@ -12,21 +12,22 @@ class NodeAnnotation:
     node_type: type
     logic: Callable
     annotations: dict[str, Parameter]
-    docs: str = None
+    _docs: str = None
     input: Parameter | bool
     output: Parameter | bool
+    memoize: bool
 
 
     def __init__(self, label: str, node_type: type, logic: Callable, 
                  annotations: dict[str, Parameter] = {}, docs: str = None, 
-                 input: bool = Any, output: bool = None):
+                 input: bool = Any, output: bool = None, memoize: bool = False):
         self.label = label
+        self.memoize = memoize
         self.node_type = node_type
         self.logic = logic
         self.annotations = annotations
 
-        self.docs = docs
-        if not self.docs: self.docs = inspect.getdoc(self.logic)
+        self._docs = docs
 
         self.input = input
         if self.input: 
@@ -38,10 +39,19 @@ class NodeAnnotation:
         if self.output: self.output = Parameter(AttrType.OUTPUT, ANode[self.output])
 
 
+    @property
+    def docs(self) -> str:
+        # Документация берётся из logic при первом обращении: logic может ссылаться на ещё не импортированный Keras
+        if not self._docs: self._docs = inspect.getdoc(self.logic)
+        return self._docs
+
+
     @property
     def kwargs(self):
         return {'annotations': self.annotations,
                 'logic': self.logic,
-                'docs': self.docs}
+                'docs': self.docs,
+                'label': self.label,
+                'memoize': self.memoize}
 
 
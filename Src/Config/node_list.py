@@ -1,16 +1,27 @@
 import numpy as np
 
-from keras import layers
-import keras
-
 from Src.Enums import *
 from Src.Nodes import *
 from Src.Config.parameter import Parameter
 from Src.Config.node_annotation import NodeAnnotation
 from Src.Config.Annotations import *
+from Src.Utils import lazy
+
+
+# Узел входа создаётся редактором сам и не входит в список слева
+# TODO: Сделать типизированную передачу у shape TableDataNode
+input_node = NodeAnnotation(
+    label="Input",
+    node_type=InputLayerNode, 
+    logic = InputLayerNode.create_input,
+    annotations = {
+            "shape": Parameter(AttrType.INPUT, ANode[Single[object]]),
+        },
+    input=False,
+    output=LayerNode
+    )
 
 
-# TODO Сделать сериализацию в JSON?
 node_list = {
     "Data & Preprocessing":
     {
@@ -24,12 +35,32 @@ node_list = {
                         "delimiter": Parameter(AttrType.INPUT, AEnum[Delimiters]),
                         "skip_header": Parameter(AttrType.INPUT, ABoolean),
                         "skip_footer": Parameter(AttrType.INPUT, ABoolean),
+                        "dtype": Parameter(AttrType.INPUT, AEnum[DTypes]),
+                        "shape": Parameter(AttrType.OUTPUT, 
+                                           ASequence[AInteger, AInteger, AInteger],
+                                           backfield=ShapeNode.shape)  
+                    },
+                input=False,
+                output=DataNode,
+                memoize=True
+            ),
+            NodeAnnotation(
+                label = "Tables stream",
+                node_type = ShapeNode,
+                logic = ShapeNode.open_table_stream,
+                annotations = {
+                        "files": Parameter(AttrType.INPUT, AString),
+                        "delimiter": Parameter(AttrType.INPUT, AEnum[Delimiters]),
+                        "skip_header": Parameter(AttrType.INPUT, ABoolean),
+                        "skip_footer": Parameter(AttrType.INPUT, ABoolean),
+                        "dtype": Parameter(AttrType.INPUT, AEnum[DTypes]),
                         "shape": Parameter(AttrType.OUTPUT, 
                                            ASequence[AInteger, AInteger, AInteger],
                                            backfield=ShapeNode.shape)  
                     },
                 input=False,
-                output=DataNode
+                output=DataNode,
+                memoize=True
             ),
             NodeAnnotation(
                 label="Images data",
@@ -38,10 +69,13 @@ node_list = {
                 annotations = {
                         "files": Parameter(AttrType.INPUT, AString),
                         "color_mode": Parameter(AttrType.INPUT, AEnum[ColorMode]),
+                        "target_size": Parameter(AttrType.INPUT, ASequence[AInteger, AInteger]),
+                        "interpolation": Parameter(AttrType.INPUT, AEnum[Interpolation]),
                         "shape": Parameter(AttrType.OUTPUT, ASequence[AInteger, AInteger, AInteger])
                         },
                 input=False,
-                output=DataNode
+                output=DataNode,
+                memoize=True
             ),
             NodeAnnotation(
                 label="Load Dataset",
@@ -56,25 +90,48 @@ node_list = {
                         "shape": Parameter(AttrType.OUTPUT, ASequence[AInteger, AInteger, AInteger])
                         },
                 input=False,
-                output=False
+                output=False,
+                memoize=True
             ),
         ],
         "Processing Utils": [
             NodeAnnotation(
                 label="to categorical",
                 node_type= DataNode,
-                logic = keras.utils.to_categorical,
+                logic = lazy("keras.utils.to_categorical"),
                 annotations = {
                         "num_classes": Parameter(AttrType.INPUT, AInteger)
                     },
-                input=Single[DataNode]
+                input=Single[DataNode],
+                memoize=True
             ),
             NodeAnnotation(
                 label="from categorical",
                 node_type= DataNode,
                 logic = lambda x: np.argmax(x, axis=-1).reshape(-1, 1),
                 annotations = {},
-                input=Single[DataNode]
+                input=Single[DataNode],
+                memoize=True
+            ),
+            NodeAnnotation(
+                label="Split",
+                node_type= SplitNode,
+                logic = SplitNode.split,
+                annotations = {
+                        "val_size": Parameter(AttrType.INPUT, AFloat, default=0.1),
+                        "test_size": Parameter(AttrType.INPUT, AFloat, default=0.2),
+                        "shuffle": Parameter(AttrType.INPUT, ABoolean, default=True),
+                        "seed": Parameter(AttrType.INPUT, AInteger),
+                        "stratify": Parameter(AttrType.INPUT, ANode[Single[DataNode]]),
+                        "split": Parameter(AttrType.INPUT, ANode[Single[SplitNode]]),
+                        "train": Parameter(AttrType.OUTPUT, ANode[DataNode]),
+                        "val": Parameter(AttrType.OUTPUT, ANode[DataNode]),
+                        "test": Parameter(AttrType.OUTPUT, ANode[DataNode]),
+                        "index": Parameter(AttrType.OUTPUT, ANode[SplitNode])
+                    },
+                input=Single[DataNode],
+                output=False,
+                memoize=True
             ),
         ]
     },
@@ -85,7 +142,7 @@ node_list = {
             NodeAnnotation(
                 label= "Dense",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Dense),
+                logic = LayerNode.layer(lazy("keras.layers.Dense")),
                 annotations = {
                         "units": Parameter(AttrType.INPUT, AInteger, default=1),
                         "activation": Parameter(AttrType.INPUT, AEnum[Activations]),
@@ -96,7 +153,7 @@ node_list = {
             NodeAnnotation(
                 label= "Activation",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Activation),
+                logic = LayerNode.layer(lazy("keras.layers.Activation")),
                 annotations = {
                         "activation": Parameter(AttrType.INPUT, AEnum[Activations]),
                     },
@@ -105,7 +162,7 @@ node_list = {
             NodeAnnotation(
                 label= "Dropout",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Dropout),
+                logic = LayerNode.layer(lazy("keras.layers.Dropout")),
                 annotations = {
                         "rate": Parameter(AttrType.INPUT, AFloat, default=0.8),
                     },
@@ -114,14 +171,14 @@ node_list = {
             NodeAnnotation(
                 label= "BatchNormalization",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.BatchNormalization),
+                logic = LayerNode.layer(lazy("keras.layers.BatchNormalization")),
                 annotations = {},
                 input=LayerNode
             ),
             NodeAnnotation(
                 label= "LayerNormalization",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.LayerNormalization),
+                logic = LayerNode.layer(lazy("keras.layers.LayerNormalization")),
                 annotations = {},
                 input=LayerNode
             ),
@@ -131,7 +188,7 @@ node_list = {
             NodeAnnotation(
                 label= "Conv1D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Conv1D),
+                logic = LayerNode.layer(lazy("keras.layers.Conv1D")),
                 annotations = {
                         "filters": Parameter(AttrType.INPUT, AInteger, default=1),
                         "kernel_size": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -145,7 +202,7 @@ node_list = {
             NodeAnnotation(
                 label= "Conv2D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Conv2D),
+                logic = LayerNode.layer(lazy("keras.layers.Conv2D")),
                 annotations = {
                         "filters": Parameter(AttrType.INPUT, AInteger, default=1),
                         "kernel_size": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -159,7 +216,7 @@ node_list = {
             NodeAnnotation(
                 label= "Conv3D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Conv3D),
+                logic = LayerNode.layer(lazy("keras.layers.Conv3D")),
                 annotations = {
                         "filters": Parameter(AttrType.INPUT, AInteger, default=1),
                         "kernel_size": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -173,7 +230,7 @@ node_list = {
             NodeAnnotation(
                 label= "DepthwiseConv1D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.DepthwiseConv1D),
+                logic = LayerNode.layer(lazy("keras.layers.DepthwiseConv1D")),
                 annotations = {
                         "filters": Parameter(AttrType.INPUT, AInteger, default=1),
                         "kernel_size": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -188,7 +245,7 @@ node_list = {
             NodeAnnotation(
                 label= "DepthwiseConv2D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.DepthwiseConv2D),
+                logic = LayerNode.layer(lazy("keras.layers.DepthwiseConv2D")),
                 annotations = {
                         "filters": Parameter(AttrType.INPUT, AInteger, default=1),
                         "kernel_size": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -203,7 +260,7 @@ node_list = {
             NodeAnnotation(
                 label= "SeparableConv1D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.SeparableConv1D),
+                logic = LayerNode.layer(lazy("keras.layers.SeparableConv1D")),
                 annotations = {
                         "filters": Parameter(AttrType.INPUT, AInteger, default=1),
                         "kernel_size": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -218,7 +275,7 @@ node_list = {
             NodeAnnotation(
                 label= "SeparableConv2D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.SeparableConv1D),
+                logic = LayerNode.layer(lazy("keras.layers.SeparableConv2D")),
                 annotations = {
                         "filters": Parameter(AttrType.INPUT, AInteger, default=1),
                         "kernel_size": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -233,7 +290,7 @@ node_list = {
             NodeAnnotation(
                 label= "MaxPooling1D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.MaxPooling1D),
+                logic = LayerNode.layer(lazy("keras.layers.MaxPooling1D")),
                 annotations = {
                         "pool_size": Parameter(AttrType.INPUT, AInteger, default=2),
                         "strides": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -244,7 +301,7 @@ node_list = {
             NodeAnnotation(
                 label= "MaxPooling2D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.MaxPooling2D),
+                logic = LayerNode.layer(lazy("keras.layers.MaxPooling2D")),
                 annotations = {
                         "pool_size": Parameter(AttrType.INPUT, ASequence[AInteger, AInteger], default=(2,2)),
                         "strides": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -255,7 +312,7 @@ node_list = {
             NodeAnnotation(
                 label= "MaxPooling3D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.MaxPooling3D),
+                logic = LayerNode.layer(lazy("keras.layers.MaxPooling3D")),
                 annotations = {
                         "pool_size": Parameter(AttrType.INPUT, ASequence[AInteger, AInteger, AInteger], default=(2,2,2)),
                         "strides": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -266,7 +323,7 @@ node_list = {
             NodeAnnotation(
                 label= "AveragePooling1D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.AveragePooling1D),
+                logic = LayerNode.layer(lazy("keras.layers.AveragePooling1D")),
                 annotations = {
                         "pool_size": Parameter(AttrType.INPUT, AInteger, default=2),
                         "strides": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -277,7 +334,7 @@ node_list = {
             NodeAnnotation(
                 label= "AveragePooling2D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.AveragePooling2D),
+                logic = LayerNode.layer(lazy("keras.layers.AveragePooling2D")),
                 annotations = {
                         "pool_size": Parameter(AttrType.INPUT, ASequence[AInteger, AInteger], default=(2,2)),
                         "strides": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -288,7 +345,7 @@ node_list = {
             NodeAnnotation(
                 label= "AveragePooling3D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.AveragePooling3D),
+                logic = LayerNode.layer(lazy("keras.layers.AveragePooling3D")),
                 annotations = {
                         "pool_size": Parameter(AttrType.INPUT, ASequence[AInteger, AInteger, AInteger], default=(2,2,2)),
                         "strides": Parameter(AttrType.INPUT, AInteger, default=1),
@@ -301,19 +358,19 @@ node_list = {
             NodeAnnotation(
                 label="Concatenate",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Concatenate),
+                logic = LayerNode.layer(lazy("keras.layers.Concatenate")),
                 input=LayerNode
             ),
             NodeAnnotation(
                 label="Flatten",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Flatten),
+                logic = LayerNode.layer(lazy("keras.layers.Flatten")),
                 input=LayerNode
             ),
             NodeAnnotation(
                 label="Add",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Add),
+                logic = LayerNode.layer(lazy("keras.layers.Add")),
                 input=LayerNode
             )
         ]
@@ -338,6 +395,11 @@ node_list = {
                         "x": Parameter(AttrType.INPUT, ANode[Single[DataNode]]),
                         "y": Parameter(AttrType.INPUT, ANode[Single[DataNode]]),
                         "epochs": Parameter(AttrType.INPUT, AInteger),
+                        "batch_size": Parameter(AttrType.INPUT, AInteger, default=32),
+                        "pipeline": Parameter(AttrType.INPUT, ABoolean),
+                        "shuffle_buffer": Parameter(AttrType.INPUT, AInteger),
+                        "cache": Parameter(AttrType.INPUT, ABoolean),
+                        "progress": Parameter(AttrType.STATIC, APlot),
                         "history": Parameter(AttrType.OUTPUT, ANode[DataNode])  
                     },
                 input = Single[CompileNode]
@@ -348,6 +410,8 @@ node_list = {
                 logic = PredictNode.predict,
                 annotations = {
                         "x": Parameter(AttrType.INPUT, ANode[Single[DataNode]]),
+                        "batch_size": Parameter(AttrType.INPUT, AInteger, default=32),
+                        "filename": Parameter(AttrType.INPUT, AString),
                     },
                 input = Single[FitNode],
                 output = DataNode
@@ -357,7 +421,7 @@ node_list = {
             NodeAnnotation(
                 label="Save model",
                 node_type= UtilsNode,
-                logic = keras.saving.save_model,
+                logic = lazy("keras.saving.save_model"),
                 annotations = {
                         "model": Parameter(AttrType.INPUT, ANode[Single[FitNode]]),
                         "filepath": Parameter(AttrType.INPUT, AString, default='model.keras')
@@ -368,7 +432,7 @@ node_list = {
             NodeAnnotation(
                 label="Plot model",
                 node_type= UtilsNode,
-                logic = keras.utils.plot_model,
+                logic = lazy("keras.utils.plot_model"),
                 annotations = {
                         "model": Parameter(AttrType.INPUT, ANode[Single[CompileNode]]),
                         "to_file": Parameter(AttrType.INPUT, AString),
@@ -394,15 +458,34 @@ node_list = {
                     )
                 },
                 input=False,
-                output=DataNode
+                output=DataNode,
+                memoize=True
+            ),
+            NodeAnnotation(
+                label="Evaluate",
+                node_type=EvaluateNode,
+                logic=EvaluateNode.evaluate,
+                annotations={
+                    "metrics": Parameter(AttrType.INPUT, AEnumList[Metrics]),
+                    "y_true": Parameter(AttrType.INPUT, ANode[Single[DataNode]]),
+                    "y_pred": Parameter(AttrType.INPUT, ANode[Single[DataNode]]),
+                    "model": Parameter(AttrType.INPUT, ANode[Single[FitNode]]),
+                    "x": Parameter(AttrType.INPUT, ANode[Single[DataNode]]),
+                    "batch_size": Parameter(AttrType.INPUT, AInteger, default=4096)
+                },
+                input=False,
+                output=DataNode,
+                memoize=True
             ),
             NodeAnnotation(
                 label="Save data",
                 node_type = UtilsNode,
-                logic = np.savetxt,
+                logic = UtilsNode.save_data,
                 annotations = {
                     "X": Parameter(AttrType.INPUT, ANode[Single[DataNode]]),
-                    "fname": Parameter(AttrType.INPUT, AString, default='result.txt')
+                    "fname": Parameter(AttrType.INPUT, AString, default='result.npy'),
+                    "compressed": Parameter(AttrType.INPUT, ABoolean),
+                    "append": Parameter(AttrType.INPUT, ABoolean)
                 },
                 input = False,
                 output = False
@@ -421,3 +504,10 @@ node_list = {
         ]
     }
 }
+
+
+# Описания узлов по названиям, по ним узлы восстанавливаются из сохранённого графа
+node_catalog: dict[str, NodeAnnotation] = {input_node.label: input_node} | {
+    annotation.label: annotation
+    for group in node_list.values() for annotations in group.values() for annotation in annotations
+}
@@ -8,4 +8,6 @@ from Src.Enums.delimiters import Delimiters
 from Src.Enums.dpg_types import DPGType
 from Src.Enums.metrics import Metrics
 from Src.Enums.themes import Themes
-from Src.Enums.datasets import Datasets
\ No newline at end of file
+from Src.Enums.datasets import Datasets
+from Src.Enums.dtypes import DTypes
+from Src.Enums.interpolation import Interpolation
\ No newline at end of file
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class DTypes(Enum):
+    """
+    Enum для типов элементов загружаемых массивов
+    """
+    FLOAT32 = "float32"
+    FLOAT64 = "float64"
+    FLOAT16 = "float16"
+    INT64 = "int64"
+    INT32 = "int32"
+    UINT8 = "uint8"
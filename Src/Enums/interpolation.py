@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class Interpolation(Enum):
+    """
+    Enum для способов интерполяции при изменении размера изображений
+    """
+    BILINEAR = "bilinear"
+    NEAREST = "nearest"
+    BICUBIC = "bicubic"
+    LANCZOS = "lanczos"
+    BOX = "box"
+    HAMMING = "hamming"
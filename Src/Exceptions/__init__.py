@@ -1 +1,5 @@
-from Src.Exceptions.network_exception import NetworkException
\ No newline at end of file
+from Src.Exceptions.network_exception import NetworkException
+from Src.Exceptions.cycle_exception import CycleException
+from Src.Exceptions.cancelled_exception import CancelledException
+from Src.Exceptions.worker_exception import WorkerException
+from Src.Exceptions.shape_exception import ShapeException
\ No newline at end of file
@@ -0,0 +1,4 @@
+
+
+class CancelledException(Exception):
+    pass
@@ -0,0 +1,4 @@
+
+
+class WorkerException(Exception):
+    pass
@@ -0,0 +1,7 @@
+from Src.Graph.graph_scheduler import GraphScheduler
+from Src.Graph.graph_model import GraphModel, GraphNode, GraphLink
+from Src.Graph.headless_runner import HeadlessRunner
+
+from Src.Graph.compile_worker import CompileWorker, WorkerResult, SharedArray, ArrayInfo
+
+from Src.Graph.shape_inference import ShapeInference, SHAPE_RULES
\ No newline at end of file
@@ -0,0 +1,294 @@
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+import gc
+import multiprocessing
+import threading
+import traceback
+
+import numpy as np
+
+from Src.Logging import logging, Logger
+from Src.Enums import AttrType
+from Src.Exceptions import WorkerException
+from Src.Graph.graph_model import GraphModel
+from Src.Utils import peak_rss
+
+
+
+@dataclass
+class ArrayInfo:
+    '''
+    Описание массива, который остался в процессе сборки: форма и тип без данных.
+    Сам массив можно получить через CompileWorker.fetch.
+    '''
+    shape: tuple[int, ...]
+    dtype: str
+
+
+
+@dataclass
+class SharedArray:
+    '''
+    Массив, переданный между процессами через разделяемую память. Через канал передаётся только
+    название блока, форма и тип, сами данные не сериализуются. Блок создаёт процесс сборки (share)
+    и сразу закрывает свою ссылку на него, владельцем блока становится получатель: receive копирует
+    массив и удаляет блок (unlink).
+    '''
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+    @classmethod
+    def share(cls, array: np.ndarray) -> "SharedArray":
+        '''
+        Скопировать массив в новый блок разделяемой памяти. Блок живёт, пока его не освободит receive
+        в процессе-получателе.
+        '''
+        array = np.ascontiguousarray(array)
+        memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+
+        view = np.ndarray(array.shape, array.dtype, buffer=memory.buf)
+        view[...] = array
+        del view
+
+        memory.close()
+        return cls(memory.name, array.shape, array.dtype.str)
+
+
+    def receive(self) -> np.ndarray:
+        '''
+        Скопировать массив из разделяемой памяти и освободить блок.
+        '''
+        memory = shared_memory.SharedMemory(name=self.name)
+        try:
+            return np.ndarray(self.shape, np.dtype(self.dtype), buffer=memory.buf).copy()
+        finally:
+            memory.close()
+            memory.unlink()
+
+
+
+@dataclass
+class WorkerResult:
+    '''
+    Результат выполнения графа в процессе сборки.
+
+    Attributes:
+        visited: set[int] - успешно выполненные узлы
+        errors: dict[int, str] - сообщения об ошибках узлов
+        timings: dict[int, float] - время выполнения узлов в секундах
+        outputs: dict[int, dict[str, object]] - выходы узлов: числа, строки и их списки как есть,
+            массивы - описанием ArrayInfo. Данные массивов и модели Keras остаются в процессе сборки.
+        memory: int - пиковый объём памяти процесса сборки в байтах
+    '''
+    visited: set[int] = field(default_factory=set)
+    errors: dict[int, str] = field(default_factory=dict)
+    timings: dict[int, float] = field(default_factory=dict)
+    outputs: dict[int, dict[str, object]] = field(default_factory=dict)
+    memory: int = 0
+
+
+
+# Типы выходов, которые передаются через канал как есть
+SMALL_TYPES = (bool, int, float, str, type(None))
+
+
+def export(value: object) -> object:
+    '''
+    Подготовить выход узла к передаче в основной процесс: числа, строки и их кортежи/списки - как есть,
+    числовые массивы - только формой и типом (ArrayInfo), остальное (модели, потоки данных) не передаётся.
+    '''
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        return ArrayInfo(value.shape, value.dtype.str)
+    if isinstance(value, SMALL_TYPES):
+        return value
+    if isinstance(value, list | tuple) and all(isinstance(item, SMALL_TYPES) for item in value):
+        return value
+    return None
+
+
+def serve(connection: Connection):
+    '''
+    Цикл процесса сборки: получает граф (GraphModel.to_dict), выполняет его через HeadlessRunner
+    и отправляет WorkerResult. Массивы последнего графа хранятся в процессе до следующего графа и
+    отправляются через разделяемую память по запросу ("fetch", node_id, name).
+    После каждого графа сессия Keras очищается. None завершает процесс.
+    '''
+    # Keras загружается только в процессе сборки
+    import keras
+    from Src.Graph.headless_runner import HeadlessRunner
+    from Src.Managers import WriteManager
+
+    arrays: dict[tuple[int, str], np.ndarray] = {}
+
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message is None: break
+
+        if isinstance(message, tuple):
+            _, node_id, name = message
+            if (node_id, name) in arrays:
+                connection.send(SharedArray.share(arrays[node_id, name]))
+            else:
+                connection.send(WorkerException(f"Выход {name} узла {node_id} не найден в процессе сборки"))
+            continue
+
+        arrays.clear()
+        try:
+            runner = HeadlessRunner(GraphModel.from_dict(message))
+            runner.run()
+
+            result = WorkerResult(set(runner.scheduler.visited),
+                                  {node_id: f"{type(ex).__name__}: {ex}" for node_id, ex in runner.errors.items()},
+                                  dict(runner.scheduler.timings))
+
+            for node_id in result.visited:
+                node = runner.nodes[node_id]
+                names = ["OUTPUT"] + [name for name, parameter in runner.annotations[node_id].annotations.items()
+                                      if parameter.attr_type == AttrType.OUTPUT and name != "OUTPUT"]
+                values = {name: getattr(node, name, None) for name in names}
+                result.outputs[node_id] = {name: export(value) for name, value in values.items()}
+                arrays.update(((node_id, name), value) for name, value in values.items()
+                              if isinstance(result.outputs[node_id][name], ArrayInfo))
+
+            del runner
+            reply = result
+
+        except Exception as ex:
+            traceback.print_exception(ex)
+            reply = WorkerException(f"{type(ex).__name__}: {ex}")
+
+        # Модели последнего графа больше не нужны, освобождаем граф TensorFlow и память Keras
+        keras.backend.clear_session()
+        gc.collect()
+
+        if isinstance(reply, WorkerResult):
+            reply.memory = peak_rss()
+        connection.send(reply)
+
+    WriteManager.wait()
+
+
+
+class CompileWorker:
+    '''
+    Постоянный процесс сборки графа. Модели Keras создаются и обучаются в нём, а не в процессе интерфейса,
+    поэтому память TensorFlow можно вернуть системе, перезапустив процесс. Процесс запускается при первой сборке
+    и перезапускается автоматически после max_runs сборок.
+
+    Attributes:
+        max_runs: int - количество сборок, после которого процесс перезапускается, 0 - не перезапускать
+        runs: int - количество сборок в текущем процессе
+        process: multiprocessing.Process - процесс сборки
+    '''
+    max_runs: int
+    runs: int = 0
+    process: multiprocessing.Process = None
+    _connection: Connection = None
+    _lock: threading.Lock
+    logger: Logger
+
+
+    def __init__(self, max_runs: int = 10):
+        self.max_runs = max_runs
+        self._lock = threading.Lock()
+        self.logger = logging()("nodes")
+
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+
+    def start(self):
+        '''
+        Запустить процесс сборки. Используется spawn: fork процесса с потоками TensorFlow и DearPyGui небезопасен.
+        '''
+        context = multiprocessing.get_context("spawn")
+        self._connection, child = context.Pipe()
+        self.process = context.Process(target=serve, args=(child,), name="graphnet-compile", daemon=True)
+        self.process.start()
+        child.close()
+        self.runs = 0
+        self.logger.info(f"Запущен процесс сборки {self.process.pid}")
+
+
+    def stop(self):
+        '''
+        Завершить процесс сборки. Если он выполняет граф, процесс прерывается.
+        '''
+        if self.process is None: return
+
+        if self.alive and not self._lock.locked():
+            try:
+                self._connection.send(None)
+            except OSError:
+                pass
+            self.process.join(timeout=5)
+
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+
+        self._connection.close()
+        self.logger.info(f"Процесс сборки {self.process.pid} завершён")
+        self.process = None
+
+
+    def recycle(self):
+        '''
+        Перезапустить процесс сборки, чтобы освободить накопленную им память.
+        '''
+        self.stop()
+        self.start()
+
+
+    def run(self, graph: GraphModel) -> WorkerResult:
+        '''
+        Выполнить граф в процессе сборки. Блокирует вызывающий поток до получения результата.
+
+        Raises:
+            WorkerException - процесс сборки завершился во время выполнения или не смог выполнить граф.
+        '''
+        if self.max_runs and self.runs >= self.max_runs:
+            self.stop()
+        if not self.alive:
+            self.start()
+
+        with self._lock:
+            self.runs += 1
+            try:
+                self._connection.send(graph.to_dict())
+                reply = self._connection.recv()
+            except (EOFError, OSError) as ex:
+                raise WorkerException("Процесс сборки завершился во время выполнения графа") from ex
+
+        if isinstance(reply, Exception): raise reply
+        return reply
+
+
+    def fetch(self, node_id: int, name: str = "OUTPUT") -> np.ndarray:
+        '''
+        Получить массив выхода name узла node_id из последней сборки. Массив передаётся через разделяемую
+        память и копируется в процесс интерфейса, поэтому запрашивать стоит только нужные массивы.
+
+        Raises:
+            WorkerException - процесс сборки не запущен или такого массива нет.
+        '''
+        if not self.alive:
+            raise WorkerException("Процесс сборки не запущен")
+
+        with self._lock:
+            try:
+                self._connection.send(("fetch", node_id, name))
+                reply = self._connection.recv()
+            except (EOFError, OSError) as ex:
+                raise WorkerException("Процесс сборки завершился во время передачи массива") from ex
+
+        if isinstance(reply, Exception): raise reply
+        return reply.receive()
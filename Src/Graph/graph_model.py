@@ -0,0 +1,121 @@
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+import json
+
+
+
+@dataclass
+class GraphNode:
+    '''
+    Узел сохранённого графа.
+
+    Attributes:
+        id: int - идентификатор узла внутри графа
+        label: str - название узла в списке узлов (NodeAnnotation.label)
+        params: dict[str, object] - значения параметров, которые вводятся в узле
+        position: list[float] - положение узла в редакторе
+    '''
+    id: int
+    label: str
+    params: dict[str, object] = field(default_factory=dict)
+    position: list[float] = field(default_factory=lambda: [0.0, 0.0])
+
+
+
+@dataclass
+class GraphLink:
+    '''
+    Связь выхода output узла source со входом input узла target.
+    '''
+    source: int
+    output: str
+    target: int
+    input: str
+
+
+
+@dataclass
+class GraphModel:
+    '''
+    Описание графа без DearPyGui: узлы, значения их параметров и связи. Сохраняется в JSON.
+    '''
+    VERSION = 1
+
+    nodes: list[GraphNode] = field(default_factory=list)
+    links: list[GraphLink] = field(default_factory=list)
+
+
+    def node(self, node_id: int) -> GraphNode:
+        for node in self.nodes:
+            if node.id == node_id: return node
+        raise KeyError(f"Узел {node_id} отсутствует в графе")
+
+
+    def incoming(self, node_id: int, label: str = None) -> list[GraphLink]:
+        '''
+        Связи, которые приходят в узел (во вход label, если он указан).
+        '''
+        return [link for link in self.links
+                if link.target == node_id and (label is None or link.input == label)]
+
+
+    def index(self) -> dict[int, GraphNode]:
+        '''
+        Узлы по идентификатору. Для обхода всего графа строится один раз вместо вызова node() для каждого узла.
+        '''
+        return {node.id: node for node in self.nodes}
+
+
+    def incoming_links(self) -> dict[int, dict[str, list[GraphLink]]]:
+        '''
+        Входящие связи каждого узла по названиям входов, за один проход по связям.
+        '''
+        incoming = {node.id: {} for node in self.nodes}
+        for link in self.links:
+            incoming.setdefault(link.target, {}).setdefault(link.input, []).append(link)
+        return incoming
+
+
+    def dependencies(self) -> dict[int, set[int]]:
+        '''
+        Для каждого узла набор узлов, от которых он зависит, в формате GraphScheduler.
+        '''
+        dependencies = {node.id: set() for node in self.nodes}
+        for link in self.links:
+            dependencies[link.target].add(link.source)
+        return dependencies
+
+
+    def to_dict(self) -> dict:
+        return {"version": self.VERSION,
+                "nodes": [asdict(node) for node in self.nodes],
+                "links": [asdict(link) for link in self.links]}
+
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GraphModel":
+        if data.get("version", cls.VERSION) > cls.VERSION:
+            raise AttributeError(f"Граф сохранён более новой версией программы: {data['version']}")
+
+        graph = cls([GraphNode(**node) for node in data.get("nodes", [])],
+                    [GraphLink(**link) for link in data.get("links", [])])
+
+        ids = {node.id for node in graph.nodes}
+        if len(ids) != len(graph.nodes):
+            raise AttributeError("Идентификаторы узлов графа повторяются")
+        for link in graph.links:
+            if link.source not in ids or link.target not in ids:
+                raise AttributeError(f"Связь ссылается на несуществующий узел: {link}")
+
+        return graph
+
+
+    def save(self, path: str | Path):
+        with Path(path).open('w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=4, default=str)
+
+
+    @classmethod
+    def load(cls, path: str | Path) -> "GraphModel":
+        with Path(path).open('r', encoding='utf-8') as file:
+            return cls.from_dict(json.load(file))
@@ -0,0 +1,196 @@
+from collections import deque
+from functools import partial
+from itertools import chain
+from typing import Callable, Hashable, Iterable
+import time
+
+import dearpygui.dearpygui as dpg
+
+from Src.Logging import logging, Logger
+from Src.Exceptions import CycleException
+
+
+
+class GraphScheduler:
+    '''
+    Планировщик выполнения графа. Один раз за компиляцию строит DAG узлов
+    с индексом входящих степеней и выполняет узлы в топологическом порядке (алгоритм Кана).
+
+    Attributes:
+        nodes: list[Hashable] - узлы графа в порядке обнаружения
+        successors: dict[Hashable, list[Hashable]] - узлы, которые зависят от узла
+        in_degree: dict[Hashable, int] - количество различных узлов, от которых зависит узел
+        timings: dict[Hashable, float] - время выполнения узлов в секундах
+        visited: set[Hashable] - успешно выполненные узлы текущего запуска
+        finished: bool - выполнение графа закончено
+    '''
+    nodes: list[Hashable]
+    successors: dict[Hashable, list[Hashable]]
+    in_degree: dict[Hashable, int]
+    timings: dict[Hashable, float]
+    visited: set[Hashable]
+    finished: bool = True
+    logger: Logger
+
+
+    def __init__(self, dependencies: dict[Hashable, Iterable[Hashable]]):
+        '''
+        Args:
+            dependencies: dict[Hashable, Iterable[Hashable]] - для каждого узла набор узлов, от которых он зависит.
+        '''
+        self.logger = logging()("nodes")
+        self.nodes = []
+        self.successors = {}
+        self.in_degree = {}
+        self.timings = {}
+
+        for node, predecessors in dependencies.items():
+            self.__add_node(node)
+            for predecessor in set(predecessors):
+                self.__add_node(predecessor)
+                self.successors[predecessor].append(node)
+                self.in_degree[node] += 1
+
+
+    def __add_node(self, node: Hashable):
+        if node in self.in_degree: return
+        self.nodes.append(node)
+        self.successors[node] = []
+        self.in_degree[node] = 0
+
+
+    @staticmethod
+    def owner(attribute: str | int):
+        '''
+        Узел, которому принадлежит атрибут (dpg.node_attribute).
+        '''
+        return dpg.get_item_user_data(dpg.get_item_parent(attribute))
+
+
+    @classmethod
+    def from_editor(cls, start_nodes: list) -> "GraphScheduler":
+        '''
+        Построить планировщик по графу в редакторе. Граф обходится один раз от начальных узлов,
+        каждая связь разрешается в узел ровно один раз.
+
+        Args:
+            start_nodes: list[AbstractNode] - узлы без входящих связей.
+        '''
+        dependencies = {}
+        queue = deque(start_nodes)
+
+        while queue:
+            node = queue.popleft()
+            if node in dependencies: continue
+
+            dependencies[node] = {cls.owner(attr) for attr in chain(*node.incoming.values())}
+
+            for neighbor in chain(dependencies[node],
+                                  (cls.owner(attr) for attr in chain(*node.outgoing.values()))):
+                if neighbor not in dependencies: queue.append(neighbor)
+
+        return cls(dependencies)
+
+
+    def order(self) -> list[Hashable]:
+        '''
+        Топологический порядок узлов. Работает за O(V+E).
+
+        Raises:
+            CycleException - если в графе есть цикл.
+        '''
+        in_degree = self.in_degree.copy()
+        ready = deque(node for node in self.nodes if in_degree[node] == 0)
+        order = []
+
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+
+            for successor in self.successors[node]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0: ready.append(successor)
+
+        if len(order) != len(self.nodes):
+            cycle = [node for node in self.nodes if in_degree[node] > 0]
+            raise CycleException(f"Граф содержит цикл, в него входят узлы: {cycle}")
+
+        return order
+
+
+    def start(self, execute: Callable[[Hashable, Callable[[bool], None]], None], 
+              on_finish: Callable[[set[Hashable]], None] = None) -> set[Hashable]:
+        '''
+        Начать выполнение узлов в топологическом порядке. Узел может завершиться сразу или позже
+        (например, после фонового обучения), продолжение выполнения графа вызывается через done.
+        После первого неудачного узла новые узлы не запускаются.
+
+        Args:
+            execute: Callable[[Hashable, Callable[[bool], None]], None] - запускает узел, по завершении вызывает done(status).
+            on_finish: Callable[[set[Hashable]], None] - вызывается, когда выполнение графа закончено.
+
+        Returns:
+            set[Hashable] - успешно выполненные узлы, заполняется по ходу выполнения.
+        '''
+        self.visited = set()
+        self.timings = {}
+        self.finished = False
+        self.__execute = execute
+        self.__on_finish = on_finish
+        self.__remaining = self.in_degree.copy()
+        self.__ready = deque(node for node in self.nodes if self.__remaining[node] == 0)
+        self.__started = {}
+        self.__failed = False
+        self.__advancing = False
+
+        self.__advance()
+
+        return self.visited
+
+
+    def run(self, execute: Callable[[Hashable], bool]) -> set[Hashable]:
+        '''
+        Выполнить узлы синхронно. Останавливается на первом узле, который не удалось выполнить.
+
+        Args:
+            execute: Callable[[Hashable], bool] - функция выполнения узла, возвращает статус.
+
+        Returns:
+            set[Hashable] - успешно выполненные узлы.
+        '''
+        return self.start(lambda node, done: done(execute(node)))
+
+
+    def __advance(self):
+        # Узлы, завершившиеся сразу, вызывают __complete внутри цикла,
+        # поэтому повторный вход только пополняет очередь и не углубляет стек
+        if self.__advancing: return
+        self.__advancing = True
+
+        while self.__ready and not self.__failed:
+            node = self.__ready.popleft()
+            self.__started[node] = time.perf_counter()
+            self.__execute(node, partial(self.__complete, node))
+
+        self.__advancing = False
+
+        if not self.finished and len(self.__started) == len(self.timings) and \
+            (self.__failed or not self.__ready):
+            self.finished = True
+            self.logger.info(f"Граф выполнен за {sum(self.timings.values()):.4f} с, узлов: {len(self.visited)}/{len(self.nodes)}")
+            if self.__on_finish: self.__on_finish(self.visited)
+
+
+    def __complete(self, node: Hashable, status: bool):
+        self.timings[node] = time.perf_counter() - self.__started[node]
+        self.logger.info(f"Узел {node} выполнен за {self.timings[node]:.4f} с")
+
+        if not status:
+            self.__failed = True
+        else:
+            self.visited.add(node)
+            for successor in self.successors[node]:
+                self.__remaining[successor] -= 1
+                if self.__remaining[successor] == 0: self.__ready.append(successor)
+
+        self.__advance()
@@ -0,0 +1,172 @@
+from concurrent.futures import Future
+from typing import Callable
+import traceback
+
+from Src.Logging import logging, Logger
+from Src.Config.Annotations import ANode
+from Src.Config.node_list import node_catalog, NodeAnnotation
+from Src.Enums import AttrType
+from Src.Graph.graph_model import GraphModel, GraphNode, GraphLink
+from Src.Graph.graph_scheduler import GraphScheduler
+from Src.Graph.shape_inference import ShapeInference
+from Src.Managers import TaskManager, Profiler
+from Src.Nodes import AbstractNode
+
+
+
+class HeadlessRunner:
+    '''
+    Выполнение сохранённого графа без интерфейса. Значения параметров берутся из GraphModel,
+    входы узлов - из результатов узлов-предков, узлы выполняются в топологическом порядке
+    без цикла отрисовки, фоновые узлы независимых веток - параллельно в пуле TaskManager.
+
+    Attributes:
+        graph: GraphModel - выполняемый граф
+        annotations: dict[int, NodeAnnotation] - описание каждого узла из списка узлов
+        nodes: dict[int, AbstractNode] - узлы графа
+        errors: dict[int, Exception] - ошибки узлов, которые не удалось выполнить
+        scheduler: GraphScheduler - планировщик последнего запуска
+    '''
+    graph: GraphModel
+    annotations: dict[int, NodeAnnotation]
+    nodes: dict[int, AbstractNode]
+    errors: dict[int, Exception]
+    scheduler: GraphScheduler = None
+    logger: Logger
+    _graph_nodes: dict[int, GraphNode]
+    _incoming: dict[int, dict[str, list[GraphLink]]]
+
+
+    def __init__(self, graph: GraphModel, catalog: dict[str, NodeAnnotation] = node_catalog):
+        self.logger = logging()("nodes")
+        self.graph = graph
+        self.annotations = {}
+        self.nodes = {}
+        self.errors = {}
+
+        for graph_node in graph.nodes:
+            if graph_node.label not in catalog:
+                raise AttributeError(f"Неизвестный узел '{graph_node.label}'")
+
+            annotation = catalog[graph_node.label]
+            self.annotations[graph_node.id] = annotation
+            self.nodes[graph_node.id] = annotation.node_type(graph_node.id, **annotation.kwargs)
+
+        self._graph_nodes = graph.index()
+        self._incoming = graph.incoming_links()
+
+
+    def values(self, node_id: int) -> dict[str, object]:
+        '''
+        Значения параметров узла, как их собрал бы редактор: введённые значения из графа,
+        а для входов-связей - поля результатов узлов-предков.
+        '''
+        params = self._graph_nodes[node_id].params
+        values = {}
+
+        for name, parameter in self.annotations[node_id].annotations.items():
+            if parameter.attr_type != AttrType.INPUT: continue
+
+            if isinstance(parameter.hint, ANode) or parameter.hint is ANode:
+                results = [getattr(self.nodes[link.source], link.output) for link in self._incoming[node_id].get(name, [])]
+                values[name] = results[0] if parameter.hint.single and results else results
+
+            elif name in params:
+                values[name] = params[name]
+
+            elif parameter.default is not None:
+                values[name] = parameter.default
+
+        return values
+
+
+    def execute(self, node_id: int, done: Callable[[bool], None]):
+        '''
+        Выполнить узел. Логика фоновых узлов выполняется в пуле TaskManager, результат сохраняется
+        в узел в потоке, который разбирает очередь TaskManager, поэтому независимые ветки выполняются параллельно.
+        '''
+        node = self.nodes[node_id]
+        self.logger.info(f"Компиляция ноды - {self._graph_nodes[node_id].label} ({node_id})")
+
+        try:
+            task = node.make_task(self.values(node_id))
+        except Exception as ex:
+            return done(self.finish(node_id, error=ex))
+
+        if not node.background:
+            try:
+                output = node.execute(task)
+            except Exception as ex:
+                return done(self.finish(node_id, error=ex))
+            return done(self.finish(node_id, output))
+
+        def on_result(future: Future):
+            if future.exception(): return done(self.finish(node_id, error=future.exception()))
+            done(self.finish(node_id, future.result()))
+
+        TaskManager.submit(node.execute, task, callback=on_result)
+
+
+    def finish(self, node_id: int, output = None, error: Exception = None) -> bool:
+        '''
+        Сохранить результат узла или ошибку логики.
+        '''
+        node = self.nodes[node_id]
+
+        try:
+            if error: raise error
+            node.commit(output)
+        except Exception as ex:
+            self.errors[node_id] = ex
+            self.logger.warning(f"Поймана ошибка в узле {node_id}: {ex}")
+            self.logger.info("".join(traceback.format_exception(ex)))
+            return False
+
+        node.dirty = False
+        node.version += 1
+        return True
+
+
+    def run(self) -> set[int]:
+        '''
+        Выполнить граф. Готовые узлы запускаются сразу, новые узлы не запускаются после первой ошибки.
+
+        Raises:
+            CycleException - если в графе есть цикл.
+            ShapeException - если формы слоёв несовместимы, проверяется до выполнения узлов.
+
+        Returns:
+            set[int] - успешно выполненные узлы.
+        '''
+        ShapeInference(self.graph).check()
+
+        self.errors = {}
+        Profiler.clear()
+        self.scheduler = GraphScheduler(self.graph.dependencies())
+        self.scheduler.order()
+
+        visited = self.scheduler.start(self.execute)
+        while not self.scheduler.finished:
+            TaskManager.process_ui_queue(block=True)
+
+        return visited
+
+
+    def report(self) -> str:
+        '''
+        Таблица времени выполнения узлов последнего запуска: общее время, процессорное время логики
+        и прирост пикового объёма памяти.
+        '''
+        if not self.scheduler: return ""
+
+        width = max([len(node.label) for node in self.graph.nodes] + [10]) + 8
+        lines = [f"{'Узел':<{width}} {'Время, с':>10} {'CPU, с':>10} {'RSS, МБ':>10}"]
+
+        for node_id, seconds in self.scheduler.timings.items():
+            profile = self.nodes[node_id].profile
+            cpu, rss = (f"{profile.cpu:>10.4f}", f"{profile.rss / 2**20:>10.1f}") if profile else (f"{'-':>10}", f"{'-':>10}")
+            status = "" if node_id not in self.errors else f"  ОШИБКА: {self.errors[node_id]}"
+            lines.append(f"{f'{node_id} {self._graph_nodes[node_id].label}':<{width}} {seconds:>10.4f} {cpu} {rss}{status}")
+
+        lines.append(f"{'Всего':<{width}} {sum(self.scheduler.timings.values()):>10.4f}")
+        return "\n".join(lines)
@@ -0,0 +1,305 @@
+from functools import lru_cache
+from math import ceil, prod
+from pathlib import Path
+from typing import Callable
+import os
+
+import numpy as np
+
+from Src.Exceptions import ShapeException, CycleException
+from Src.Graph.graph_model import GraphModel, GraphNode
+from Src.Graph.graph_scheduler import GraphScheduler
+
+
+# Форма одного примера без оси батча, None - неизвестный размер оси
+Shape = tuple[int | None, ...]
+
+
+
+def single(label: str, inputs: list[Shape]) -> Shape:
+    if len(inputs) != 1:
+        raise ShapeException(f"Слой {label} принимает один вход, подано {len(inputs)}")
+    return inputs[0]
+
+
+def expand(value, rank: int, name: str) -> tuple[int, ...]:
+    '''
+    Параметр окна слоя (kernel_size, pool_size, strides) для каждой пространственной оси.
+    '''
+    values = tuple(value) if isinstance(value, list | tuple) else (value,) * rank
+    if len(values) != rank or any(not isinstance(item, int) or item <= 0 for item in values):
+        raise ShapeException(f"{name} должен содержать {rank} положительных целых, получено {value}")
+    return values
+
+
+def window(size: int | None, kernel: int, stride: int, padding: str) -> int | None:
+    '''
+    Размер оси после свёртки или пулинга, как его считает Keras.
+    '''
+    if size is None: return None
+    if padding == "same": return ceil(size / stride)
+
+    result = (size - kernel) // stride + 1
+    if result <= 0:
+        raise ShapeException(f"Окно {kernel} больше оси размера {size} при padding='valid'")
+    return result
+
+
+def identity(label: str, inputs: list[Shape], params: dict) -> Shape:
+    return single(label, inputs)
+
+
+def dense(label: str, inputs: list[Shape], params: dict) -> Shape:
+    shape = single(label, inputs)
+    if not shape:
+        raise ShapeException(f"Слою {label} нужен вход хотя бы с одной осью")
+    return shape[:-1] + (params.get("units", 1),)
+
+
+def flatten(label: str, inputs: list[Shape], params: dict) -> Shape:
+    shape = single(label, inputs)
+    return (None if None in shape else prod(shape),)
+
+
+def convolution(rank: int, depthwise: bool = False) -> Callable[[str, list[Shape], dict], Shape]:
+    '''
+    Правило для свёрток rank-D: вход (*оси, каналы), каналы выхода - filters
+    или, у depthwise-свёрток, каналы входа * depth_multiplier.
+    '''
+    def rule(label: str, inputs: list[Shape], params: dict) -> Shape:
+        shape = single(label, inputs)
+        if len(shape) != rank + 1:
+            raise ShapeException(f"Слою {label} нужен вход с {rank + 1} осями (без батча), подан {shape}")
+
+        kernel = expand(params.get("kernel_size", 1), rank, "kernel_size")
+        strides = expand(params.get("strides", 1), rank, "strides")
+        padding = params.get("padding", "valid")
+
+        spatial = tuple(window(size, k, s, padding) for size, k, s in zip(shape[:-1], kernel, strides))
+        if depthwise:
+            channels = None if shape[-1] is None else shape[-1] * params.get("depth_multiplier", 1)
+        else:
+            channels = params.get("filters", 1)
+        return spatial + (channels,)
+
+    return rule
+
+
+def pooling(rank: int) -> Callable[[str, list[Shape], dict], Shape]:
+    def rule(label: str, inputs: list[Shape], params: dict) -> Shape:
+        shape = single(label, inputs)
+        if len(shape) != rank + 1:
+            raise ShapeException(f"Слою {label} нужен вход с {rank + 1} осями (без батча), подан {shape}")
+
+        pool = expand(params.get("pool_size", 2), rank, "pool_size")
+        strides = expand(params.get("strides", 1), rank, "strides")
+        padding = params.get("padding", "valid")
+
+        return tuple(window(size, k, s, padding) for size, k, s in zip(shape[:-1], pool, strides)) + (shape[-1],)
+
+    return rule
+
+
+def concatenate(label: str, inputs: list[Shape], params: dict) -> Shape:
+    '''
+    Concatenate по последней оси: остальные оси входов должны совпадать.
+    '''
+    first = inputs[0]
+    if not first:
+        raise ShapeException(f"Слою {label} нужны входы хотя бы с одной осью")
+
+    for shape in inputs[1:]:
+        if len(shape) != len(first) or not all(a is None or b is None or a == b for a, b in zip(shape[:-1], first[:-1])):
+            raise ShapeException(f"Слой {label}: формы {first} и {shape} совпадают не во всех осях, кроме последней")
+
+    last = [shape[-1] for shape in inputs]
+    return first[:-1] + ((None if None in last else sum(last)),)
+
+
+def add(label: str, inputs: list[Shape], params: dict) -> Shape:
+    '''
+    Поэлементное сложение: формы входов должны совпадать или транслироваться друг в друга.
+    '''
+    result = inputs[0]
+    for shape in inputs[1:]:
+        if len(shape) != len(result):
+            raise ShapeException(f"Слой {label}: входы разной размерности {result} и {shape}")
+
+        merged = []
+        for a, b in zip(result, shape):
+            if a is not None and b is not None and a != b and 1 not in (a, b):
+                raise ShapeException(f"Слой {label}: формы {result} и {shape} не совпадают")
+            merged.append(None if a is None or b is None else max(a, b))
+        result = tuple(merged)
+
+    return result
+
+
+# Правила вывода формы выхода слоя по формам входов и параметрам, по названию узла в списке узлов
+SHAPE_RULES: dict[str, Callable[[str, list[Shape], dict], Shape]] = {
+    "Dense": dense,
+    "Activation": identity,
+    "Dropout": identity,
+    "BatchNormalization": identity,
+    "LayerNormalization": identity,
+    "Conv1D": convolution(1),
+    "Conv2D": convolution(2),
+    "Conv3D": convolution(3),
+    "DepthwiseConv1D": convolution(1, depthwise=True),
+    "DepthwiseConv2D": convolution(2, depthwise=True),
+    "SeparableConv1D": convolution(1),
+    "SeparableConv2D": convolution(2),
+    "MaxPooling1D": pooling(1),
+    "MaxPooling2D": pooling(2),
+    "MaxPooling3D": pooling(3),
+    "AveragePooling1D": pooling(1),
+    "AveragePooling2D": pooling(2),
+    "AveragePooling3D": pooling(3),
+    "Concatenate": concatenate,
+    "Flatten": flatten,
+    "Add": add,
+}
+
+
+# Сколько последних проб файлов хранится: редактор проверяет формы при каждой связи
+PROBE_CACHE_SIZE = 256
+
+
+def modified(path: str | Path) -> int:
+    return os.stat(path).st_mtime_ns
+
+
+@lru_cache(maxsize=PROBE_CACHE_SIZE)
+def npy_shape(path: str, mtime: int) -> Shape:
+    '''
+    Форма примера в .npy по заголовку. mtime входит в ключ кэша: изменённый файл читается заново.
+    '''
+    return np.load(path, mmap_mode='r').shape[1:]
+
+
+@lru_cache(maxsize=PROBE_CACHE_SIZE)
+def table_columns(path: str, delimiter: str, mtime: int) -> Shape:
+    '''
+    Количество столбцов таблицы по первой строке. Тип и пропуск строк на количество столбцов не влияют.
+    '''
+    from Src.Utils import TableReader
+    return (TableReader(path, delimiter=delimiter).count_columns(),)
+
+
+def dataset_shape(node: GraphNode) -> Shape | None:
+    from Src.Utils import DatasetStore
+
+    name = node.params.get("dataset")
+    if not name or not DatasetStore.exists(name): return None
+
+    path = str(DatasetStore.path(name) / "X_train.npy")
+    return npy_shape(path, modified(path))
+
+
+def table_shape(node: GraphNode) -> Shape | None:
+    path = node.params.get("files")
+    if not path: return None
+    return table_columns(str(path), node.params.get("delimiter", ','), modified(path))
+
+
+def image_shape(node: GraphNode) -> Shape | None:
+    target_size = node.params.get("target_size")
+    if not target_size or not all(target_size): return None
+    channels = {"grayscale": 1, "rgb": 3, "rgba": 4}.get(node.params.get("color_mode", "rgb"))
+    return (*target_size, channels)
+
+
+# Дешёвое определение формы примера у источников данных без загрузки: заголовок .npy зеркала датасетов,
+# первая строка таблицы, размер изображений из параметров
+SHAPE_PROBES: dict[str, Callable[[GraphNode], Shape | None]] = {
+    "Load Dataset": dataset_shape,
+    "Tables data": table_shape,
+    "Tables stream": table_shape,
+    "Images data": image_shape,
+}
+
+
+
+class ShapeInference:
+    '''
+    Статический вывод форм выходов слоёв без создания слоёв Keras и без загрузки данных. Форма входа берётся
+    из поля shape узла данных (ShapeNode.shape после загрузки) или из SHAPE_PROBES, затем распространяется
+    по слоям в топологическом порядке по правилам SHAPE_RULES. Если форма входа неизвестна, слои после него
+    не проверяются, узлы без правила (компиляция, обучение) не проверяются.
+
+    Attributes:
+        graph: GraphModel - проверяемый граф
+        known: dict[int, Shape] - уже известные формы данных узлов-источников
+        shapes: dict[int, Shape] - выведенные формы выходов узлов
+        errors: dict[int, str] - узлы, в которых формы несовместимы
+    '''
+    graph: GraphModel
+    known: dict[int, Shape]
+    shapes: dict[int, Shape]
+    errors: dict[int, str]
+    _nodes: dict[int, GraphNode]
+
+
+    def __init__(self, graph: GraphModel, known: dict[int, Shape] = None):
+        self.graph = graph
+        self.known = known or {}
+        self.shapes = {}
+        self.errors = {}
+        self._nodes = graph.index()
+
+
+    def data_shape(self, node_id: int) -> Shape | None:
+        if node_id in self.known: return tuple(self.known[node_id])
+
+        node = self._nodes[node_id]
+        probe = SHAPE_PROBES.get(node.label)
+        try:
+            return probe(node) if probe else None
+        except (OSError, ValueError, AttributeError):
+            return None
+
+
+    def run(self) -> dict[int, Shape]:
+        '''
+        Вывести формы всех узлов графа. Граф с циклом не проверяется: цикл найдёт GraphScheduler при сборке.
+        '''
+        self.shapes, self.errors = {}, {}
+        # Узлы и входящие связи индексируются один раз на проход, а не ищутся для каждого узла
+        self._nodes = self.graph.index()
+        incoming = self.graph.incoming_links()
+
+        try:
+            order = GraphScheduler(self.graph.dependencies()).order()
+        except CycleException:
+            return self.shapes
+
+        for node_id in order:
+            node = self._nodes[node_id]
+
+            if node.label == "Input":
+                shape = [self.data_shape(link.source) for link in incoming[node_id].get("shape", [])]
+                if shape and shape[0] is not None: self.shapes[node_id] = tuple(shape[0])
+                continue
+
+            rule = SHAPE_RULES.get(node.label)
+            inputs = [self.shapes.get(link.source) for link in incoming[node_id].get("INPUT", [])]
+            if rule is None or not inputs or None in inputs: continue
+
+            try:
+                self.shapes[node_id] = rule(node.label, inputs, node.params)
+            except ShapeException as ex:
+                self.errors[node_id] = str(ex)
+
+        return self.shapes
+
+
+    def check(self) -> dict[int, Shape]:
+        '''
+        Raises:
+            ShapeException - если формы хотя бы одного слоя несовместимы.
+        '''
+        shapes = self.run()
+        if self.errors:
+            raise ShapeException("\n".join(f"{self._nodes[node_id].label} ({node_id}): {error}"
+                                           for node_id, error in self.errors.items()))
+        return shapes
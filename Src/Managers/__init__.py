@@ -1,4 +1,9 @@
 from .callbacks import CallbackInfo, CallbackType
 
 from .event_manager import Event_manager
-from .theme_manager import ThemeManager
\ No newline at end of file
+from .theme_manager import ThemeManager
+from .task_manager import TaskManager
+from .output_cache import OutputCache
+from .profiler import Profiler, NodeProfile
+from .memory_budget import MemoryBudget, Budgeted
+from .write_manager import WriteManager
\ No newline at end of file
@@ -0,0 +1,212 @@
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass, replace
+from pathlib import Path
+from typing import Any
+import os
+import threading
+import uuid
+import weakref
+
+import numpy as np
+
+from Src.Managers.output_cache import OutputCache
+
+
+
+@dataclass
+class BudgetEntry:
+    """Результат узла, который учитывается в бюджете памяти."""
+    owner: weakref.ref
+    name: str
+    size: int
+
+
+
+
+class MemoryBudget:
+    """
+    Общий бюджет памяти для результатов узлов. Размер каждого результата учитывается при записи,
+    при превышении max_bytes давно не использованные результаты сбрасываются в .npy (spill) и заменяются
+    на np.memmap только для чтения: узлы-потомки читают их как обычные массивы, страницы подгружаются с диска
+    по мере чтения. Файлы сброса удаляются, когда memmap больше не используется.
+
+    Attributes:
+        max_bytes: int - бюджет памяти для результатов узлов
+        directory: Path - папка для файлов сброса
+    """
+    max_bytes: int = 2 * 2**30
+    directory: Path = Path("Spill")
+    _entries: OrderedDict[tuple[int, str], BudgetEntry] = OrderedDict()
+    _bytes: int = 0
+    _spilled: int = 0
+    _lock: threading.RLock = threading.RLock()
+
+
+    @classmethod
+    def set_max_bytes(cls, max_bytes: int) -> None:
+        """
+        Изменить бюджет, при уменьшении лишние результаты сразу сбрасываются на диск.
+        """
+        with cls._lock:
+            cls.max_bytes = max(int(max_bytes), 0)
+            cls.evict()
+
+
+    @classmethod
+    def track(cls, owner: object, name: str, value: Any) -> None:
+        """
+        Учесть новое значение поля name объекта owner и сбросить на диск лишнее.
+        """
+        key = (id(owner), name)
+        size = OutputCache.size(value) if value is not None else 0
+
+        with cls._lock:
+            if key in cls._entries:
+                cls._bytes -= cls._entries.pop(key).size
+
+            if size:
+                cls._entries[key] = BudgetEntry(weakref.ref(owner, lambda _: cls.forget(key)), name, size)
+                cls._bytes += size
+
+            cls.evict()
+
+
+    @classmethod
+    def touch(cls, owner: object, name: str) -> None:
+        """
+        Отметить использование результата, он последним попадёт под сброс.
+        """
+        key = (id(owner), name)
+        with cls._lock:
+            if key in cls._entries: cls._entries.move_to_end(key)
+
+
+    @classmethod
+    def forget(cls, key: tuple[int, str]) -> None:
+        with cls._lock:
+            if key in cls._entries:
+                cls._bytes -= cls._entries.pop(key).size
+
+
+    @classmethod
+    def evict(cls) -> None:
+        """
+        Сбрасывать на диск давно не использованные результаты, пока память не уложится в бюджет.
+        """
+        with cls._lock:
+            kept = []
+
+            while cls._bytes > cls.max_bytes and cls._entries:
+                key, entry = cls._entries.popitem(last=False)
+                cls._bytes -= entry.size
+
+                owner = entry.owner()
+                if owner is None: continue
+
+                value = owner.__dict__.get(entry.name)
+                spilled = cls.spill(value)
+                owner.__dict__[entry.name] = spilled
+                # Кэш результатов держит ту же ссылку как результат или вход узлов-потомков, без этого память не освободится
+                if spilled is not value: OutputCache.discard(value)
+
+                # Части результата, которые нельзя сбросить (объекты Python, модели), остаются в бюджете
+                size = OutputCache.size(spilled)
+                if size:
+                    kept.append((key, BudgetEntry(entry.owner, entry.name, size)))
+                    cls._bytes += size
+
+            for key, entry in reversed(kept):
+                cls._entries[key] = entry
+                cls._entries.move_to_end(key, last=False)
+
+
+    @classmethod
+    def spill(cls, value: Any) -> Any:
+        """
+        Сбросить массивы значения на диск и вернуть то же значение с np.memmap вместо массивов.
+        Поддерживаются массивы, dataclass, списки и кортежи, остальное возвращается без изменений.
+        """
+        if isinstance(value, np.memmap) or (isinstance(value, np.ndarray) and value.dtype.hasobject):
+            return value
+
+        if isinstance(value, np.ndarray):
+            cls.directory.mkdir(parents=True, exist_ok=True)
+            path = cls.directory / f"{os.getpid()}_{uuid.uuid4().hex}.npy"
+            np.save(path, value)
+            cls._spilled += value.nbytes
+
+            spilled = np.load(path, mmap_mode='r')
+            weakref.finalize(spilled, cls.remove, path)
+            return spilled
+
+        # Контейнер пересоздаётся, только если в нём действительно были массивы
+        if is_dataclass(value) and not isinstance(value, type):
+            changed = {field.name: cls.spill(getattr(value, field.name)) for field in fields(value) if field.init}
+            if all(changed[name] is getattr(value, name) for name in changed): return value
+            return replace(value, **changed)
+
+        if isinstance(value, list | tuple) and not hasattr(value, '_fields'):
+            items = [cls.spill(item) for item in value]
+            if all(new is old for new, old in zip(items, value)): return value
+            return type(value)(items)
+
+        return value
+
+
+    @staticmethod
+    def remove(path: Path) -> None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            # Windows не даёт удалить отображённый в память файл, он удалится при clear
+            pass
+
+
+    @classmethod
+    def memory(cls) -> int:
+        return cls._bytes
+
+
+    @classmethod
+    def spilled(cls) -> int:
+        """Сколько байт всего было сброшено на диск."""
+        return cls._spilled
+
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Забыть все результаты и удалить файлы сброса этого процесса.
+        """
+        with cls._lock:
+            cls._entries.clear()
+            cls._bytes = 0
+
+        if not cls.directory.exists(): return
+        for file in cls.directory.glob(f"{os.getpid()}_*.npy"):
+            cls.remove(file)
+
+
+
+
+class Budgeted:
+    """
+    Поле узла, значение которого учитывается в MemoryBudget. Чтение поля отмечает использование,
+    сброшенный на диск результат читается как np.memmap.
+    """
+    name: str
+
+
+    def __set_name__(self, owner, name):
+        self.name = f"_{name}"
+
+
+    def __get__(self, instance, owner: type = None) -> Any:
+        if instance is None: return self
+        MemoryBudget.touch(instance, self.name)
+        return instance.__dict__.get(self.name)
+
+
+    def __set__(self, instance, value) -> None:
+        instance.__dict__[self.name] = value
+        MemoryBudget.track(instance, self.name, value)
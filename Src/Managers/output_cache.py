@@ -0,0 +1,136 @@
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Callable, Hashable
+import sys
+import threading
+
+import numpy as np
+
+
+
+@dataclass
+class CachedOutput:
+    """Результат узла вместе со входами, на которые ссылается ключ. size учитывает и результат, и входы."""
+    output: object
+    inputs: tuple
+    size: int
+
+
+
+
+class OutputCache:
+    """
+    Кэш результатов чистых узлов (загрузка данных, преобразования, метрики) между компиляциями.
+    Ключ - название узла, введённые значения параметров и идентичность результатов узлов-предков.
+    Кэш держит ссылки на эти результаты, поэтому их id не могут достаться другим объектам, пока запись жива.
+    Удерживаемые входы учитываются в объёме записи. При превышении max_bytes вытесняются давно не использованные записи.
+    """
+    max_bytes: int = 2**30
+    _entries: OrderedDict[Hashable, CachedOutput] = OrderedDict()
+    _bytes: int = 0
+    _lock: threading.Lock = threading.Lock()
+
+
+    @staticmethod
+    def size(value) -> int:
+        """
+        Примерный объём памяти результата. Массивы, отображённые с диска (np.memmap), память не занимают.
+        """
+        if isinstance(value, np.memmap): return 0
+        if isinstance(value, np.ndarray): return value.nbytes
+        if is_dataclass(value): return sum(OutputCache.size(getattr(value, field.name)) for field in fields(value))
+        if isinstance(value, list | tuple): return sum(OutputCache.size(item) for item in value)
+        return sys.getsizeof(value)
+
+
+    @staticmethod
+    def held(output, inputs: tuple) -> int:
+        """
+        Объём памяти, который удерживает запись: результат и входы. Каждый объект считается один раз,
+        поэтому вход, который и есть результат (или его часть), не удваивает объём.
+        """
+        seen, size = set(), 0
+        for part in OutputCache.parts((output, inputs)):
+            if id(part) in seen or isinstance(part, list | tuple) or is_dataclass(part): continue
+            seen.add(id(part))
+            size += OutputCache.size(part)
+        return size
+
+
+    @staticmethod
+    def parts(value) -> list:
+        """
+        Объекты, из которых состоит значение: само значение и, для dataclass, списков и кортежей, их элементы.
+        """
+        found = [value]
+        if is_dataclass(value) and not isinstance(value, type):
+            for field in fields(value): found += OutputCache.parts(getattr(value, field.name))
+        elif isinstance(value, list | tuple):
+            for item in value: found += OutputCache.parts(item)
+        return found
+
+
+    @classmethod
+    def get(cls, key: Hashable, compute: Callable[[], object], inputs: tuple = ()) -> object:
+        """
+        Вернуть результат из кэша или вычислить его и сохранить.
+
+        Args:
+            key: Hashable - ключ результата
+            compute: Callable[[], object] - вычисление результата при промахе
+            inputs: tuple - объекты, идентичность которых входит в ключ
+        """
+        with cls._lock:
+            if key in cls._entries:
+                cls._entries.move_to_end(key)
+                return cls._entries[key].output
+
+        output = compute()
+        entry = CachedOutput(output, inputs, cls.held(output, inputs))
+
+        # Результат больше всего кэша не сохраняем, чтобы он не вытеснил всё остальное
+        if entry.size > cls.max_bytes: return output
+
+        with cls._lock:
+            if key in cls._entries:
+                cls._bytes -= cls._entries.pop(key).size
+            cls._entries[key] = entry
+            cls._bytes += entry.size
+
+            while cls._bytes > cls.max_bytes:
+                _, evicted = cls._entries.popitem(last=False)
+                cls._bytes -= evicted.size
+
+        return output
+
+
+    @classmethod
+    def discard(cls, output: object) -> None:
+        """
+        Удалить записи, которые ссылаются на объект output или его части: записи с этим результатом
+        и записи узлов-потомков, у которых он среди входов.
+        """
+        # Из частей учитываются только массивы: небольшие числа и строки - общие объекты Python
+        ids = {id(output)} | {id(part) for part in cls.parts(output) if isinstance(part, np.ndarray)}
+
+        with cls._lock:
+            for key in [key for key, entry in cls._entries.items()
+                        if any(id(part) in ids for part in cls.parts((entry.output, entry.inputs)))]:
+                cls._bytes -= cls._entries.pop(key).size
+
+
+    @classmethod
+    def memory(cls) -> int:
+        return cls._bytes
+
+
+    @classmethod
+    def count(cls) -> int:
+        return len(cls._entries)
+
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+            cls._bytes = 0
@@ -0,0 +1,123 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Hashable, Iterator
+import json
+import os
+import threading
+import time
+
+from Src.Utils import peak_rss
+
+
+
+@dataclass
+class NodeProfile:
+    """
+    Замер выполнения логики узла.
+
+    Attributes:
+        node: Hashable - идентификатор узла
+        label: str - название узла
+        start: float - начало выполнения, time.perf_counter
+        wall: float - время выполнения в секундах
+        cpu: float - процессорное время потока, в котором выполнялся узел, в секундах
+        rss: int - прирост пикового объёма памяти процесса в байтах
+        thread: int - идентификатор потока
+        rows: int - количество обработанных строк, если узел его сообщает
+    """
+    node: Hashable
+    label: str
+    start: float
+    wall: float = 0.0
+    cpu: float = 0.0
+    rss: int = 0
+    thread: int = 0
+    rows: int = 0
+
+
+    def badge(self) -> str:
+        badge = f"{self.wall:.3f} с | CPU {self.cpu:.3f} с | RSS +{self.rss / 2**20:.0f} МБ"
+        if self.rows and self.wall: badge += f" | {self.rows / self.wall:.0f} строк/с"
+        return badge
+
+
+
+
+class Profiler:
+    """
+    Замеры выполнения узлов последней сборки графа и их экспорт в формат Chrome trace events
+    (открывается в chrome://tracing и ui.perfetto.dev).
+    Пиковый объём памяти общий для процесса, поэтому при параллельном выполнении веток
+    прирост памяти относится к узлу, во время которого достигнут новый пик.
+    """
+    enabled: bool = True
+    _records: list[NodeProfile] = []
+    _lock: threading.Lock = threading.Lock()
+
+
+    @classmethod
+    @contextmanager
+    def measure(cls, node: Hashable, label: str = None) -> Iterator[NodeProfile | None]:
+        """
+        Замерить выполнение блока кода как выполнение узла node. Безопасно вызывать из рабочих потоков.
+        """
+        if not cls.enabled:
+            yield None
+            return
+
+        record = NodeProfile(node, label or str(node), time.perf_counter(), thread=threading.get_ident())
+        cpu = time.thread_time()
+        rss = peak_rss()
+
+        try:
+            yield record
+        finally:
+            record.wall = time.perf_counter() - record.start
+            record.cpu = time.thread_time() - cpu
+            record.rss = max(peak_rss() - rss, 0)
+            with cls._lock:
+                cls._records.append(record)
+
+
+    @classmethod
+    def records(cls) -> list[NodeProfile]:
+        with cls._lock:
+            return list(cls._records)
+
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._records.clear()
+
+
+    @classmethod
+    def trace(cls) -> dict:
+        """
+        Замеры в формате Chrome trace events: по событию "X" на узел, время в микросекундах от начала сборки.
+        """
+        records = cls.records()
+        if not records: return {"traceEvents": [], "displayTimeUnit": "ms"}
+
+        origin = min(record.start for record in records)
+        pid = os.getpid()
+        threads = {thread: index for index, thread in enumerate(dict.fromkeys(record.thread for record in records))}
+
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": index,
+                   "args": {"name": "main" if thread == threading.main_thread().ident else f"worker {index}"}}
+                  for thread, index in threads.items()]
+
+        events += [{"name": record.label, "cat": "node", "ph": "X", "pid": pid, "tid": threads[record.thread],
+                    "ts": (record.start - origin) * 1e6, "dur": record.wall * 1e6,
+                    "args": {"node": str(record.node), "cpu_ms": record.cpu * 1e3, "rss_delta_mb": record.rss / 2**20,
+                             "rows": record.rows}}
+                   for record in records]
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+    @classmethod
+    def export_trace(cls, path: str | Path) -> None:
+        with Path(path).open('w', encoding='utf-8') as file:
+            json.dump(cls.trace(), file, ensure_ascii=False)
@@ -0,0 +1,169 @@
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass
+from typing import Callable
+import itertools
+import os
+import threading
+import queue
+import time
+
+
+
+@dataclass
+class PeriodicTask:
+    """Вызов в основном потоке, который повторяется не чаще, чем раз в interval секунд."""
+    callback: Callable
+    interval: float
+    last_call: float = 0.0
+
+
+
+
+class TaskManager:
+    """
+    Менеджер фоновых задач.
+    Тяжёлая логика выполняется в пуле рабочих потоков, а всё, что изменяет интерфейс,
+    передаётся в основной поток через очередь, которая разбирается каждый кадр.
+    """
+    max_workers: int = min(4, os.cpu_count() or 1)
+    _executor: ThreadPoolExecutor = None
+    _ui_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _cancel_event: threading.Event = threading.Event()
+    _periodic: dict[int, PeriodicTask] = {}
+    _periodic_ids = itertools.count()
+
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        """
+        Возвращает пул рабочих потоков, создаёт его при первом обращении.
+        """
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=cls.max_workers, thread_name_prefix="graphnet")
+        return cls._executor
+
+
+    @classmethod
+    def set_max_workers(cls, max_workers: int) -> None:
+        """
+        Изменить размер пула. Уже запущенные задачи дорабатывают в старом пуле, новые попадают в новый.
+        """
+        max_workers = max(int(max_workers), 1)
+        if max_workers == cls.max_workers: return
+
+        cls.max_workers = max_workers
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False)
+            cls._executor = None
+
+
+    @classmethod
+    def submit(cls, func: Callable, *args, callback: Callable[[Future], None] = None, **kwargs) -> Future:
+        """
+        Выполнить функцию в рабочем потоке.
+
+        Args:
+            func: Callable - функция для выполнения
+            callback: Callable[[Future], None] - вызывается в основном потоке по завершении функции
+            *args, **kwargs - аргументы функции
+        """
+        future = cls.executor().submit(func, *args, **kwargs)
+        if callback:
+            future.add_done_callback(lambda done: cls.call_in_ui(callback, done))
+        return future
+
+
+    @classmethod
+    def call_in_ui(cls, func: Callable, *args, **kwargs) -> None:
+        """
+        Поставить вызов в очередь основного потока. Безопасно вызывать из любого потока.
+        """
+        cls._ui_queue.put((func, args, kwargs))
+
+
+    @classmethod
+    def process_ui_queue(cls, block: bool = False, timeout: float = 0.1) -> int:
+        """
+        Выполнить накопившиеся вызовы основного потока и периодические задачи, время которых подошло.
+        Вызывается каждый кадр.
+
+        Args:
+            block: bool - ждать появления хотя бы одного вызова
+            timeout: float - максимальное время ожидания в секундах
+
+        Returns:
+            int - количество выполненных вызовов
+        """
+        processed = 0
+        try:
+            if block:
+                func, args, kwargs = cls._ui_queue.get(timeout=timeout)
+                func(*args, **kwargs)
+                processed += 1
+
+            while True:
+                func, args, kwargs = cls._ui_queue.get_nowait()
+                func(*args, **kwargs)
+                processed += 1
+
+        except queue.Empty:
+            pass
+
+        now = time.monotonic()
+        for task in list(cls._periodic.values()):
+            if now - task.last_call >= task.interval:
+                task.last_call = now
+                task.callback()
+
+        return processed
+
+
+    @classmethod
+    def add_periodic(cls, callback: Callable, interval: float) -> int:
+        """
+        Регистрирует вызов в основном потоке с ограниченной частотой, например для перерисовки графиков.
+
+        Args:
+            callback: Callable - функция без аргументов
+            interval: float - минимальный интервал между вызовами в секундах
+
+        Returns:
+            int - идентификатор задачи для remove_periodic
+        """
+        task_id = next(cls._periodic_ids)
+        cls._periodic[task_id] = PeriodicTask(callback, interval)
+        return task_id
+
+
+    @classmethod
+    def remove_periodic(cls, task_id: int) -> None:
+        cls._periodic.pop(task_id, None)
+
+
+    @classmethod
+    def cancel(cls) -> None:
+        """
+        Запросить отмену выполняющихся задач. Задачи сами проверяют флаг между шагами.
+        """
+        cls._cancel_event.set()
+
+
+    @classmethod
+    def cancelled(cls) -> bool:
+        return cls._cancel_event.is_set()
+
+
+    @classmethod
+    def reset_cancel(cls) -> None:
+        cls._cancel_event.clear()
+
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Отменить задачи и остановить пул потоков.
+        """
+        cls.cancel()
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True, cancel_futures=True)
+            cls._executor = None
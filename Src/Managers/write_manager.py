@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from typing import Callable
+import threading
+
+
+
+class WriteManager:
+    """
+    Фоновая запись файлов. Запись выполняется в отдельном потоке, поэтому сборка графа не ждёт диск.
+    Поток один: записи выполняются в порядке постановки, и дозапись в один файл не перемешивается.
+    """
+    _executor: ThreadPoolExecutor = None
+    _pending: set[Future] = set()
+    _lock: threading.Lock = threading.Lock()
+
+
+    @classmethod
+    def submit(cls, func: Callable, *args, **kwargs) -> Future:
+        """
+        Поставить запись в очередь потока записи.
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graphnet-write")
+            future = cls._executor.submit(func, *args, **kwargs)
+            cls._pending.add(future)
+
+        future.add_done_callback(cls._done)
+        return future
+
+
+    @classmethod
+    def _done(cls, future: Future) -> None:
+        with cls._lock:
+            cls._pending.discard(future)
+
+
+    @classmethod
+    def pending(cls) -> int:
+        with cls._lock:
+            return len(cls._pending)
+
+
+    @classmethod
+    def wait(cls, timeout: float = None) -> bool:
+        """
+        Дождаться окончания всех поставленных записей.
+
+        Returns:
+            bool - все записи завершились за timeout.
+        """
+        with cls._lock:
+            pending = set(cls._pending)
+        return not wait(pending, timeout).not_done
@@ -1,4 +1,4 @@
-from Src.Nodes.abstract_node import AbstractNode, node_link
+from Src.Nodes.abstract_node import AbstractNode, NodeTask, node_link
 from Src.Nodes.layer_node import LayerNode, LayerResult
 from Src.Nodes.input_layer_node import InputLayerNode
 from Src.Nodes.data_node import DataNode
@@ -8,6 +8,8 @@ from Src.Nodes.shape_node import ShapeNode
 from Src.Nodes.compile_node import CompileNode
 from Src.Nodes.utils_node import UtilsNode
 from Src.Nodes.metric_node import MetricNode
+from Src.Nodes.evaluate_node import EvaluateNode
 from Src.Nodes.fit_node import FitNode
 from Src.Nodes.predict_node import PredictNode
 from Src.Nodes.dataset_node import DatasetNode
+from Src.Nodes.split_node import SplitNode, SplitIndex
\ No newline at end of file
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from abc import ABC
 from typing import Callable
+from itertools import chain
 import inspect
 import traceback
 
@@ -8,9 +9,10 @@ import dearpygui.dearpygui as dpg
 
 from Src.Logging import logging, Logger
 from Src.Config.parameter import Parameter, AttrType
+from Src.Config.Annotations import ANode
 from Src.Enums import Themes
-from Src.Managers import ThemeManager
-from Src.Exceptions import NetworkException
+from Src.Managers import ThemeManager, TaskManager, OutputCache, Profiler, NodeProfile, Budgeted
+from Src.Exceptions import NetworkException, CancelledException
 
 
 
@@ -23,23 +25,41 @@ class AbstractNode(ABC):
         node_tag: str | int - индетификатор ноды (dpg.node)
         incoming: list[Node] - связи с нодами, которые подключенны к этой ноде. (Приходящие)
         outgoing: list[Node] - связи с нодами, к которым подключенна эта нода. (Уходящие)
+        dirty: bool - узел изменён и должен быть скомпилирован заново.
+        version: int - номер результата узла, увеличивается при каждом новом OUTPUT.
+        background: bool - выполнять логику узла в пуле рабочих потоков, не блокируя интерфейс.
+            Независимые фоновые узлы графа выполняются одновременно, изменения интерфейса - только в основном потоке.
+        label: str - название узла в списке узлов.
+        memoize: bool - запоминать результат в OutputCache, подходит только для чистых узлов.
+        profile: NodeProfile - замер последнего выполнения логики узла.
+        OUTPUT - результат узла, учитывается в MemoryBudget и может быть сброшен на диск (np.memmap).
     '''
     __error_message: str = None
     _error_id: int | str = None
+    _busy_id: int | str = None
+    _profile_id: int | str = None
+    _signature: int = None
 
     node_tag: str | int
     # Устанавливаем связи не между узлами, а между их аттрибутами
     incoming: dict[str | int, list[str | int]]
     outgoing: dict[str | int, list[str | int]]
     annotations: dict[str, Parameter]
+    dirty: bool
+    version: int
     logic: Callable
     docs: str
     logger: Logger
     theme_name: Themes = Themes.ABSTRACT
+    background: bool = False
+    label: str
+    memoize: bool
+    profile: NodeProfile = None
+    OUTPUT = Budgeted()
 
 
     def __init__(self, node_tag: int | str, annotations: dict[str: type], \
-                 logic: Callable, docs: str = None):
+                 logic: Callable, docs: str = None, label: str = None, memoize: bool = False):
         '''
         Нода (узел графа), класс который используется для сохранения связей в графе, а также информации о ноде. 
 
@@ -48,13 +68,19 @@ class AbstractNode(ABC):
             annotations: dict[str, type] - аннотации на аргументы, которые нужно вводить, для создания слоя.
             docs: str - документация к слою
             node_tag: str | int = None - индетификатор ноды (dpg.node)
+            label: str - название узла в списке узлов
+            memoize: bool - запоминать результат логики между компиляциями
         '''
         self.node_tag = node_tag
+        self.label = label
+        self.memoize = memoize
         self.annotations = annotations
         self.logic = logic
         self.incoming = {}
         self.outgoing = {}
         self.OUTPUT = None
+        self.dirty = True
+        self.version = 0
 
         if not docs: docs = inspect.getdoc(self.logic)
         self.docs = docs
@@ -74,15 +100,41 @@ class AbstractNode(ABC):
         return self.node_tag
 
 
-    def compile(self, kwargs: dict = None) -> bool:
+    def predecessors(self) -> set["AbstractNode"]:
         '''
-        Основной метод нодов, содержащий логику их работы. Тут создаются слои нейронной сети, проходит обучение и т.д. В зависимости от ноды, будет разная логика.
+        Узлы, которые подключены к входам этого узла.
         '''
-        if not kwargs: kwargs = {}
-        args = []
-        arguments = dpg.get_item_children(self.node_tag, slot=1)
+        return {dpg.get_item_user_data(dpg.get_item_parent(attr)) for attr in chain(*self.incoming.values())}
 
-        self.logger.info(f"Компиляция ноды - {self.__class__.__name__}")
+
+    def attribute(self, label: str) -> int | str | None:
+        '''
+        Атрибут узла (dpg.node_attribute) по названию параметра.
+        '''
+        for attribute in dpg.get_item_children(self.node_tag, slot=1):
+            if dpg.get_item_label(attribute) == label: return attribute
+        return None
+
+
+    def invalidate(self):
+        '''
+        Пометить узел как изменённый, при следующей компиляции он будет выполнен заново.
+        '''
+        self.dirty = True
+
+
+    def collect_values(self, links: bool = True) -> dict[str, object]:
+        '''
+        Прочитать значения входных параметров узла из редактора.
+
+        Args:
+            links: bool - читать входы-связи (результаты узлов-предков), иначе только введённые значения.
+
+        Returns:
+            dict[str, object] - значения параметров по их названиям.
+        '''
+        values = {}
+        arguments = dpg.get_item_children(self.node_tag, slot=1)
         self.logger.debug(f"Аргументы ноды - {arguments}")
 
         for argument in arguments:
@@ -92,20 +144,140 @@ class AbstractNode(ABC):
             self.annotations[name].attr_type != AttrType.INPUT:
                 continue
 
-            if name == 'INPUT':
-                args = self.annotations[name].get_value(argument)
-                if not isinstance(args, list): args = [args]
+            hint = self.annotations[name].hint
+            if not links and (isinstance(hint, ANode) or hint is ANode):
                 continue
 
             self.logger.debug(f"Аннотация - {self.annotations[name]}")
+            values[name] = self.annotations[name].get_value(argument)
 
-            kwargs[name] = self.annotations[name].get_value(argument)
+        return values
 
-            self.logger.debug(kwargs)
-            self.logger.debug(args)
 
-        try: 
-            self.OUTPUT = self.logic(*args, **kwargs)
+    def signature(self, values: dict[str, object]) -> int:
+        '''
+        Хэш входов узла. Результаты узлов-предков не хэшируются, вместо них учитываются их версии.
+
+        Args:
+            values: dict[str, object] - значения параметров узла.
+        '''
+        parameters = tuple((name, repr(value)) for name, value in values.items()
+                           if not isinstance(self.annotations[name].hint, ANode) and self.annotations[name].hint is not ANode)
+        upstream = tuple(sorted((node.node_tag, node.version) for node in self.predecessors()))
+        return hash((parameters, upstream))
+
+
+    def prepare(self, kwargs: dict = None) -> "NodeTask | None":
+        '''
+        Подготовить вызов логики узла: прочитать параметры из редактора и сравнить их с прошлой компиляцией.
+        Выполняется в основном потоке.
+
+        Returns:
+            NodeTask | None - подготовленный вызов, или None, если узел не изменился и прошлый OUTPUT актуален.
+        '''
+        self.logger.info(f"Компиляция ноды - {self.__class__.__name__}")
+
+        values = self.collect_values()
+        signature = self.signature(values)
+
+        if not self.dirty and signature == self._signature:
+            self.logger.info(f"Нода {self} не изменилась, используется прошлый результат")
+            return None
+
+        task = self.make_task(values, signature, kwargs)
+
+        if 'progress' in inspect.signature(self.logic).parameters:
+            task.kwargs['progress'] = self.report_progress
+
+        return task
+
+
+    def make_task(self, values: dict[str, object], signature: int = None, kwargs: dict = None) -> "NodeTask":
+        '''
+        Собрать вызов логики узла из значений параметров. Не обращается к DearPyGui.
+
+        Args:
+            values: dict[str, object] - значения параметров, INPUT передаётся позиционными аргументами.
+            signature: int - хэш входов узла.
+            kwargs: dict - дополнительные именованные аргументы логики.
+        '''
+        if not kwargs: kwargs = {}
+        args = []
+
+        for name, value in values.items():
+            if name == 'INPUT':
+                args = value if isinstance(value, list) else [value]
+                continue
+
+            kwargs[name] = value
+
+        self.logger.debug(kwargs)
+        self.logger.debug(args)
+
+        return NodeTask(args, kwargs, signature)
+
+
+    def execute(self, task: "NodeTask"):
+        '''
+        Выполнить логику узла. Не обращается к DearPyGui, поэтому может выполняться в рабочем потоке.
+        Время, процессорное время и прирост памяти записываются в Profiler и в profile.
+        '''
+        with Profiler.measure(self.node_tag, self.label) as self.profile:
+            if not self.memoize:
+                return self.logic(*task.args, **task.kwargs)
+
+            key, inputs = self.memo_key(task)
+            return OutputCache.get(key, lambda: self.logic(*task.args, **task.kwargs), inputs)
+
+
+    def memo_key(self, task: "NodeTask") -> tuple[tuple, tuple]:
+        '''
+        Ключ результата для OutputCache: название и логика узла, введённые значения
+        и идентичность результатов узлов-предков. Служебные аргументы (progress, callbacks) не учитываются.
+
+        Returns:
+            tuple[tuple, tuple] - ключ и объекты, на идентичность которых он ссылается.
+        '''
+        inputs = [task.args]
+        params = []
+
+        for name, value in sorted(task.kwargs.items()):
+            if name not in self.annotations: continue
+
+            hint = self.annotations[name].hint
+            if isinstance(hint, ANode) or hint is ANode:
+                inputs.append(value)
+                params.append((name, self.identity(value)))
+            else:
+                params.append((name, repr(value)))
+
+        return (self.label, self.logic, tuple(params), self.identity(task.args)), tuple(inputs)
+
+
+    @staticmethod
+    def identity(value) -> int | tuple:
+        if isinstance(value, list | tuple): return tuple(id(item) for item in value)
+        return id(value)
+
+
+    def commit(self, output):
+        '''
+        Сохранить результат логики в узел. Выполняется в основном потоке,
+        наследники дополняют его заполнением своих полей вывода.
+        '''
+        self.OUTPUT = output
+
+
+    def finish(self, task: "NodeTask", output = None, error: Exception = None) -> bool:
+        '''
+        Завершить компиляцию узла результатом или ошибкой логики. Выполняется в основном потоке.
+
+        Returns:
+            bool - успешно ли скомпилирован узел.
+        '''
+        try:
+            if error: raise error
+            self.commit(output)
             self.default_theme()
 
         except AttributeError as ex:
@@ -115,12 +287,44 @@ class AbstractNode(ABC):
         except NetworkException as ex:
             self.raise_error(ex, "Сетевая ошибка")
             return False
+
+        except CancelledException as ex:
+            self.raise_error(ex, "Выполнение отменено")
+            return False
         
         except Exception as ex:
             self.raise_error(ex)
             return False
-            
+
+        self._signature = task.signature
+        self.dirty = False
+        self.version += 1
+        self.show_profile()
+
         return True
+
+
+    def compile(self, kwargs: dict = None) -> bool:
+        '''
+        Основной метод нодов, содержащий логику их работы. Тут создаются слои нейронной сети, проходит обучение и т.д. В зависимости от ноды, будет разная логика.
+        Если ни узел, ни его предки не изменились с прошлой компиляции, то остаётся прошлый OUTPUT.
+        '''
+        task = self.prepare(kwargs)
+        if task is None: return True
+
+        return self.run(task)
+
+
+    def run(self, task: "NodeTask") -> bool:
+        '''
+        Выполнить подготовленный вызов в текущем потоке и завершить компиляцию узла.
+        '''
+        try: 
+            output = self.execute(task)
+        except Exception as ex:
+            return self.finish(task, error=ex)
+
+        return self.finish(task, output)
     
 
     def raise_error(self, error_message: str, error_message_type: str = "Неизвестная ошибка"):
@@ -132,13 +336,67 @@ class AbstractNode(ABC):
             
         with dpg.tooltip(parent=self._error_id):
             dpg.add_text(f"{error_message_type}:")
-            dpg.add_text(error_message)
+            dpg.add_text(str(error_message))
 
         self.logger.warning(f"Поймана ошибка ({error_message_type}): {error_message}")
-        self.logger.info(traceback.format_exc())
+        if isinstance(error_message, BaseException):
+            self.logger.info("".join(traceback.format_exception(error_message)))
+
+
+    def set_busy(self, busy: bool):
+        '''
+        Показать или спрятать индикатор выполнения узла в фоне.
+        '''
+        if busy and not (self._busy_id and dpg.does_item_exist(self._busy_id)):
+            self._busy_id = dpg.generate_uuid()
+            with dpg.node_attribute(parent=self.node_tag, attribute_type=dpg.mvNode_Attr_Static):
+                dpg.add_loading_indicator(tag=self._busy_id, radius=1.5)
+
+        if not busy and self._busy_id and dpg.does_item_exist(self._busy_id):
+            dpg.delete_item(dpg.get_item_parent(self._busy_id))
+            self._busy_id = None
+
+
+    def show_worker_result(self, outputs: dict[str, object], fetch: Callable[[str], object]):
+        '''
+        Показать результат сборки в процессе CompileWorker. Массивы выходов остаются в процессе сборки,
+        узел запрашивает через fetch(название выхода) только те, которые показывает. Выполняется в основном потоке.
+        '''
+
+
+    def report_progress(self, fraction: float):
+        '''
+        Сообщить долю выполненной работы. Безопасно вызывать из рабочего потока.
+        '''
+        TaskManager.call_in_ui(self.show_progress, fraction)
+
+
+    def show_progress(self, fraction: float):
+        '''
+        Показать прогресс под индикатором выполнения узла. Выполняется в основном потоке.
+        '''
+        if not (self._busy_id and dpg.does_item_exist(self._busy_id)): return
+
+        bar = f"{self._busy_id}_progress"
+        if not dpg.does_item_exist(bar):
+            dpg.add_progress_bar(tag=bar, parent=dpg.get_item_parent(self._busy_id), width=150)
+        dpg.set_value(bar, fraction)
+        dpg.configure_item(bar, overlay=f"{fraction:.0%}")
+
+
+    def show_profile(self):
+        '''
+        Показать на узле замер последнего выполнения: время, процессорное время и прирост памяти.
+        '''
+        if self.profile is None: return
+
+        if not (self._profile_id and dpg.does_item_exist(self._profile_id)):
+            self._profile_id = dpg.generate_uuid()
+            with dpg.node_attribute(parent=self.node_tag, attribute_type=dpg.mvNode_Attr_Static):
+                dpg.add_text(tag=self._profile_id)
+
+        dpg.set_value(self._profile_id, self.profile.badge())
 
-        if dpg.does_item_exist("fit_window"):
-                dpg.delete_item("fit_window")
 
     def default_theme(self):
         ThemeManager.apply_theme(self.node_tag,self.theme_name)
@@ -148,6 +406,16 @@ class AbstractNode(ABC):
         self.__error_message = None
 
 
+@dataclass
+class NodeTask:
+    '''
+    Подготовленный вызов логики узла.
+    '''
+    args: list
+    kwargs: dict
+    signature: int
+
+
 @dataclass
 class node_link:
     '''
@@ -1,17 +1,22 @@
-import keras
+from typing import TYPE_CHECKING
 
 from Src.Enums import Themes
 from Src.Nodes import AbstractNode, LayerResult
 
+if TYPE_CHECKING:
+    import keras
+
 
 
 class CompileNode(AbstractNode):
-    logic: keras.models.Model.compile
+    logic: "keras.models.Model.compile"
     theme_name: Themes = Themes.COMPILE
 
     # TODO: Настроить правильные аннотации от logic
     @staticmethod
     def compile_model(*args: LayerResult, **kwargs):
+        import keras
+
         inputs = tuple(set().union(*[arg.inputs for arg in args]))
         outputs = tuple(arg.layer for arg in args)
         if len(inputs) == 1: inputs = inputs[0]
@@ -4,4 +4,9 @@ from Src.Nodes import AbstractNode
 
 
 class DataNode(AbstractNode):
-    theme_name: Themes = Themes.DATA
\ No newline at end of file
+    '''
+    Узел, который работает с данными. Логика таких узлов выполняется в пуле потоков,
+    поэтому независимые ветки графа (загрузка, предсказания, метрики) выполняются параллельно.
+    '''
+    theme_name: Themes = Themes.DATA
+    background: bool = True
\ No newline at end of file
@@ -0,0 +1,72 @@
+from itertools import zip_longest
+
+import numpy as np
+import tensorflow as tf
+
+from Src.Utils import TableStream, ArrayValidator, iterate_batches
+
+
+
+def make_dataset(x: np.ndarray | TableStream, y: np.ndarray | TableStream = None, batch_size: int = 32,
+                 shuffle_buffer: int = 0, cache: bool = False) -> tf.data.Dataset:
+    '''
+    Собрать входной конвейер tf.data из массивов (в том числе np.memmap) или потоков TableStream.
+    Данные читаются последовательными батчами по batch_size строк, поэтому целиком в память
+    не копируются. Порядок этапов: чтение -> cache -> shuffle -> batch -> prefetch(AUTOTUNE),
+    так чтение следующих батчей идёт параллельно с обучением на текущем.
+
+    Args:
+        x: np.ndarray | TableStream - входные данные
+        y: np.ndarray | TableStream - ответы, None - только входные данные (для предсказания)
+        batch_size: int - размер батча
+        shuffle_buffer: int - размер буфера перемешивания в строках, 0 - без перемешивания
+        cache: bool - хранить прочитанные данные в памяти после первой эпохи
+    '''
+    if batch_size <= 0:
+        raise AttributeError("Размер батча должен быть больше нуля!")
+    if shuffle_buffer < 0:
+        raise AttributeError("Размер буфера перемешивания не может быть отрицательным!")
+
+    sources = (x,) if y is None else (x, y)
+    signature = tuple(tf.TensorSpec((None, *data.shape[1:]), tf.as_dtype(data.dtype)) for data in sources)
+    streaming = any(isinstance(data, TableStream) for data in sources)
+
+    if streaming:
+        # Длина потока неизвестна, поэтому батчи берутся из генератора, который заново читает файлы каждую эпоху
+        def generate():
+            # zip остановился бы на более коротком источнике и молча обучил бы на части данных
+            missing = object()
+            for batches in zip_longest(*(iterate_batches(data, batch_size) for data in sources), fillvalue=missing):
+                if any(batch is missing for batch in batches) or len({len(batch) for batch in batches}) != 1:
+                    raise AttributeError('Размерности X и Y не совпадают!')
+                # Поток нельзя проверить заранее, поэтому пропуски ищутся в каждом прочитанном батче
+                if any(ArrayValidator.scan(batch) for batch in batches if np.issubdtype(batch.dtype, np.inexact)):
+                    raise AttributeError('Данные содержат пропущенные значения!')
+                yield batches
+
+        dataset = tf.data.Dataset.from_generator(generate, output_signature=signature)
+
+    else:
+        def read(start):
+            return tuple(np.asarray(data[start:start + batch_size]) for data in sources)
+
+        def read_batch(start):
+            batches = tf.numpy_function(read, [start], tuple(spec.dtype for spec in signature))
+            return tuple(tf.ensure_shape(batch, spec.shape) for batch, spec in zip(batches, signature))
+
+        dataset = tf.data.Dataset.range(0, len(x), batch_size)
+        dataset = dataset.map(read_batch, num_parallel_calls=tf.data.AUTOTUNE, deterministic=True)
+
+    if y is None:
+        dataset = dataset.map(lambda x_batch: x_batch)
+
+    if cache:
+        dataset = dataset.cache()
+
+    if shuffle_buffer:
+        dataset = dataset.unbatch().shuffle(shuffle_buffer, reshuffle_each_iteration=True).batch(batch_size)
+        # После unbatch tf.data не знает количество батчей, а keras опирается на него при подсчёте шагов эпохи
+        if not streaming:
+            dataset = dataset.apply(tf.data.experimental.assert_cardinality(-(-len(x) // batch_size)))
+
+    return dataset.prefetch(tf.data.AUTOTUNE)
@@ -0,0 +1,119 @@
+from typing import TYPE_CHECKING
+
+import dearpygui.dearpygui as dpg
+
+from Src.Enums import Themes
+from Src.Nodes import DataNode
+from Src.Utils import TableStream, iterate_batches
+
+if TYPE_CHECKING:
+    import keras
+
+
+
+class EvaluateNode(DataNode):
+    '''
+    Узел для вычисления нескольких метрик за один проход по данным
+    '''
+    theme_name: Themes = Themes.METRIC
+    OUTPUT: dict[str, float]
+    _table_id: int | str = None
+
+
+    def finish(self, task, output = None, error: Exception = None) -> bool:
+        compiled = super().finish(task, output, error)
+        if compiled: self.show_results()
+        return compiled
+
+
+    def show_results(self):
+        '''
+        Показать на узле таблицу значений метрик. Выполняется в основном потоке.
+        '''
+        if not (self._table_id and dpg.does_item_exist(self._table_id)):
+            self._table_id = dpg.generate_uuid()
+            with dpg.node_attribute(parent=self.node_tag, attribute_type=dpg.mvNode_Attr_Static):
+                dpg.add_text(tag=self._table_id)
+
+        width = max(len(name) for name in self.OUTPUT) if self.OUTPUT else 0
+        dpg.set_value(self._table_id, "\n".join(f"{name:<{width}}  {value:.6g}" for name, value in self.OUTPUT.items()))
+
+
+    @staticmethod
+    def evaluate(y_true=None, y_pred=None, metrics: list[str] = None, batch_size: int = 4096,
+                 model: "keras.Model" = None, x=None) -> dict[str, float]:
+        '''
+        Вычисляет выбранные метрики Keras за один проход: y_true и y_pred читаются батчами,
+        и каждый батч обновляет состояния всех метрик. Если подана модель, она оценивается через
+        model.evaluate на x и y_true: считаются функция потерь модели и выбранные метрики
+        (без выбранных - метрики, с которыми модель скомпилирована).
+
+        Args:
+            y_true: Истинные метки/значения.
+            y_pred: Предсказанные метки/значения, не нужны при оценке модели.
+            metrics: Названия метрик (например, ['accuracy', 'auc']).
+            batch_size: Количество строк в батче.
+            model: Скомпилированная модель для model.evaluate.
+            x: Входные данные модели.
+        '''
+        from Src.Nodes.keras_callbacks import CancelCallback
+
+        # Несвязанный вход узла приходит пустым списком
+        y_true, y_pred, model, x = (None if isinstance(value, list) and not value else value
+                                    for value in (y_true, y_pred, model, x))
+        metrics = list(metrics or [])
+
+        if y_true is None:
+            raise AttributeError("Не поданы истинные значения y_true!")
+
+        if model is not None:
+            return EvaluateNode.evaluate_model(model, x, y_true, metrics, batch_size)
+
+        if y_pred is None or not metrics:
+            raise AttributeError("Для вычисления метрик нужны y_pred и хотя бы одна метрика!")
+
+        if not isinstance(y_true, TableStream) and not isinstance(y_pred, TableStream) and len(y_true) != len(y_pred):
+            raise AttributeError(f"Количество строк y_true ({len(y_true)}) и y_pred ({len(y_pred)}) не совпадает!")
+
+        import keras.metrics
+
+        states: dict[str, keras.metrics.Metric] = {name: keras.metrics.get(name) for name in metrics}
+
+        for true, pred in zip(iterate_batches(y_true, batch_size), iterate_batches(y_pred, batch_size)):
+            CancelCallback.check()
+            for state in states.values():
+                state.update_state(true, pred)
+
+        return {name: float(state.result()) for name, state in states.items()}
+
+
+    @staticmethod
+    def evaluate_model(model: "keras.Model", x, y, metrics: list[str], batch_size: int) -> dict[str, float]:
+        '''
+        Оценить модель через model.evaluate. Выбранные метрики считаются в том же проходе: модель
+        оборачивается в новую модель с общими слоями и весами, которая компилируется с функцией потерь
+        исходной модели и этими метриками. Исходная модель не перекомпилируется.
+        '''
+        import keras
+        from Src.Nodes.keras_callbacks import CancelCallback
+        from Src.Nodes.data_pipeline import make_dataset
+
+        if x is None:
+            raise AttributeError("Для оценки модели нужны входные данные x!")
+        if not model.compiled:
+            raise AttributeError("Модель не скомпилирована!")
+
+        if metrics:
+            evaluated = keras.Model(model.inputs, model.outputs)
+            evaluated.compile(loss=model.loss, metrics=metrics)
+        else:
+            evaluated = model
+
+        if isinstance(x, TableStream) or isinstance(y, TableStream):
+            results = evaluated.evaluate(make_dataset(x, y, batch_size=batch_size), return_dict=True,
+                                         verbose=False, callbacks=[CancelCallback()])
+        else:
+            results = evaluated.evaluate(x, y, batch_size=batch_size, return_dict=True,
+                                         verbose=False, callbacks=[CancelCallback()])
+
+        return {name: float(value) for name, value in results.items()}
@@ -1,46 +1,116 @@
-from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-import keras
-import dearpygui.dearpygui as dpg
 import numpy as np
 
 from Src.Enums import Themes
 from Src.Nodes import DataNode
+from Src.Managers import TaskManager
+from Src.Utils import TableStream, ArrayValidator
+
+if TYPE_CHECKING:
+    import keras
+    from Src.Nodes.keras_callbacks import ProgressCallback
 
 
 
 class FitNode(DataNode):
     theme_name: Themes = Themes.FIT
     history: np.ndarray
+    progress: "ProgressCallback" = None
+    # Частота перерисовки графика обучения, 10 Гц
+    PROGRESS_INTERVAL: float = 0.1
+    _progress_task: int = None
+    _rendered: int = 0
+
+
+    def prepare(self, kwargs: dict = None):
+        task = super().prepare(kwargs)
+        if task is None: return None
+
+        from Src.Nodes.keras_callbacks import ProgressCallback
+
+        self.progress = ProgressCallback()
+        self._rendered = 0
+        task.kwargs['callbacks'] = [self.progress]
+        self._progress_task = TaskManager.add_periodic(self.render_progress, self.PROGRESS_INTERVAL)
 
+        return task
 
-    def compile(self):
-        status = super().compile()
-        if not status: return False
+
+    def finish(self, task, output = None, error: Exception = None) -> bool:
+        TaskManager.remove_periodic(self._progress_task)
+        self.render_progress()
+        return super().finish(task, output, error)
+
+
+    def commit(self, output: "keras.Model"):
+        super().commit(output)
         self.history: np.ndarray = np.array(self.OUTPUT.history.history['loss'])
-        return status
+
+
+    def show_worker_result(self, outputs: dict[str, object], fetch):
+        # История потерь по эпохам небольшая, её график показывается вместо графика по батчам
+        attribute = self.attribute("progress")
+        if outputs.get("history") is None or not attribute: return
+
+        history = fetch("history")
+        self.annotations["progress"].set_value(attribute, (np.arange(1, len(history) + 1), history))
+
+
+    def render_progress(self):
+        '''
+        Перерисовать график потерь по батчам, если с прошлой отрисовки пришли новые значения.
+        '''
+        buffer = self.progress.batches.get('loss') if self.progress else None
+        if buffer is None or buffer.count == self._rendered: return
+
+        self._rendered = buffer.count
+        attribute = self.attribute("progress")
+        if attribute: self.annotations["progress"].set_value(attribute, buffer.values())
 
 
     @staticmethod
-    def fit(model: keras.models.Model, **kwargs) -> keras.Model:
-        if kwargs['epochs']<=0:
+    def fit(model: "keras.models.Model", x: np.ndarray, y: np.ndarray, epochs: int, batch_size: int = 32,
+            pipeline: bool = False, shuffle_buffer: int = 0, cache: bool = False,
+            callbacks: "list[keras.callbacks.Callback]" = None, **kwargs) -> "keras.Model":
+        '''
+        Обучить копию модели. В режиме pipeline данные подаются через tf.data с перемешиванием в буфере,
+        кэшированием и предзагрузкой батчей, иначе массивы передаются в model.fit целиком.
+        Потоковые таблицы (TableStream) всегда подаются через tf.data и читаются с диска батчами каждую эпоху.
+        '''
+        import keras
+        from Src.Nodes.keras_callbacks import CancelCallback
+        from Src.Nodes.data_pipeline import make_dataset
+
+        if epochs<=0:
             raise AttributeError("Колличество эпох должно быть больше нуля!")
         
-        if kwargs['x'].shape[0]!=kwargs['y'].shape[0]:
+        streaming = isinstance(x, TableStream) or isinstance(y, TableStream)
+
+        # Длина потока заранее неизвестна, её совпадение проверяется по батчам при чтении
+        if not streaming and x.shape[0]!=y.shape[0]:
             raise AttributeError('Размерности X и Y не совпадают!')
         
-        if kwargs['x'].dtype == np.object_ or np.isnan(kwargs['x']).any() :
+        if not isinstance(x, TableStream) and (x.dtype == np.object_ or ArrayValidator.has_nan(x)):
             raise AttributeError('Данные содержат неверный формат X!')
         
-        if kwargs['y'].dtype == np.object_ or np.isnan(kwargs['y']).any():
+        if not isinstance(y, TableStream) and (y.dtype == np.object_ or ArrayValidator.has_nan(y)):
             raise AttributeError('Данные содержат неверный формат Y!')
 
-        with dpg.window(label="Обучение", modal=True, no_close=True,tag="fit_window") as popup:
-            dpg.add_loading_indicator(width=100, height=100)
-        
-        history = model.fit(**kwargs, verbose=False)
+        if pipeline or streaming:
+            kwargs.update(x=make_dataset(x, y, batch_size=batch_size, shuffle_buffer=shuffle_buffer, cache=cache),
+                          shuffle=False)
+        else:
+            # Массивы перемешиваются самим Keras каждую эпоху, shuffle_buffer относится только к tf.data
+            kwargs.update(x=x, y=y, batch_size=batch_size, shuffle=True)
+
+        # Обучаем копию, чтобы модель из узла компиляции оставалась необученной
+        # и её можно было переиспользовать без пересборки при следующей компиляции
+        compile_config = model.get_compile_config()
+        model = keras.models.clone_model(model)
+        model.compile_from_config(compile_config)
 
-        dpg.delete_item(popup)
+        model.fit(**kwargs, epochs=epochs, verbose=False, callbacks=[CancelCallback(), *(callbacks or [])])
 
         return model
     
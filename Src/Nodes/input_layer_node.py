@@ -1,5 +1,3 @@
-from keras import layers
-
 from Src.Enums import Themes
 from Src.Nodes import LayerNode, LayerResult
 
@@ -15,6 +13,8 @@ class InputLayerNode(LayerNode):
 
     @staticmethod
     def create_input(*args, **kwargs) -> LayerResult:
+        from keras import layers
+
         input_layer = layers.Input(**kwargs)
         return LayerResult(input_layer, set([input_layer]))
         
\ No newline at end of file
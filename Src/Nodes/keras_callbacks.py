@@ -0,0 +1,64 @@
+import keras
+
+from Src.Managers import TaskManager
+from Src.Exceptions import CancelledException
+from Src.Utils import RingBuffer
+
+
+
+class CancelCallback(keras.callbacks.Callback):
+    '''
+    Прерывает обучение и предсказание между батчами, если пользователь отменил сборку графа.
+    '''
+
+    @staticmethod
+    def check():
+        if TaskManager.cancelled():
+            raise CancelledException("Выполнение отменено пользователем")
+
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.check()
+
+
+    def on_test_batch_end(self, batch, logs=None):
+        self.check()
+
+
+    def on_predict_batch_end(self, batch, logs=None):
+        self.check()
+
+
+
+class ProgressCallback(keras.callbacks.Callback):
+    '''
+    Складывает метрики обучения по батчам и по эпохам в кольцевые буферы фиксированного размера.
+    Интерфейс читает буферы с ограниченной частотой, поэтому частая запись не замедляет обучение.
+
+    Attributes:
+        batches: dict[str, RingBuffer] - метрики по батчам
+        epochs: dict[str, RingBuffer] - метрики по эпохам
+    '''
+    batches: dict[str, RingBuffer]
+    epochs: dict[str, RingBuffer]
+
+
+    def __init__(self, capacity: int = 1000):
+        super().__init__()
+        self.capacity = capacity
+        self.batches = {}
+        self.epochs = {}
+
+
+    def __push(self, buffers: dict[str, RingBuffer], logs: dict | None):
+        for name, value in (logs or {}).items():
+            if name not in buffers: buffers[name] = RingBuffer(self.capacity)
+            buffers[name].append(float(value))
+
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.__push(self.batches, logs)
+
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.__push(self.epochs, logs)
@@ -1,17 +1,20 @@
 from itertools import chain
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from keras import layers
 import dearpygui.dearpygui as dpg
 
 from Src.Enums import Themes
 from Src.Nodes import AbstractNode
 
+if TYPE_CHECKING:
+    from keras import layers
+
 
 @dataclass
 class LayerResult:
-    layer: layers.Layer
-    inputs: set[layers.InputLayer]
+    layer: "layers.Layer"
+    inputs: "set[layers.InputLayer]"
 
 
 class LayerNode(AbstractNode):
@@ -24,7 +27,7 @@ class LayerNode(AbstractNode):
 
 
     @staticmethod
-    def layer(layer: layers.Layer):
+    def layer(layer: "type[layers.Layer]"):
         '''
         Фабрика функций, для новых INPUT \ OUTPUT,
         чтоб INPUT мог приходить как args
@@ -33,7 +36,7 @@ class LayerNode(AbstractNode):
     
 
     @staticmethod
-    def compile_layer(layer: layers.Layer, *args: LayerResult, **kwargs):
+    def compile_layer(layer: "type[layers.Layer]", *args: LayerResult, **kwargs):
         '''
         Компанует выход который должен быть у Layer,
         чтоб не городить костыли с обработкой inputs
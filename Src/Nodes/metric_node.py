@@ -1,5 +1,3 @@
-import keras.metrics
-
 from Src.Enums import Themes
 from Src.Nodes import DataNode
 from Src.Utils import Backfield
@@ -24,6 +22,8 @@ class MetricNode(DataNode):
             y_pred: Предсказанные метки/значения.
             metric: Название метрики для вычисления (например, 'accuracy').
         '''
+        import keras.metrics
+
         metric_fn: keras.metrics.Metric = keras.metrics.get(metric)
 
         metric_fn.update_state(y_true,y_pred)
@@ -31,14 +31,9 @@ class MetricNode(DataNode):
         return [float(metric_fn.result().numpy())]
 
 
-    def compile(self) -> bool:
+    def commit(self, output: list[float]):
         '''
-        Выполняет логику узла и устанавливает значение для поля вывода 'data'.
+        Сохраняет результат логики и устанавливает значение для поля вывода 'data'.
         '''
-        status = super().compile()
-        if not status:
-            return False
-
-        self.data = self.OUTPUT[0]
-
-        return status
\ No newline at end of file
+        super().commit(output)
+        self.data = self.OUTPUT[0]
\ No newline at end of file
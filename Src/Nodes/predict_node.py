@@ -1,16 +1,90 @@
-import keras
+from typing import TYPE_CHECKING, Callable
+import time
+
+import numpy as np
 
 from Src.Enums import Themes
 from Src.Nodes import DataNode
+from Src.Utils import TableStream, NpyWriter, iterate_batches
+from Src.Logging import logging
+
+if TYPE_CHECKING:
+    import keras
 
 
 
 # TODO: Переписать на SelfNode
 class PredictNode(DataNode):
     theme_name: Themes = Themes.PREDICT
-    logic: keras.models.Model.predict
+    logic: "keras.models.Model.predict"
+    logger = logging()('functions')
+
+
+    def commit(self, output):
+        super().commit(output)
+        # Скорость предсказания показывается вместе с замером узла
+        if self.profile is not None: self.profile.rows = PredictNode.count_rows(output)
+
+
+    @staticmethod
+    def count_rows(output) -> int:
+        '''
+        Количество предсказанных строк. У моделей с несколькими выходами predict возвращает список
+        или словарь массивов, строки считаются по первому выходу.
+        '''
+        if isinstance(output, dict): output = list(output.values())
+        if isinstance(output, list | tuple): output = output[0] if output else []
+        return len(output)
 
 
     @staticmethod
-    def predict(model: keras.models.Model, **kwargs):
-        return model.predict(**kwargs, verbose=False)
+    def predict(model: "keras.models.Model", x, batch_size: int = 32, filename: str = None,
+                progress: Callable[[float], None] = None, **kwargs):
+        '''
+        Предсказание модели. Потоковая таблица (TableStream) подаётся в модель батчами, не загружаясь целиком.
+        Если указан filename, предсказания считаются батчами по batch_size строк и сразу дописываются в .npy,
+        результат открывается через np.memmap: память не зависит от количества строк.
+        '''
+        from Src.Nodes.keras_callbacks import CancelCallback
+        from Src.Nodes.data_pipeline import make_dataset
+
+        if filename:
+            return PredictNode.predict_to_file(model, x, filename, batch_size, progress)
+
+        if isinstance(x, TableStream):
+            x = make_dataset(x, batch_size=batch_size)
+            return model.predict(x, **kwargs, verbose=False, callbacks=[CancelCallback()])
+
+        return model.predict(x, batch_size=batch_size, **kwargs, verbose=False, callbacks=[CancelCallback()])
+
+
+    @staticmethod
+    def predict_to_file(model: "keras.models.Model", x, filename: str, batch_size: int = 1024,
+                        progress: Callable[[float], None] = None) -> np.memmap:
+        '''
+        Предсказать x батчами и записать результат в filename (.npy) без накопления в памяти.
+
+        Returns:
+            np.memmap - предсказания, открытые из filename только для чтения.
+        '''
+        from Src.Nodes.keras_callbacks import CancelCallback
+
+        # У потоковой таблицы количество строк заранее неизвестно
+        total = None if isinstance(x, TableStream) else len(x)
+        start = time.perf_counter()
+
+        with NpyWriter(filename) as writer:
+            for batch in iterate_batches(x, batch_size):
+                CancelCallback.check()
+
+                # predict_on_batch не создаёт tf.data и колбэки на каждый вызов, в отличие от predict
+                prediction = model.predict_on_batch(batch)
+                if isinstance(prediction, list | tuple | dict):
+                    raise AttributeError("Запись в файл поддерживается только для моделей с одним выходом!")
+
+                writer.append(np.asarray(prediction))
+                if progress and total: progress(writer.rows / total)
+
+        elapsed = time.perf_counter() - start
+        PredictNode.logger.info(f"Предсказано {writer.rows} строк в {filename}: {writer.rows / max(elapsed, 1e-9):.0f} строк/с")
+        return np.load(filename, mmap_mode='r')
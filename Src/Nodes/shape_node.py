@@ -1,11 +1,11 @@
-from pathlib import Path
 from abc import abstractmethod
+from pathlib import Path
+from typing import Callable
 
 import numpy as np
-import keras
 
 from Src.Enums import Themes
-from Src.Utils import Backfield
+from Src.Utils import Backfield, TableReader, TableStream, ImageReader, ArrayCache
 from Src.Nodes import DataNode
 
 
@@ -19,31 +19,64 @@ class ShapeNode(DataNode):
     OUTPUT: np.ndarray
 
 
-    def compile(self):
-        status = super().compile()
-        if not status or len(self.OUTPUT.shape) < 2: return False
+    def memo_key(self, task):
+        '''
+        Результат загрузки зависит и от содержимого файлов, поэтому в ключ добавляется их состояние на диске.
+        '''
+        key, inputs = super().memo_key(task)
+        files = task.kwargs.get('files')
+        if files and Path(files).exists(): key += (ArrayCache.fingerprint(files),)
+        return key, inputs
+
+
+    def commit(self, output):
+        if len(output.shape) < 2:
+            raise AttributeError("Данные должны быть хотя бы двумерными!")
+
+        super().commit(output)
         self.shape = self.OUTPUT.shape[1:]
-        return status
 
 
     @staticmethod
-    def open_table_data(files: str, *args, **kwargs):
+    def open_table_data(files: str, delimiter: str = ',', skip_header: bool = False, skip_footer: bool = False,
+                        dtype: str = 'float32', progress: Callable[[float], None] = None):
+        '''
+        Загрузить таблицу по частям. По умолчанию значения читаются как float32, тип можно выбрать в узле.
+        Разобранная таблица кэшируется на диске, повторная загрузка открывает её через mmap.
+        '''
         if not files: 
             raise AttributeError("Вы не выбрали данные, которые нужно открыть!")
         
-        return np.genfromtxt(files, *args, **kwargs, ndmin=2)
+        reader = TableReader(files, delimiter=delimiter, skip_header=skip_header, skip_footer=skip_footer, dtype=dtype)
+        return ArrayCache.get("table", files, lambda: reader.read(progress), 
+                              delimiter=delimiter, skip_header=reader.skip_header, 
+                              skip_footer=reader.skip_footer, dtype=str(reader.dtype))
 
     
     @staticmethod
-    def open_image_data(files: str, *args, **kwargs):
+    def open_table_stream(files: str, delimiter: str = ',', skip_header: bool = False, skip_footer: bool = False,
+                          dtype: str = 'float32') -> TableStream:
+        '''
+        Открыть таблицу как поток для данных больше оперативной памяти. Читается только начало файла,
+        строки читаются батчами при обучении и предсказании.
+        '''
         if not files: 
             raise AttributeError("Вы не выбрали данные, которые нужно открыть!")
 
-        images = []
-        for image_path in sorted(Path(files).iterdir()):
-            image = keras.utils.load_img(image_path, *args, **kwargs)
-            image = keras.utils.img_to_array(image)
-            images.append(image)
+        return TableStream(files, delimiter=delimiter, skip_header=skip_header, skip_footer=skip_footer, dtype=dtype)
+
+
+    @staticmethod
+    def open_image_data(files: str, color_mode: str = "rgb", target_size: tuple[int, int] = None, 
+                        interpolation: str = "bilinear", progress: Callable[[float], None] = None):
+        '''
+        Загрузить папку с изображениями в массив uint8. Изображения декодируются параллельно,
+        при заданном target_size (высота, ширина) приводятся к одному размеру.
+        '''
+        if not files: 
+            raise AttributeError("Вы не выбрали данные, которые нужно открыть!")
 
-        return np.array(images)
+        reader = ImageReader(files, target_size=target_size, color_mode=color_mode, interpolation=interpolation)
+        return ArrayCache.get("images", files, lambda: reader.read(progress=progress), 
+                              color_mode=color_mode, target_size=reader.target_size, interpolation=interpolation)
     
\ No newline at end of file
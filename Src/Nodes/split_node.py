@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from Src.Nodes import DataNode
+
+
+
+@dataclass
+class SplitIndex:
+    '''
+    Разбиение строк на обучающую, валидационную и тестовую части. Части без перемешивания хранятся срезами,
+    поэтому массивы делятся без копирования, остальные - массивами номеров строк.
+
+    Attributes:
+        train, val, test: slice | np.ndarray - строки частей
+        size: int - количество строк в разбиваемых данных
+    '''
+    train: slice | np.ndarray
+    val: slice | np.ndarray
+    test: slice | np.ndarray
+    size: int
+
+
+    def apply(self, data: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        '''
+        Разделить данные по этому разбиению. Срезы дают представления (views) исходного массива,
+        номера строк - копии только выбранных строк.
+        '''
+        if len(data) != self.size:
+            raise AttributeError(f"Разбиение построено для {self.size} строк, а в данных их {len(data)}!")
+        return data[self.train], data[self.val], data[self.test]
+
+
+
+@dataclass
+class Split:
+    train: np.ndarray
+    val: np.ndarray
+    test: np.ndarray
+    index: SplitIndex
+
+
+
+class SplitNode(DataNode):
+    '''
+    Узел разбиения данных на обучающую, валидационную и тестовую части
+    '''
+    train: np.ndarray = property(lambda self: self.OUTPUT.train)
+    val: np.ndarray = property(lambda self: self.OUTPUT.val)
+    test: np.ndarray = property(lambda self: self.OUTPUT.test)
+    index: SplitIndex = property(lambda self: self.OUTPUT.index)
+
+
+    @staticmethod
+    def make_index(size: int, val_size: float = 0.1, test_size: float = 0.2, shuffle: bool = True,
+                   seed: int = 0, stratify: np.ndarray = None) -> SplitIndex:
+        '''
+        Построить разбиение size строк. Без перемешивания и стратификации части идут подряд
+        (обучающая, валидационная, тестовая) и задаются срезами.
+        При стратификации доли классов stratify в каждой части сохраняются.
+        '''
+        if val_size < 0 or test_size < 0 or val_size + test_size >= 1:
+            raise AttributeError("Доли валидационной и тестовой частей должны быть неотрицательными и в сумме меньше 1!")
+
+        if stratify is None:
+            n_val, n_test = round(size * val_size), round(size * test_size)
+            bounds = (0, size - n_val - n_test, size - n_test, size)
+
+            if not shuffle:
+                return SplitIndex(*(slice(start, stop) for start, stop in zip(bounds, bounds[1:])), size)
+
+            order = np.random.default_rng(seed).permutation(size)
+            return SplitIndex(*(order[start:stop] for start, stop in zip(bounds, bounds[1:])), size)
+
+        labels = np.asarray(stratify)
+        if len(labels) != size:
+            raise AttributeError(f"Меток для стратификации {len(labels)}, а строк в данных {size}!")
+        # One-hot метки приводятся к номерам классов
+        labels = labels.argmax(axis=-1) if labels.ndim > 1 and labels.shape[-1] > 1 else labels.reshape(size)
+
+        rng = np.random.default_rng(seed)
+        parts = ([], [], [])
+
+        for label in np.unique(labels):
+            rows = np.flatnonzero(labels == label)
+            if shuffle: rows = rng.permutation(rows)
+
+            n_val, n_test = round(len(rows) * val_size), round(len(rows) * test_size)
+            bounds = (0, len(rows) - n_val - n_test, len(rows) - n_test, len(rows))
+            for part, start, stop in zip(parts, bounds, bounds[1:]):
+                part.append(rows[start:stop])
+
+        parts = [np.concatenate(part) for part in parts]
+        parts = [rng.permutation(part) if shuffle else np.sort(part) for part in parts]
+        return SplitIndex(*parts, size)
+
+
+    @staticmethod
+    def split(data: np.ndarray, val_size: float = 0.1, test_size: float = 0.2, shuffle: bool = True,
+              seed: int = 0, stratify: np.ndarray = None, split: SplitIndex = None) -> Split:
+        '''
+        Разделить данные на обучающую, валидационную и тестовую части.
+
+        Args:
+            data: Данные для разбиения, строки - примеры.
+            val_size: Доля валидационной части.
+            test_size: Доля тестовой части.
+            shuffle: Перемешать строки перед разбиением.
+            seed: Зерно перемешивания.
+            stratify: Метки классов, доли которых сохраняются в каждой части.
+            split: Разбиение другого узла Split (его выход index). Если задано, остальные параметры
+                не используются: так X и y делятся одинаково.
+        '''
+        # Несвязанный вход узла приходит пустым списком
+        if isinstance(stratify, list) and not stratify: stratify = None
+        if isinstance(split, list) and not split: split = None
+
+        if split is not None and not isinstance(split, SplitIndex):
+            raise AttributeError("На вход split нужно подать выход index другого узла Split!")
+
+        index = split or SplitNode.make_index(len(data), val_size, test_size, shuffle, seed, stratify)
+        return Split(*index.apply(data), index)
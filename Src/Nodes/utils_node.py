@@ -1,17 +1,73 @@
-import keras
-from subprocess import Popen, PIPE
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+import dearpygui.dearpygui as dpg
+import numpy as np
 
 from Src.Enums import Themes
 from Src.Nodes import AbstractNode
+from Src.Managers import WriteManager, TaskManager
+from Src.Utils import save_array
+from Src.Logging import logging
+
+if TYPE_CHECKING:
+    import keras
 
 
 
 class UtilsNode(AbstractNode):
     theme_name: Themes = Themes.UTILS
+    background: bool = True
+    logger = logging()('functions')
+
+
+    @staticmethod
+    def save_data(X: np.ndarray, fname: str = 'result.npy', compressed: bool = False, append: bool = False):
+        '''
+        Сохранить данные в .npy, .npz (compressed - сжатый архив) или текст для остальных расширений.
+        При append данные дописываются к существующему файлу. Запись выполняется в фоновом потоке записи,
+        узел завершается сразу, не дожидаясь диска, ошибка записи показывается на узле после её окончания.
+
+        Returns:
+            Future - поставленная запись.
+        '''
+        if not fname:
+            raise AttributeError("Не указан файл для сохранения!")
+
+        UtilsNode.logger.info(f"Запись {fname} поставлена в очередь")
+        future = WriteManager.submit(save_array, fname, X, compressed, append)
+        future.add_done_callback(lambda future: UtilsNode.report_write(fname, future))
+        return future
+
+
+    @staticmethod
+    def report_write(fname: str, future: Future):
+        if future.exception() is not None:
+            UtilsNode.logger.error(f"Не удалось записать {fname}: {future.exception()}")
+        else:
+            UtilsNode.logger.info(f"Данные записаны в {fname}")
+
+
+    def finish(self, task, output = None, error: Exception = None) -> bool:
+        compiled = super().finish(task, output, error)
+        if compiled and isinstance(output, Future):
+            output.add_done_callback(lambda future: future.exception() is None or
+                                     TaskManager.call_in_ui(self.write_failed, future.exception()))
+        return compiled
+
+
+    def write_failed(self, error: Exception):
+        '''
+        Показать на узле ошибку фоновой записи. Узел помечается изменённым, чтобы следующая сборка повторила запись.
+        Выполняется в основном потоке.
+        '''
+        if not dpg.does_item_exist(self.node_tag): return
+        self.invalidate()
+        self.raise_error(error, "Ошибка записи файла")
 
 
     @staticmethod
-    def to_json(model: keras.models.Model, filename: str):
+    def to_json(model: "keras.models.Model", filename: str):
         json_string = model.to_json()
 
         try:
@@ -1,3 +1,15 @@
 from Src.Utils.factory_method import factorymethod
 from Src.Utils.backfield import Backfield
-from Src.Utils.singleton import singleton
\ No newline at end of file
+from Src.Utils.singleton import singleton
+from Src.Utils.ring_buffer import RingBuffer
+from Src.Utils.table_reader import TableReader
+from Src.Utils.array_cache import ArrayCache
+from Src.Utils.image_reader import ImageReader
+from Src.Utils.table_stream import TableStream
+from Src.Utils.array_validator import ArrayValidator
+from Src.Utils.lazy_import import LazyCallable, lazy, warm_up
+from Src.Utils.memory import peak_rss
+from Src.Utils.dataset_store import DatasetStore
+from Src.Utils.npy_writer import NpyWriter
+from Src.Utils.array_writer import save_array
+from Src.Utils.batches import iterate_batches
\ No newline at end of file
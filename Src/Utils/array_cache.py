@@ -0,0 +1,93 @@
+from pathlib import Path
+from typing import Callable
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+
+
+class ArrayCache:
+    '''
+    Кэш разобранных данных на диске. Массив сохраняется в .npy под ключом из пути, времени изменения,
+    размера источника и параметров загрузки. При попадании файл открывается через np.load(mmap_mode='r'):
+    данные не копируются в память, страницы подгружаются операционной системой по мере чтения.
+
+    Attributes:
+        directory: Path - папка с файлами кэша
+        enabled: bool - использовать кэш
+    '''
+    directory: Path = Path("Cache")
+    enabled: bool = True
+
+
+    @staticmethod
+    def fingerprint(path: str | Path) -> tuple:
+        '''
+        Описание состояния источника: для файла - путь, время изменения и размер, для папки - то же для каждого файла в ней.
+        '''
+        path = Path(path).resolve()
+        stat = path.stat()
+
+        if not path.is_dir():
+            return (str(path), stat.st_mtime_ns, stat.st_size)
+
+        entries = tuple((entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                        for entry in sorted(path.iterdir()) if entry.is_file())
+        return (str(path), entries)
+
+
+    @classmethod
+    def key(cls, kind: str, path: str | Path, **params) -> str:
+        '''
+        Ключ кэша для данных, загруженных из path загрузчиком kind с параметрами params.
+        '''
+        description = repr((kind, cls.fingerprint(path), sorted((name, repr(value)) for name, value in params.items())))
+        return hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+
+
+    @classmethod
+    def get(cls, kind: str, path: str | Path, build: Callable[[], np.ndarray], **params) -> np.ndarray:
+        '''
+        Вернуть данные из кэша или загрузить их через build и сохранить.
+
+        Args:
+            kind: str - название загрузчика, разделяет кэш разных видов данных
+            path: str | Path - путь до источника данных
+            build: Callable[[], np.ndarray] - загрузка данных при промахе
+            **params - параметры загрузки, которые влияют на результат
+
+        Returns:
+            np.ndarray - загруженный массив, при попадании - np.memmap только для чтения
+        '''
+        if not cls.enabled: return build()
+
+        file = cls.directory / f"{kind}_{cls.key(kind, path, **params)}.npy"
+
+        if file.exists():
+            try:
+                return np.load(file, mmap_mode='r')
+            except (ValueError, OSError):
+                file.unlink(missing_ok=True)
+
+        array = build()
+
+        # Пишем во временный файл и переименовываем, чтобы прерванная запись не оставила битый кэш
+        cls.directory.mkdir(parents=True, exist_ok=True)
+        temporary = file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with temporary.open('wb') as stream:
+            np.save(stream, array)
+        os.replace(temporary, file)
+
+        return array
+
+
+    @classmethod
+    def clear(cls) -> None:
+        '''
+        Удалить все файлы кэша.
+        '''
+        if not cls.directory.exists(): return
+        for file in cls.directory.glob("*.npy"):
+            file.unlink(missing_ok=True)
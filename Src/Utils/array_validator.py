@@ -0,0 +1,99 @@
+from collections import OrderedDict
+from pathlib import Path
+import mmap
+import threading
+import weakref
+
+import numpy as np
+
+
+
+class ArrayValidator:
+    '''
+    Проверка массивов на пропущенные значения (nan) перед обучением.
+    Массив просматривается блоками по CHUNK_ELEMENTS элементов в переиспользуемый буфер, поэтому временный массив
+    размера данных не создаётся. Целочисленные и логические массивы nan содержать не могут и не просматриваются.
+    Результат запоминается для объекта массива, а для файлов, открытых через mmap, - для файла
+    и времени его изменения, поэтому повторное обучение на тех же данных не просматривает их заново.
+    Массив, изменённый на месте после проверки, проверяется заново только после clear.
+    '''
+    CHUNK_ELEMENTS = 2**20
+    CACHE_SIZE = 64
+
+    _cache: OrderedDict[tuple, tuple[weakref.ref | None, bool]] = OrderedDict()
+    _lock: threading.Lock = threading.Lock()
+
+
+    @staticmethod
+    def key(array: np.ndarray) -> tuple:
+        '''
+        Ключ результата проверки: для отображённого в память файла - файл и время изменения,
+        для остальных массивов - адрес данных и их раскладка.
+        '''
+        if isinstance(array, np.memmap) and isinstance(array.base, mmap.mmap) and array.filename:
+            return ("file", array.filename, Path(array.filename).stat().st_mtime_ns, array.offset,
+                    array.shape, array.dtype.str)
+
+        return ("array", array.__array_interface__['data'][0], array.shape, array.strides, array.dtype.str)
+
+
+    @classmethod
+    def has_nan(cls, array: np.ndarray) -> bool:
+        '''
+        Содержит ли массив nan.
+
+        Raises:
+            AttributeError - если массив состоит из объектов Python.
+        '''
+        array = np.asanyarray(array)
+
+        if array.dtype == np.object_:
+            raise AttributeError("Массив состоит из объектов, а не из чисел!")
+        if not np.issubdtype(array.dtype, np.inexact):
+            return False
+
+        key = cls.key(array)
+        with cls._lock:
+            cached = cls._cache.get(key)
+            if cached is not None:
+                reference, result = cached
+                # Для обычных массивов адрес может достаться новому объекту, поэтому сверяем и сам объект
+                if reference is None or reference() is array:
+                    cls._cache.move_to_end(key)
+                    return result
+
+        result = cls.scan(array)
+
+        with cls._lock:
+            cls._cache[key] = (None if key[0] == "file" else weakref.ref(array), result)
+            if len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.popitem(last=False)
+
+        return result
+
+
+    @classmethod
+    def scan(cls, array: np.ndarray) -> bool:
+        '''
+        Просмотреть массив блоками строк без временного массива размера данных.
+        '''
+        if array.size == 0: return False
+        if array.ndim == 0: return bool(np.isnan(array))
+
+        row_size = max(array.size // len(array), 1)
+        rows = max(cls.CHUNK_ELEMENTS // row_size, 1)
+        buffer = np.empty((min(rows, len(array)), *array.shape[1:]), dtype=bool)
+
+        for start in range(0, len(array), rows):
+            chunk = array[start:start + rows]
+            mask = buffer[:len(chunk)]
+            np.isnan(chunk, out=mask)
+            if mask.any(): return True
+
+        return False
+
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._cache.clear()
@@ -0,0 +1,43 @@
+from pathlib import Path
+import zipfile
+
+import numpy as np
+
+from Src.Utils.npy_writer import NpyWriter
+
+
+
+def save_array(path: str | Path, array: np.ndarray, compressed: bool = False, append: bool = False) -> Path:
+    '''
+    Сохранить массив в формате по расширению файла:
+        .npy - двоичный массив, при append строки дописываются в конец существующего массива;
+        .npz - архив numpy, при compressed сжатый, при append массив добавляется в архив следующим ключом (arr_0, arr_1, ...);
+        остальные - текст через np.savetxt, при append строки дописываются в конец файла.
+    '''
+    path = Path(path)
+    if not path.name:
+        raise AttributeError("Не указан файл для сохранения!")
+
+    array = np.asarray(array)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    suffix = path.suffix.lower()
+
+    if suffix == '.npy':
+        if append: NpyWriter.extend(path, array)
+        else: np.save(path, array)
+
+    elif suffix == '.npz':
+        if not append or not path.exists():
+            (np.savez_compressed if compressed else np.savez)(path, array)
+            return path
+
+        compression = zipfile.ZIP_DEFLATED if compressed else zipfile.ZIP_STORED
+        with zipfile.ZipFile(path, 'a', compression=compression, allowZip64=True) as archive:
+            with archive.open(f"arr_{len(archive.namelist())}.npy", 'w', force_zip64=True) as file:
+                np.lib.format.write_array(file, array, allow_pickle=False)
+
+    else:
+        with path.open('ab' if append else 'wb') as file:
+            np.savetxt(file, array)
+
+    return path
@@ -0,0 +1,22 @@
+from typing import Iterator
+
+import numpy as np
+
+from Src.Utils.table_stream import TableStream
+
+
+
+def iterate_batches(data: np.ndarray | TableStream, batch_size: int) -> Iterator[np.ndarray]:
+    '''
+    Пройти по данным батчами по batch_size строк. Массивы (в том числе np.memmap) делятся срезами
+    без копирования и отдаются как np.ndarray, потоковые таблицы читаются с диска по мере прохода.
+    '''
+    if batch_size <= 0:
+        raise AttributeError("Размер батча должен быть больше нуля!")
+
+    if isinstance(data, TableStream):
+        yield from data.batches(batch_size)
+        return
+
+    for start in range(0, len(data), batch_size):
+        yield np.asarray(data[start:start + batch_size])
@@ -0,0 +1,123 @@
+from pathlib import Path
+import os
+import socket
+import threading
+
+import numpy as np
+
+from Src.Exceptions import NetworkException
+
+
+
+class DatasetStore:
+    '''
+    Локальное зеркало датасетов Keras. Каждый датасет хранится в своей папке несжатыми файлами
+    X_train.npy, y_train.npy, X_test.npy, y_test.npy и открывается через np.load(mmap_mode='r'):
+    архив не распаковывается заново, данные не копируются в память. Сеть проверяется только
+    при скачивании отсутствующего датасета, в офлайн-режиме скачивание запрещено.
+
+    Папку и режим можно задать переменными окружения GRAPHNET_DATASETS и GRAPHNET_OFFLINE=1,
+    а заполнить зеркало заранее - командой graphnet mirror.
+
+    Attributes:
+        directory: Path - папка зеркала
+        offline: bool - не обращаться к сети, датасеты только из зеркала
+    '''
+    directory: Path = Path(os.environ.get("GRAPHNET_DATASETS", "Datasets"))
+    offline: bool = os.environ.get("GRAPHNET_OFFLINE", "") not in ("", "0")
+    splits: tuple[str, ...] = ("X_train", "y_train", "X_test", "y_test")
+    _lock: threading.Lock = threading.Lock()
+
+
+    @classmethod
+    def set_offline(cls, offline: bool) -> None:
+        '''
+        Включить офлайн-режим. Значение передаётся и через окружение, чтобы его получил процесс сборки,
+        запущенный после изменения.
+        '''
+        cls.offline = offline
+        os.environ["GRAPHNET_OFFLINE"] = "1" if offline else "0"
+
+
+    @classmethod
+    def path(cls, name: str) -> Path:
+        return cls.directory / name
+
+
+    @classmethod
+    def exists(cls, name: str) -> bool:
+        return all((cls.path(name) / f"{split}.npy").exists() for split in cls.splits)
+
+
+    @classmethod
+    def load(cls, name: str) -> tuple[np.ndarray, ...]:
+        '''
+        Открыть датасет из зеркала. Числовые массивы возвращаются как np.memmap только для чтения,
+        массивы объектов (последовательности imdb и reuters) отобразить нельзя, они читаются в память.
+        '''
+        arrays = []
+        for split in cls.splits:
+            file = cls.path(name) / f"{split}.npy"
+            try:
+                arrays.append(np.load(file, mmap_mode='r'))
+            except ValueError:
+                arrays.append(np.load(file, allow_pickle=True))
+        return tuple(arrays)
+
+
+    @classmethod
+    def save(cls, name: str, arrays: tuple[np.ndarray, ...]) -> None:
+        '''
+        Записать разбиения датасета в зеркало. Каждый файл пишется во временный и переименовывается,
+        поэтому прерванная запись не оставляет неполный датасет.
+        '''
+        folder = cls.path(name)
+        folder.mkdir(parents=True, exist_ok=True)
+
+        for split, array in zip(cls.splits, arrays):
+            temporary = folder / f"{split}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with temporary.open('wb') as stream:
+                np.save(stream, np.asarray(array), allow_pickle=array.dtype.hasobject)
+            os.replace(temporary, folder / f"{split}.npy")
+
+
+    @staticmethod
+    def check_connection() -> None:
+        '''
+        Raises:
+            NetworkException - нет доступа к хранилищу датасетов Keras.
+        '''
+        try:
+            socket.create_connection(("storage.googleapis.com", 443), timeout=5).close()
+        except OSError as err:
+            raise NetworkException(f'{err}.\nСкорее всего отсутствует подключение к интернету.')
+
+
+    @classmethod
+    def download(cls, name: str) -> None:
+        '''
+        Скачать датасет через keras.datasets и сохранить в зеркало.
+
+        Raises:
+            NetworkException - включён офлайн-режим или нет подключения к интернету.
+        '''
+        if cls.offline:
+            raise NetworkException(f'Датасет {name} отсутствует в {cls.directory.resolve()}, а скачивание '
+                                   'запрещено офлайн-режимом.\nЗаполните зеркало командой graphnet mirror.')
+        cls.check_connection()
+
+        import keras.datasets
+
+        (X_train, y_train), (X_test, y_test) = getattr(keras.datasets, name).load_data()
+        cls.save(name, (X_train, y_train, X_test, y_test))
+
+
+    @classmethod
+    def get(cls, name: str) -> tuple[np.ndarray, ...]:
+        '''
+        Вернуть X_train, y_train, X_test, y_test датасета name, при отсутствии в зеркале - скачать.
+        '''
+        # Параллельные узлы не должны скачивать один датасет дважды
+        with cls._lock:
+            if not cls.exists(name): cls.download(name)
+        return cls.load(name)
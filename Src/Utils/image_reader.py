@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+import os
+
+import numpy as np
+
+
+
+class ImageReader:
+    '''
+    Параллельное чтение папки с изображениями.
+    Изображения декодируются в пуле потоков (Pillow отпускает GIL при декодировании и изменении размера)
+    и записываются сразу в заранее выделенный массив uint8, без промежуточного списка и копирования.
+
+    Attributes:
+        path: Path - папка с изображениями
+        target_size: tuple[int, int] | None - (высота, ширина) результата, None - без изменения размера
+        color_mode: str - grayscale, rgb или rgba
+        interpolation: str - способ интерполяции при изменении размера
+        workers: int - количество потоков декодирования
+    '''
+    MODES = {"grayscale": "L", "rgb": "RGB", "rgba": "RGBA"}
+
+    path: Path
+    target_size: tuple[int, int] | None
+    color_mode: str
+    interpolation: str
+    workers: int
+
+
+    def __init__(self, path: str | Path, target_size: tuple[int, int] = None, color_mode: str = "rgb",
+                 interpolation: str = "bilinear", workers: int = None):
+        if color_mode not in self.MODES:
+            raise AttributeError(f"Неизвестный режим цвета: {color_mode}")
+
+        self.path = Path(path)
+        # Нулевой размер в интерфейсе означает, что размер изображений не меняется
+        self.target_size = tuple(target_size) if target_size and all(target_size) else None
+        self.color_mode = color_mode
+        self.interpolation = interpolation
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+
+
+    def files(self) -> list[Path]:
+        return sorted(file for file in self.path.iterdir() if file.is_file())
+
+
+    def decode(self, file: Path) -> np.ndarray:
+        '''
+        Прочитать одно изображение в массив (высота, ширина, каналы) типа uint8.
+        '''
+        from PIL import Image
+
+        with Image.open(file) as image:
+            image = image.convert(self.MODES[self.color_mode])
+            if self.target_size and image.size != self.target_size[::-1]:
+                resample = Image.Resampling[self.interpolation.upper()]
+                image = image.resize(self.target_size[::-1], resample=resample)
+
+            array = np.asarray(image, dtype=np.uint8)
+
+        return array[..., np.newaxis] if array.ndim == 2 else array
+
+
+    def read(self, out: np.ndarray = None, progress: Callable[[float], None] = None) -> np.ndarray:
+        '''
+        Прочитать все изображения папки.
+
+        Args:
+            out: np.ndarray - массив (или np.memmap) для записи результата, по умолчанию выделяется новый.
+            progress: Callable[[float], None] - вызывается с долей прочитанных изображений.
+
+        Returns:
+            np.ndarray - массив (количество, высота, ширина, каналы) типа uint8
+        '''
+        files = self.files()
+        if not files:
+            raise AttributeError(f"В папке {self.path} нет изображений!")
+
+        # Первое изображение определяет размер результата
+        first = self.decode(files[0])
+        shape = (len(files), *first.shape)
+
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        elif out.shape != shape:
+            raise AttributeError(f"Размер массива {out.shape} не совпадает с размером данных {shape}")
+        out[0] = first
+
+        def store(index: int):
+            image = self.decode(files[index])
+            if image.shape != first.shape:
+                raise AttributeError(f"Изображения разного размера: {files[index].name} {image.shape} и {first.shape}, "
+                                     "укажите target_size")
+            out[index] = image
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="images") as pool:
+            for done, _ in enumerate(pool.map(store, range(1, len(files))), 2):
+                if progress: progress(done / len(files))
+
+        return out
@@ -0,0 +1,85 @@
+from typing import Callable
+import importlib
+import inspect
+import threading
+
+
+
+class LazyCallable:
+    '''
+    Функция или класс из тяжёлого модуля (keras, tensorflow), который импортируется только при первом вызове.
+    Позволяет описать список узлов без импорта Keras при запуске приложения.
+
+    Attributes:
+        path: str - полный путь до объекта, например "keras.layers.Dense"
+    '''
+    path: str
+    _target: Callable = None
+
+
+    def __init__(self, path: str):
+        self.path = path
+
+
+    def resolve(self) -> Callable:
+        '''
+        Импортировать модуль и вернуть объект. Атрибуты вложенных модулей (keras.utils.to_categorical)
+        берутся по цепочке от самого длинного импортируемого префикса.
+        '''
+        if self._target is not None: return self._target
+
+        parts = self.path.split(".")
+        for split in range(len(parts) - 1, 0, -1):
+            try:
+                target = importlib.import_module(".".join(parts[:split]))
+                break
+            except ModuleNotFoundError:
+                continue
+        else:
+            raise ModuleNotFoundError(f"Не удалось импортировать {self.path}")
+
+        for name in parts[split:]:
+            target = getattr(target, name)
+
+        self._target = target
+        return target
+
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+
+    @property
+    def __doc__(self) -> str:
+        return inspect.getdoc(self.resolve())
+
+
+    @property
+    def __signature__(self) -> inspect.Signature:
+        return inspect.signature(self.resolve())
+
+
+    def __repr__(self) -> str:
+        return f"LazyCallable({self.path!r})"
+
+
+
+def lazy(path: str) -> LazyCallable:
+    '''
+    Отложенная ссылка на объект из модуля, например lazy("keras.layers.Dense").
+    '''
+    return LazyCallable(path)
+
+
+def warm_up(*modules: str) -> threading.Thread:
+    '''
+    Импортировать модули в фоновом потоке, пока интерфейс уже отрисовывается. Если основной поток
+    обратится к модулю раньше, он дождётся окончания этого импорта на блокировке импорта.
+    '''
+    def load():
+        for module in modules:
+            importlib.import_module(module)
+
+    thread = threading.Thread(target=load, name="graphnet-warm-up", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,146 @@
+from pathlib import Path
+import os
+import struct
+import threading
+
+import numpy as np
+
+
+
+class NpyWriter:
+    '''
+    Запись массива в .npy по частям, когда количество строк заранее неизвестно. Заголовок резервируется
+    под максимальное количество строк и переписывается при закрытии, данные пишутся в файл последовательно,
+    поэтому в памяти находится только текущая часть. Запись идёт во временный файл, который
+    переименовывается при закрытии: прерванная запись не оставляет битый .npy.
+
+    Attributes:
+        path: Path - итоговый файл
+        rows: int - количество записанных строк
+        dtype: np.dtype - тип элементов, определяется первой частью
+        row_shape: tuple[int, ...] - форма одной строки, определяется первой частью
+    '''
+    MAGIC = b'\x93NUMPY\x01\x00'
+
+    path: Path
+    rows: int = 0
+    dtype: np.dtype = None
+    row_shape: tuple[int, ...] = None
+    _file = None
+    _temporary: Path = None
+    _header_size: int = 0
+
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+
+    def __enter__(self) -> "NpyWriter":
+        return self
+
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None: self.close()
+        else: self.abort()
+
+
+    @staticmethod
+    def header(dtype: np.dtype, shape: tuple[int, ...]) -> bytes:
+        description = {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': shape}
+        return repr(description).encode('latin1')
+
+
+    @classmethod
+    def extend(cls, path: str | Path, array: np.ndarray) -> None:
+        '''
+        Дописать строки array в конец существующего .npy на месте, без чтения и перезаписи старых данных.
+        numpy оставляет в заголовке место под рост первой оси, поэтому переписывается только заголовок.
+        Если файла нет, он создаётся.
+        '''
+        path = Path(path)
+        array = np.ascontiguousarray(array)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(path, array)
+            return
+
+        with path.open('r+b') as file:
+            version = np.lib.format.read_magic(file)
+            if version not in ((1, 0), (2, 0)):
+                raise AttributeError(f"Дозапись в .npy версии {version} не поддерживается!")
+
+            read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+            shape, fortran_order, dtype = read_header(file)
+            header_size = file.tell()
+
+            if fortran_order or dtype.hasobject or dtype != array.dtype or tuple(shape[1:]) != array.shape[1:]:
+                raise AttributeError(f"Нельзя дописать {array.dtype}{array.shape[1:]} в {path} ({dtype}{tuple(shape[1:])})!")
+
+            # Префикс: MAGIC, версия и длина заголовка (2 байта в версии 1.0, 4 байта в 2.0)
+            length = '<H' if version == (1, 0) else '<I'
+            prefix = len(cls.MAGIC) + struct.calcsize(length)
+            header = cls.header(dtype, (shape[0] + len(array), *shape[1:]))
+            if prefix + len(header) + 1 > header_size:
+                raise AttributeError(f"В заголовке {path} нет места для нового количества строк!")
+
+            file.seek(0, os.SEEK_END)
+            file.write(memoryview(array).cast('B'))
+
+            # Заголовок переписывается после данных: прерванная дозапись оставляет прежний массив
+            header += b' ' * (header_size - prefix - len(header) - 1) + b'\n'
+            file.seek(len(cls.MAGIC) - 2)
+            file.write(bytes(version) + struct.pack(length, len(header)) + header)
+
+
+    def append(self, batch: np.ndarray) -> None:
+        '''
+        Дописать строки batch в конец массива.
+        '''
+        batch = np.ascontiguousarray(batch)
+        if batch.dtype.hasobject:
+            raise AttributeError("Массив объектов нельзя записать по частям!")
+
+        if self._file is None:
+            self.dtype, self.row_shape = batch.dtype, batch.shape[1:]
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._temporary = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            self._file = self._temporary.open('wb')
+
+            # Место под заголовок с самым длинным количеством строк, с выравниванием на 64 байта, как в numpy
+            self._header_size = -(-(len(self.MAGIC) + 2 + len(self.header(self.dtype, (2**63, *self.row_shape))) + 1) // 64) * 64
+            self._file.write(b'\0' * self._header_size)
+
+        elif batch.dtype != self.dtype or batch.shape[1:] != self.row_shape:
+            raise AttributeError(f"Часть {batch.dtype}{batch.shape[1:]} не совпадает с массивом {self.dtype}{self.row_shape}!")
+
+        self._file.write(memoryview(batch).cast('B'))
+        self.rows += len(batch)
+
+
+    def close(self) -> Path:
+        '''
+        Записать итоговый заголовок и переименовать временный файл в path.
+        '''
+        if self._file is None:
+            raise AttributeError("В файл не записано ни одной строки!")
+
+        header = self.header(self.dtype, (self.rows, *self.row_shape))
+        header += b' ' * (self._header_size - len(self.MAGIC) - 2 - len(header) - 1) + b'\n'
+
+        self._file.seek(0)
+        self._file.write(self.MAGIC + struct.pack('<H', len(header)) + header)
+        self._file.close()
+        self._file = None
+
+        os.replace(self._temporary, self.path)
+        return self.path
+
+
+    def abort(self) -> None:
+        '''
+        Прервать запись и удалить временный файл.
+        '''
+        if self._file is None: return
+        self._file.close()
+        self._file = None
+        self._temporary.unlink(missing_ok=True)
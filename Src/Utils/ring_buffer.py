@@ -0,0 +1,52 @@
+import threading
+
+import numpy as np
+
+
+
+class RingBuffer:
+    '''
+    Кольцевой буфер фиксированного размера поверх numpy массива.
+    Запись и чтение защищены блокировкой, поэтому писать можно из рабочего потока, а читать из основного.
+
+    Attributes:
+        capacity: int - максимальное количество хранимых значений
+        count: int - сколько значений было записано за всё время, используется как версия буфера
+    '''
+    capacity: int
+    count: int
+
+
+    def __init__(self, capacity: int, dtype: np.dtype = np.float64):
+        self.capacity = capacity
+        self.count = 0
+        self.__data = np.zeros(capacity, dtype=dtype)
+        self.__lock = threading.Lock()
+
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+
+    def append(self, value) -> None:
+        with self.__lock:
+            self.__data[self.count % self.capacity] = value
+            self.count += 1
+
+
+    def values(self) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Копия хранимых значений в порядке записи.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray] - порядковые номера значений и сами значения
+        '''
+        with self.__lock:
+            count = self.count
+            start = count % self.capacity
+            if count <= self.capacity:
+                values = self.__data[:count].copy()
+            else:
+                values = np.concatenate((self.__data[start:], self.__data[:start]))
+
+        return np.arange(count - len(values), count), values
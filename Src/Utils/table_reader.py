@@ -0,0 +1,140 @@
+from pathlib import Path
+from typing import Callable, Iterator
+
+import numpy as np
+
+
+
+class TableReader:
+    '''
+    Чтение больших текстовых таблиц по частям.
+    Файл читается блоками строк, каждый блок разбирается векторизованным парсером numpy (np.loadtxt),
+    результат пишется в заранее выделенный массив нужного dtype, поэтому пиковая память - итоговый массив и один блок.
+
+    Attributes:
+        path: Path - путь до таблицы
+        delimiter: str - разделитель столбцов
+        skip_header: int - сколько строк пропустить в начале файла
+        skip_footer: int - сколько строк пропустить в конце файла
+        dtype: np.dtype - тип элементов результата
+        chunk_size: int - примерный размер читаемого блока в байтах
+    '''
+    CHUNK_SIZE = 32 * 2**20
+    SCAN_BLOCK = 2**24
+
+    path: Path
+    delimiter: str
+    skip_header: int
+    skip_footer: int
+    dtype: np.dtype
+    chunk_size: int
+
+
+    def __init__(self, path: str | Path, delimiter: str = ',', skip_header: int = 0, skip_footer: int = 0,
+                 dtype: str | np.dtype = np.float32, chunk_size: int = CHUNK_SIZE):
+        self.path = Path(path)
+        self.delimiter = delimiter
+        self.skip_header = int(skip_header)
+        self.skip_footer = int(skip_footer)
+        self.dtype = np.dtype(dtype)
+        self.chunk_size = chunk_size
+
+
+    def scan(self) -> tuple[int, int]:
+        '''
+        Быстрая оценка размера таблицы без разбора чисел: строки считаются по переводам строк
+        в бинарных блоках, столбцы - по первой строке данных.
+
+        Returns:
+            tuple[int, int] - верхняя оценка количества строк и количество столбцов
+        '''
+        return self.count_rows(), self.count_columns()
+
+
+    def count_rows(self) -> int:
+        '''
+        Верхняя оценка количества строк данных по количеству переводов строк.
+        '''
+        lines = 0
+        last = b'\n'
+        with self.path.open('rb') as file:
+            while block := file.read(self.SCAN_BLOCK):
+                lines += block.count(b'\n')
+                last = block[-1:]
+
+        # Последняя строка может быть без перевода строки
+        if last != b'\n': lines += 1
+
+        return max(lines - self.skip_header - self.skip_footer, 0)
+
+
+    def count_columns(self) -> int:
+        '''
+        Количество столбцов по первой непустой строке данных.
+        '''
+        with self.path.open('r') as file:
+            for _ in range(self.skip_header): file.readline()
+            for line in file:
+                if line.strip():
+                    return len(line.split(self.delimiter))
+
+        return 0
+
+
+    def parse(self, lines: list[str]) -> np.ndarray:
+        '''
+        Разобрать блок строк в двумерный массив.
+        Блоки с пропущенными значениями разбираются np.genfromtxt, чтобы пропуски стали nan, как раньше.
+        '''
+        try:
+            return np.loadtxt(lines, delimiter=self.delimiter, dtype=self.dtype, ndmin=2)
+        except ValueError:
+            return np.genfromtxt(lines, delimiter=self.delimiter, dtype=self.dtype, ndmin=2)
+
+
+    def chunks(self, progress: Callable[[float], None] = None) -> Iterator[np.ndarray]:
+        '''
+        Последовательно читает таблицу блоками.
+
+        Args:
+            progress: Callable[[float], None] - вызывается с долей прочитанного файла после каждого блока.
+        '''
+        size = max(self.path.stat().st_size, 1)
+
+        with self.path.open('r') as file:
+            for _ in range(self.skip_header): file.readline()
+
+            while lines := file.readlines(self.chunk_size):
+                chunk = self.parse(lines)
+                if progress: progress(min(file.buffer.tell() / size, 1.0))
+                if chunk.size: yield chunk
+
+
+    def read(self, progress: Callable[[float], None] = None) -> np.ndarray:
+        '''
+        Прочитать таблицу целиком.
+
+        Args:
+            progress: Callable[[float], None] - вызывается с долей прочитанного файла после каждого блока.
+
+        Returns:
+            np.ndarray - двумерный массив типа dtype
+        '''
+        rows, columns = self.scan()
+        result = np.empty((rows + self.skip_footer, columns), dtype=self.dtype)
+        filled = 0
+
+        for chunk in self.chunks(progress):
+            if chunk.shape[1] != columns:
+                raise AttributeError(f"Строки таблицы имеют разное количество столбцов: {chunk.shape[1]} и {columns}")
+
+            # Оценка из scan не бывает заниженной для обычных переводов строк, но файл мог измениться
+            if filled + len(chunk) > len(result):
+                grown = np.empty((filled + len(chunk), columns), dtype=self.dtype)
+                grown[:filled] = result[:filled]
+                result = grown
+
+            result[filled:filled + len(chunk)] = chunk
+            filled += len(chunk)
+
+        return result[:max(filled - self.skip_footer, 0)]
@@ -0,0 +1,77 @@
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from Src.Utils.table_reader import TableReader
+
+
+
+class TableStream:
+    '''
+    Ленивая таблица для данных, которые не помещаются в память.
+    При создании читается только начало файла, чтобы узнать количество столбцов, строки читаются
+    по частям при каждом проходе batches, поэтому в памяти одновременно находится только один блок.
+
+    Attributes:
+        reader: TableReader - чтение таблицы блоками
+        shape: tuple[None, int] - (None, количество столбцов), количество строк заранее неизвестно
+        dtype: np.dtype - тип элементов
+    '''
+    STREAM_CHUNK_SIZE = 4 * 2**20
+
+    reader: TableReader
+    shape: tuple[None, int]
+    dtype: np.dtype
+
+
+    def __init__(self, path: str | Path, delimiter: str = ',', skip_header: int = 0, skip_footer: int = 0,
+                 dtype: str | np.dtype = np.float32, chunk_size: int = STREAM_CHUNK_SIZE):
+        self.reader = TableReader(path, delimiter=delimiter, skip_header=skip_header, skip_footer=skip_footer,
+                                  dtype=dtype, chunk_size=chunk_size)
+        self.shape = (None, self.reader.count_columns())
+        self.dtype = self.reader.dtype
+
+
+    def __repr__(self) -> str:
+        return f"TableStream({self.reader.path}, shape={self.shape}, dtype={self.dtype})"
+
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+
+    def batches(self, batch_size: int) -> Iterator[np.ndarray]:
+        '''
+        Пройти по таблице батчами по batch_size строк, последний батч может быть меньше.
+        Последние skip_footer строк придерживаются до конца файла и отбрасываются.
+        '''
+        if batch_size <= 0:
+            raise AttributeError("Размер батча должен быть больше нуля!")
+
+        footer = self.reader.skip_footer
+        pending = np.empty((0, self.shape[1]), dtype=self.dtype)
+
+        for chunk in self.reader.chunks():
+            if chunk.shape[1] != self.shape[1]:
+                raise AttributeError(f"Строки таблицы имеют разное количество столбцов: {chunk.shape[1]} и {self.shape[1]}")
+
+            pending = np.concatenate((pending, chunk)) if len(pending) else chunk
+
+            # Отдаём только те строки, после которых точно останется skip_footer строк
+            ready = max(len(pending) - footer, 0) // batch_size * batch_size
+            for start in range(0, ready, batch_size):
+                yield pending[start:start + batch_size]
+            pending = pending[ready:]
+
+        pending = pending[:max(len(pending) - footer, 0)]
+        for start in range(0, len(pending), batch_size):
+            yield pending[start:start + batch_size]
+
+
+    def rows(self) -> int:
+        '''
+        Точное количество строк данных, требует полного прохода по файлу.
+        '''
+        return sum(len(batch) for batch in self.batches(2**16))
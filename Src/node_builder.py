@@ -1,14 +1,16 @@
+from concurrent.futures import Future
 from typing import Callable
-from itertools import chain
+import threading
 import traceback
 
 import dearpygui.dearpygui as dpg
-from keras import layers
 
-from Src.Enums.attr_type import AttrType
 from Src.Logging import logging, Logger
-from Src.Nodes import AbstractNode, InputLayerNode, LayerNode
-from Src.Config.node_list import NodeAnnotation, Parameter, ANode, Single
+from Src.Nodes import AbstractNode
+from Src.Graph import GraphScheduler, GraphModel, CompileWorker, WorkerResult, ArrayInfo
+from Src.Exceptions import CycleException, WorkerException
+from Src.Managers import TaskManager, Profiler
+from Src.Config.node_list import NodeAnnotation, input_node
 
 
 
@@ -19,9 +21,15 @@ class NodeBuilder:
     Attributes:
         factory: InputsFactory - фабрика конвертации аннотаций в инпуты
         layers_list: dict[str: AbstractNode] - список слоёв с параметрами, которые использовать в конструкторе
+        worker: CompileWorker - процесс для сборки графа вне процесса интерфейса
+        isolated: bool - собирать граф в процессе worker
     '''
     node_list: dict[str, dict[str, list[NodeAnnotation]]]
     delete_callback: Callable
+    scheduler: GraphScheduler = None
+    worker: CompileWorker
+    isolated: bool = False
+    _isolated_run: Future = None
     logger: Logger
 
 
@@ -35,6 +43,7 @@ class NodeBuilder:
         self.logger = logging()("nodes")
         self.delete_callback = delete_callback
         self.node_list = node_list
+        self.worker = CompileWorker()
 
 
     def build_list(self, parent: str | int) -> str | int:
@@ -112,61 +121,190 @@ class NodeBuilder:
         Returns:
             str | int - индетификатор новой ноды
         '''
-        # TODO: Сделать типизированную передачу у shape TableDataNode
-        layer = NodeAnnotation(
-            label="Input",
-            node_type=InputLayerNode, 
-            logic = InputLayerNode.create_input,
-            annotations = {
-                    "shape": Parameter(AttrType.INPUT, ANode[Single[object]]),
-                },
-            input=False,
-            output=LayerNode
-            )
-
-        node_id = self.build_node(layer, parent=parent)
+        node_id = self.build_node(input_node, parent=parent)
 
         return node_id
     
 
-    def compile_graph(self, start_nodes: list[AbstractNode]) -> set[AbstractNode]:
+    def compile_graph(self, start_nodes: list[AbstractNode], wait: bool = True) -> set[AbstractNode]:
         '''
-        Компиляция графа, от его концов. Работает через обход в ширину. Вызывает метод compile у нода, если все ноды, пришедшие к нему уже скомпилированы. Начинает с нодов, у которых нет входов.
+        Компиляция графа. Граф один раз превращается в DAG, после чего узлы выполняются в топологическом порядке.
+        Циклы обнаруживаются до выполнения первого узла. Фоновые узлы (данные, обучение, предсказание) выполняются
+        в пуле рабочих потоков TaskManager: все готовые узлы запускаются сразу, поэтому независимые ветки графа
+        выполняются параллельно. Результаты применяются в основном потоке через очередь TaskManager.
+
+        Args:
+            start_nodes: list[AbstractNode] - узлы без входящих связей.
+            wait: bool - дождаться конца сборки. Если False, то сборка продолжается в цикле отрисовки.
+
+        Returns:
+            set[AbstractNode] - скомпилированные узлы, при wait=False заполняется по ходу сборки.
         '''
+        if self.scheduler and not self.scheduler.finished:
+            self.logger.warning("Сборка графа уже выполняется.")
+            return set()
 
-        visited = set()
-        queue = start_nodes[:]
         self.logger.info("Началась сборка графа.")
-        status = True
+        TaskManager.reset_cancel()
+        Profiler.clear()
 
-        while queue:
-            self.logger.debug(f"Текущая очередь - {queue}")
-            current_node = queue.pop(0)
-            self.logger.debug(f"Текущая нода - {current_node}")
+        self.scheduler = GraphScheduler.from_editor(start_nodes)
+        self.logger.debug(f"Узлы графа - {self.scheduler.nodes}")
 
-            if all([dpg.get_item_user_data(dpg.get_item_parent(value)) in visited \
-                for value in chain(*current_node.incoming.values())]):
-                self.logger.debug("Нода подошла.")
+        try:
+            self.scheduler.order()
+        except CycleException as ex:
+            self.raise_error(str(ex), "Граф содержит цикл")
+            return set()
 
-                try:
-                    status = current_node.compile()
+        visited = self.scheduler.start(self.compile_node)
 
-                except Exception as ex:
-                    self.raise_error(ex)
-                    status = False
+        while wait and not self.scheduler.finished:
+            TaskManager.process_ui_queue(block=True)
 
-                if not status: break
-                
-                self.logger.debug(f"resulted OUTPUT - {current_node.OUTPUT}")
+        return visited
 
-                for attr_id in chain(*current_node.outgoing.values()):
-                    neightbor: AbstractNode = dpg.get_item_user_data(dpg.get_item_parent(attr_id))
-                    if neightbor not in queue:
-                        queue.append(neightbor)
 
-                visited.add(current_node)
+    @property
+    def running(self) -> bool:
+        '''
+        Идёт сборка графа: в этом процессе или в процессе сборки.
+        '''
+        return bool(self.scheduler and not self.scheduler.finished) or \
+            bool(self._isolated_run and not self._isolated_run.done())
 
-        return visited
+
+    def compile_isolated(self, graph: GraphModel, wait: bool = True) -> Future | None:
+        '''
+        Сборка графа в процессе CompileWorker. Модели Keras и массивы выходов остаются в нём, в интерфейс
+        возвращаются статусы узлов и небольшие значения (числа, формы). Массив, который узел показывает,
+        он запрашивает через CompileWorker.fetch (через разделяемую память). Узлы остаются помеченными как изменённые,
+        поэтому обычная сборка выполнит их заново в этом процессе.
+
+        Args:
+            graph: GraphModel - граф из редактора (NodeEditor.to_graph), идентификаторы узлов - их dpg.node.
+            wait: bool - дождаться конца сборки.
+        '''
+        if self.running:
+            self.logger.warning("Сборка графа уже выполняется.")
+            return None
+
+        try:
+            GraphScheduler(graph.dependencies()).order()
+        except CycleException as ex:
+            self.raise_error(str(ex), "Граф содержит цикл")
+            return None
+
+        self.logger.info("Началась сборка графа в отдельном процессе.")
+        nodes: dict[int, AbstractNode] = {graph_node.id: dpg.get_item_user_data(graph_node.id) for graph_node in graph.nodes}
+        for node in nodes.values(): node.set_busy(True)
+        applied = threading.Event()
+
+        def on_result(future: Future):
+            applied.set()
+            for node in nodes.values(): node.set_busy(False)
+
+            if future.exception():
+                self.raise_error(future.exception(), "Ошибка процесса сборки")
+                return
+
+            self.apply_result(nodes, future.result())
+
+        self._isolated_run = TaskManager.submit(self.worker.run, graph, callback=on_result)
+
+        while wait and not applied.is_set():
+            TaskManager.process_ui_queue(block=True)
+
+        return self._isolated_run
+
+
+    def apply_result(self, nodes: dict[int, AbstractNode], result: WorkerResult):
+        '''
+        Показать результат сборки в процессе CompileWorker на узлах редактора. Выходы-массивы (ArrayInfo)
+        и непереданные выходы (None) не присваиваются: OUTPUT узла не подменяется описанием массива.
+        '''
+        for node_id, node in nodes.items():
+            node.dirty = True
+
+            if node_id in result.errors:
+                node.raise_error(result.errors[node_id], "Ошибка в процессе сборки")
+                continue
+            if node_id not in result.visited: continue
+
+            outputs = result.outputs.get(node_id, {})
+            for name, value in outputs.items():
+                if value is None or isinstance(value, ArrayInfo): continue
+                # Выходы-свойства (например, X_train узла датасета) вычисляются из OUTPUT и не присваиваются
+                attribute = getattr(type(node), name, None)
+                if isinstance(attribute, property) and attribute.fset is None: continue
+                setattr(node, name, value)
+            node.default_theme()
+
+            try:
+                node.show_worker_result(outputs, lambda name, node_id=node_id: self.worker.fetch(node_id, name))
+            except WorkerException as ex:
+                self.logger.warning(f"Не удалось получить выход узла {node_id} из процесса сборки: {ex}")
+
+        self.logger.info(f"Граф выполнен в процессе сборки за {sum(result.timings.values()):.4f} с, "
+                         f"узлов: {len(result.visited)}/{len(nodes)}, память процесса: {result.memory / 2**20:.0f} МБ")
+
+
+    def cancel_compilation(self):
+        '''
+        Остановить сборку графа. Фоновые узлы прерываются между батчами, новые узлы не запускаются.
+        Сборка в отдельном процессе прерывается завершением процесса.
+        '''
+        if self.scheduler and not self.scheduler.finished:
+            self.logger.info("Сборка графа отменена пользователем.")
+            TaskManager.cancel()
+
+        if self._isolated_run and not self._isolated_run.done():
+            self.logger.info("Сборка графа в отдельном процессе отменена пользователем.")
+            self.worker.stop()
+
+
+    def compile_node(self, node: AbstractNode, done: Callable[[bool], None]):
+        '''
+        Компиляция одного узла графа. Фоновые узлы выполняют логику в рабочем потоке.
+
+        Args:
+            node: AbstractNode - узел для компиляции.
+            done: Callable[[bool], None] - вызывается со статусом, когда узел скомпилирован.
+        '''
+        self.logger.debug(f"Текущая нода - {node}")
+
+        if TaskManager.cancelled():
+            node.raise_error("Сборка графа отменена пользователем", "Выполнение отменено")
+            return done(False)
+
+        try:
+            task = node.prepare()
+        except Exception as ex:
+            self.raise_error(ex)
+            return done(False)
+
+        # Узел не изменился: прошлый OUTPUT актуален, ошибка прошлой сборки (отмена, формы слоёв) снимается
+        if task is None:
+            node.default_theme()
+            return done(True)
+
+        if not node.background:
+            status = node.run(task)
+            self.logger.debug(f"resulted OUTPUT - {node.OUTPUT}")
+            return done(status)
+
+        def on_result(future: Future):
+            node.set_busy(False)
+            done(node.finish(task, *self.__result(future)))
+
+        node.set_busy(True)
+        TaskManager.submit(node.execute, task, callback=on_result)
+
+
+    @staticmethod
+    def __result(future: Future) -> tuple[object, Exception | None]:
+        if future.exception(): return None, future.exception()
+        return future.result(), None
     
 
     def raise_error(self, error_message: str, error_message_type: str = "Неизвестная ошибка"):
@@ -174,7 +312,7 @@ class NodeBuilder:
                         no_resize=True, no_move=True) as error_window:
             dpg.add_text("Произошла непредвиденная ошибка, сообщите пожалуйста разработчикам.")
             dpg.add_text(f"{error_message_type}:")
-            dpg.add_text(error_message)
+            dpg.add_text(str(error_message))
             dpg.add_text(traceback.format_exc())
             dpg.add_button(label="Close", callback=lambda: dpg.configure_item(error_window, show=False))
 
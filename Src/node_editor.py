@@ -5,11 +5,15 @@ import sys
 
 import dearpygui.dearpygui as dpg
 
-from Src.Nodes import AbstractNode, node_link
+from Src.Nodes import AbstractNode, LayerNode, node_link
 from Src.node_builder import NodeBuilder
 from Src.Logging import logging, Logger
-from Src.Config.node_list import node_list, NodeAnnotation
+from Src.Config.node_list import node_list, node_catalog, NodeAnnotation
 from Src.Config.Annotations import ANode
+from Src.Graph import GraphModel, GraphNode, GraphLink, GraphScheduler, ShapeInference
+from Src.Exceptions import ShapeException
+from Src.Managers import TaskManager, Profiler, MemoryBudget
+from Src.Utils import DatasetStore
 
 
 
@@ -25,6 +29,10 @@ class NodeEditor:
     __stage_tag: str | int
     __group_tag: str | int
     __start_nodes: list[AbstractNode]
+    # Граф загружается из файла: связи восстанавливаются как сохранены, без проверки форм
+    __loading: bool = False
+    # Узлы, отмеченные ошибкой форм при последней проверке
+    __shape_marked: frozenset[int] = frozenset()
 
 
     def __init__(self, *args, **kwargs):
@@ -58,8 +66,38 @@ class NodeEditor:
                         input_id = self.builder.build_input("node_editor")
                         self.__start_nodes.append(dpg.get_item_user_data(input_id))
 
-                    dpg.add_button(label="Собрать модель", 
-                                   callback = lambda: self.builder.compile_graph(self.__start_nodes))
+                    with dpg.group(horizontal=True):
+                        dpg.add_button(label="Собрать модель", callback = self.compile)
+                        dpg.add_button(label="Остановить", callback = self.builder.cancel_compilation)
+                        dpg.add_button(label="Сохранить граф", callback = lambda: dpg.show_item(save_dialog))
+                        dpg.add_button(label="Открыть граф", callback = lambda: dpg.show_item(load_dialog))
+                        dpg.add_input_int(label="Потоки", default_value=TaskManager.max_workers, min_value=1,
+                                          min_clamped=True, width=100,
+                                          callback=lambda _, app_data: TaskManager.set_max_workers(app_data))
+                        dpg.add_input_int(label="Память, МБ", default_value=MemoryBudget.max_bytes // 2**20, min_value=0,
+                                          min_clamped=True, width=100, step=256,
+                                          callback=lambda _, app_data: MemoryBudget.set_max_bytes(app_data * 2**20))
+                        dpg.add_checkbox(label="Без сети", default_value=DatasetStore.offline,
+                                         callback=lambda _, app_data: DatasetStore.set_offline(app_data))
+                        dpg.add_checkbox(label="Отдельный процесс", default_value=self.builder.isolated,
+                                         callback=lambda _, app_data: setattr(self.builder, "isolated", app_data))
+                        dpg.add_button(label="Перезапустить процесс", callback = self.builder.worker.stop)
+                        dpg.add_button(label="Экспорт трейса", callback = lambda: dpg.show_item(trace_dialog))
+
+        with dpg.file_dialog(directory_selector=False, show=False, modal=True, width=1400, height=800,
+                             default_filename="graph", 
+                             callback=lambda _, app_data: self.save(app_data['file_path_name'])) as save_dialog:
+            dpg.add_file_extension(".json")
+
+        with dpg.file_dialog(directory_selector=False, show=False, modal=True, width=1400, height=800,
+                             callback=lambda _, app_data: self.load(app_data['file_path_name'])) as load_dialog:
+            dpg.add_file_extension(".json")
+
+        # Трейс последней сборки открывается в chrome://tracing или ui.perfetto.dev
+        with dpg.file_dialog(directory_selector=False, show=False, modal=True, width=1400, height=800,
+                             default_filename="trace",
+                             callback=lambda _, app_data: Profiler.export_trace(app_data['file_path_name'])) as trace_dialog:
+            dpg.add_file_extension(".json")
         
         self.on_viewport_resize_callback()
 
@@ -132,6 +170,14 @@ class NodeEditor:
             self.logger.warning(f"Некорректная попытка связывания узлов: {node_out} -> {node_in}({dpg.get_item_label(app_data[1])}) связей не может быть больше 1!")
             return
 
+        # Проверка форм слоёв: связь, после которой формы становятся несовместимыми, не создаётся
+        if not self.__loading and isinstance(node_in, LayerNode):
+            link = GraphLink(node_out.node_tag, dpg.get_item_label(app_data[0]), node_in.node_tag, dpg.get_item_label(app_data[1]))
+            errors = self.shape_errors(link, node_out, node_in)
+            if errors:
+                self.logger.warning(f"Некорректная попытка связывания узлов: {node_out} -> {node_in}({dpg.get_item_label(app_data[1])}) - формы несовместимы: {'; '.join(errors.values())}")
+                return
+
         self.logger.debug(f"Node_out - {dpg.get_item_label(dpg.get_item_parent(app_data[0]))}")
 
         link_id = dpg.add_node_link(app_data[0], app_data[1], parent=sender, user_data=node_link(app_data[0], app_data[1]))
@@ -150,6 +196,7 @@ class NodeEditor:
 
         node_out.outgoing[app_data[0]] = data_out
         node_in.incoming[app_data[1]] = data_in
+        node_in.invalidate()
 
         if node_in in self.__start_nodes: self.__start_nodes.remove(node_in)
 
@@ -189,6 +236,7 @@ class NodeEditor:
 
         if not node_out.outgoing[attr_outgoing]: del node_out.outgoing[attr_outgoing]
         if not node_in.incoming[attr_incoming]: del node_in.incoming[attr_incoming]
+        node_in.invalidate()
 
         if not node_in.incoming: self.__start_nodes.append(node_in)
 
@@ -231,6 +279,176 @@ class NodeEditor:
         self.logger.debug(f"Start nodes: {self.__start_nodes}")
 
 
+    def editor_nodes(self) -> list[AbstractNode]:
+        '''
+        Все узлы редактора.
+        '''
+        return [dpg.get_item_user_data(node_id) for node_id in dpg.get_item_children("node_editor", slot=1)]
+
+
+    @staticmethod
+    def upstream(*nodes: AbstractNode) -> list[AbstractNode]:
+        '''
+        Узлы nodes и все их предки.
+        '''
+        found, stack = set(nodes), list(nodes)
+        while stack:
+            for node in stack.pop().predecessors():
+                if node not in found:
+                    found.add(node)
+                    stack.append(node)
+        return list(found)
+
+
+    def known_shapes(self, nodes: list[AbstractNode] = None) -> dict[int, tuple]:
+        '''
+        Формы примеров, уже загруженных узлами данных (ShapeNode.shape). Формы изменённых узлов устарели и не учитываются.
+        '''
+        shapes = {}
+        for node in nodes or self.editor_nodes():
+            shape = getattr(node, "shape", None)
+            if isinstance(shape, tuple) and not node.dirty: shapes[node.node_tag] = shape
+        return shapes
+
+
+    def shape_errors(self, link: GraphLink = None, node_out: AbstractNode = None, node_in: AbstractNode = None) -> dict[int, str]:
+        '''
+        Несовместимые формы слоёв графа. Для новой связи node_out -> node_in проверяется только узел node_in
+        по подграфу из предков обоих узлов, за один проход: остальные слои проверяются при сборке.
+        '''
+        if link is None:
+            inference = ShapeInference(self.to_graph(), self.known_shapes())
+            inference.run()
+            return inference.errors
+
+        nodes = self.upstream(node_out, node_in)
+        graph = self.to_graph(nodes)
+        graph.links.append(link)
+
+        inference = ShapeInference(graph, self.known_shapes(nodes))
+        inference.run()
+        return {link.target: inference.errors[link.target]} if link.target in inference.errors else {}
+
+
+    def check_shapes(self) -> bool:
+        '''
+        Проверить формы слоёв до сборки, чтобы не загружать данные для заведомо некорректного графа.
+        Узлы с несовместимыми формами помечаются ошибкой, с исправленных узлов отметка снимается.
+        '''
+        errors = self.shape_errors()
+
+        for node_id in self.__shape_marked - errors.keys():
+            if dpg.does_item_exist(node_id): dpg.get_item_user_data(node_id).default_theme()
+        self.__shape_marked = frozenset(errors)
+
+        for node_id, error in errors.items():
+            node: AbstractNode = dpg.get_item_user_data(node_id)
+            node.default_theme()
+            node.raise_error(ShapeException(error), "Несовместимые формы слоёв")
+
+        return not errors
+
+
+    def compile(self):
+        '''
+        Собрать граф: в этом процессе или, если включено, в процессе сборки, чтобы память Keras не копилась в интерфейсе.
+        Граф с несовместимыми формами слоёв не собирается.
+        '''
+        if not self.check_shapes(): return
+
+        if self.builder.isolated:
+            self.builder.compile_isolated(self.to_graph(), wait=False)
+        else:
+            self.builder.compile_graph(self.__start_nodes, wait=False)
+
+
+    def to_graph(self, nodes: list[AbstractNode] = None) -> GraphModel:
+        '''
+        Описание графа в редакторе: узлы, введённые значения параметров, положения и связи.
+        Если переданы nodes, описываются только они, nodes должны содержать всех своих предков.
+        '''
+        graph = GraphModel()
+
+        for node in nodes or self.editor_nodes():
+            node_id = node.node_tag
+            graph.nodes.append(GraphNode(node_id, dpg.get_item_label(node_id), 
+                                         node.collect_values(links=False), list(dpg.get_item_pos(node_id))))
+
+            for attr_in, attrs_out in node.incoming.items():
+                for attr_out in attrs_out:
+                    graph.links.append(GraphLink(GraphScheduler.owner(attr_out).node_tag, dpg.get_item_label(attr_out),
+                                                 node_id, dpg.get_item_label(attr_in)))
+
+        return graph
+
+
+    def from_graph(self, graph: GraphModel):
+        '''
+        Заменить граф в редакторе. Узлы создаются через NodeBuilder.build_node, связи - через link_callback,
+        поэтому проходят те же проверки, что и при ручном связывании (кроме проверки форм: сохранённый граф восстанавливается как есть).
+        Всё создаётся под dpg.mutex, так что граф появляется целиком в следующем кадре.
+        '''
+        unknown = {node.label for node in graph.nodes} - node_catalog.keys()
+        if unknown:
+            raise AttributeError(f"Неизвестные узлы в графе: {unknown}")
+
+        with dpg.mutex():
+            self.clear()
+            nodes: dict[int, AbstractNode] = {}
+
+            for graph_node in graph.nodes:
+                node_id = self.builder.build_node(node_catalog[graph_node.label], parent="node_editor")
+                dpg.set_item_pos(node_id, graph_node.position)
+
+                node: AbstractNode = dpg.get_item_user_data(node_id)
+                for name, value in graph_node.params.items():
+                    attribute = node.attribute(name)
+                    if attribute is None or not node.annotations[name].set_value(attribute, value):
+                        self.logger.warning(f"Не удалось установить значение {name}={value!r} узла {graph_node.label}")
+
+                nodes[graph_node.id] = node
+                self.__start_nodes.append(node)
+
+            self.__loading = True
+            try:
+                for link in graph.links:
+                    attr_out = nodes[link.source].attribute(link.output)
+                    attr_in = nodes[link.target].attribute(link.input)
+                    if attr_out is None or attr_in is None or not self.link_callback("node_editor", (attr_out, attr_in)):
+                        self.logger.warning(f"Не удалось восстановить связь {link}")
+            finally:
+                self.__loading = False
+
+        self.logger.info(f"Загружен граф: узлов {len(graph.nodes)}, связей {len(graph.links)}")
+
+
+    def clear(self):
+        '''
+        Удалить все узлы и связи из редактора.
+        '''
+        dpg.delete_item("node_editor", children_only=True)
+        self.__start_nodes.clear()
+
+
+    def save(self, path: str | Path):
+        '''
+        Сохранить граф в JSON.
+        '''
+        self.to_graph().save(path)
+        self.logger.info(f"Граф сохранён в {path}")
+
+
+    def load(self, path: str | Path):
+        '''
+        Загрузить граф из JSON вместо текущего.
+        '''
+        if self.builder.running:
+            self.logger.warning("Нельзя загрузить граф во время сборки.")
+            return
+
+        self.from_graph(GraphModel.load(path))
+
+
     def show(self, parent: str | int):
         '''
         Отобразить элемент.
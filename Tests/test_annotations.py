@@ -147,6 +147,39 @@ class test_annotations(DPGUnitTest):
         assert annotation.set(combo_id, 123) == False
 
         assert TestEnum(annotation.get(combo_id)) == TestEnum.SECOND
+
+
+    def test_AEnumList(self):
+        annotation = AEnumList[TestEnum]
+
+        group_id = annotation.build(parent=self.parent, label="Enum list")
+
+        assert isinstance(group_id, int | str)
+        assert group_id in dpg.get_all_items()
+
+        assert annotation.get(group_id) == []
+
+        assert annotation.set(group_id, [TestEnum.SECOND, "first"]) == True
+        assert annotation.get(group_id) == ["first", "second"]
+
+        assert annotation.set(group_id, ["Invalid value"]) == False
+        assert annotation.set(group_id, "first") == False
+
+        assert annotation.get(group_id) == ["first", "second"]
+
+
+    def test_APlot(self):
+        plot_id = APlot.build(parent=self.parent)
+
+        assert isinstance(plot_id, int | str)
+        assert plot_id in dpg.get_all_items()
+
+        assert APlot.get(plot_id) == [[], []]
+
+        assert APlot.set(plot_id, ([0, 1], [0.5, 0.25])) == True
+        assert APlot.get(plot_id) == [[0.0, 1.0], [0.5, 0.25]]
+
+        assert APlot.set(plot_id, [0.5, 0.25]) == False
     
 
     
\ No newline at end of file
@@ -0,0 +1,70 @@
+import unittest
+import tempfile
+import os
+from pathlib import Path
+
+import numpy as np
+
+from Src.Utils import ArrayCache
+
+
+
+class test_ArrayCache(unittest.TestCase):
+    '''
+    Проверка дискового кэша массивов
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_directory = ArrayCache.directory
+        ArrayCache.directory = Path(self.directory.name) / "cache"
+
+        self.path = Path(self.directory.name) / "table.csv"
+        self.path.write_text("1,2\n3,4\n")
+        self.builds = 0
+
+
+    def tearDown(self):
+        ArrayCache.directory = self.cache_directory
+        self.directory.cleanup()
+
+
+    def build(self):
+        self.builds += 1
+        return np.genfromtxt(self.path, delimiter=',', ndmin=2)
+
+
+    def test_hit(self):
+        first = ArrayCache.get("table", self.path, self.build, delimiter=',')
+        second = ArrayCache.get("table", self.path, self.build, delimiter=',')
+
+        assert self.builds == 1
+        assert isinstance(second, np.memmap)
+        assert np.array_equal(first, second)
+
+
+    def test_params(self):
+        ArrayCache.get("table", self.path, self.build, delimiter=',')
+        ArrayCache.get("table", self.path, self.build, delimiter=';')
+        ArrayCache.get("images", self.path, self.build, delimiter=',')
+
+        assert self.builds == 3
+
+
+    def test_source_changed(self):
+        ArrayCache.get("table", self.path, self.build)
+
+        self.path.write_text("1,2\n3,4\n5,6\n")
+        os.utime(self.path, ns=(0, 10**9))
+        result = ArrayCache.get("table", self.path, self.build)
+
+        assert self.builds == 2
+        assert result.shape == (3, 2)
+
+
+    def test_clear(self):
+        ArrayCache.get("table", self.path, self.build)
+        ArrayCache.clear()
+        ArrayCache.get("table", self.path, self.build)
+
+        assert self.builds == 2
@@ -0,0 +1,73 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from Src.Utils import ArrayValidator
+
+
+
+class test_ArrayValidator(unittest.TestCase):
+    '''
+    Проверка поиска пропущенных значений
+    '''
+
+    def setUp(self):
+        ArrayValidator.clear()
+        self.chunk_elements = ArrayValidator.CHUNK_ELEMENTS
+        ArrayValidator.CHUNK_ELEMENTS = 16
+
+
+    def tearDown(self):
+        ArrayValidator.CHUNK_ELEMENTS = self.chunk_elements
+        ArrayValidator.clear()
+
+
+    def test_has_nan(self):
+        array = np.zeros((100, 3), dtype=np.float32)
+        assert not ArrayValidator.has_nan(array)
+
+        other = array.copy()
+        other[97, 2] = np.nan
+        assert ArrayValidator.has_nan(other)
+        assert ArrayValidator.has_nan(other[90:])
+        assert not ArrayValidator.has_nan(other[:90])
+
+
+    def test_integer(self):
+        assert not ArrayValidator.has_nan(np.arange(10))
+        assert not ArrayValidator.has_nan(np.zeros(10, dtype=bool))
+
+        with self.assertRaises(AttributeError):
+            ArrayValidator.has_nan(np.array([1, None], dtype=object))
+
+
+    def test_cache(self):
+        array = np.zeros((100, 3))
+        scans = []
+        scan = ArrayValidator.scan
+        ArrayValidator.scan = classmethod(lambda cls, data: scans.append(data) or scan(data))
+
+        try:
+            ArrayValidator.has_nan(array)
+            ArrayValidator.has_nan(array)
+            ArrayValidator.has_nan(array.copy())
+        finally:
+            ArrayValidator.scan = scan
+
+        assert len(scans) == 2
+
+
+    def test_memmap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "data.npy"
+            np.save(path, np.ones((50, 2)))
+
+            first = np.load(path, mmap_mode='r')
+            assert not ArrayValidator.has_nan(first)
+
+            second = np.load(path, mmap_mode='r')
+            assert ArrayValidator.key(first) == ArrayValidator.key(second)
+            assert ArrayValidator.key(second[10:]) != ArrayValidator.key(second)
+            del first, second
@@ -0,0 +1,34 @@
+import unittest
+import json
+import subprocess
+import sys
+
+from Benchmarks.__main__ import compare, medians
+
+
+
+class test_Benchmarks(unittest.TestCase):
+    '''
+    Проверка замеров редактора и сравнения результатов
+    '''
+
+    def test_compare(self):
+        baseline = {"build_list": {"median": 1.0, "min": 1.0, "max": 1.0},
+                    "compile_graph": {"10": {"cold": {"median": 2.0}}}}
+        current = {"build_list": {"median": 1.1},
+                   "compile_graph": {"10": {"cold": {"median": 3.0}}}, "environment": {"python": "3.12"}}
+
+        assert medians(current) == {"build_list": 1.1, "compile_graph/10/cold": 3.0}
+        regressions = compare(current, baseline, threshold=1.2)
+        assert len(regressions) == 1 and regressions[0].startswith("compile_graph/10/cold")
+
+
+    def test_measure(self):
+        # Контекст DearPyGui создаётся в отдельном процессе, чтобы не влиять на остальные тесты
+        completed = subprocess.run([sys.executable, "-m", "Benchmarks.editor", "--repeat", "1", "--sizes", "10"],
+                                   capture_output=True, text=True, check=True)
+        results = json.loads(completed.stdout)
+
+        assert results["build_list"]["median"] > 0
+        assert "Dense" in results["build_node"] and "Input" in results["build_node"]
+        assert set(results["compile_graph"]["10"]) == {"cold", "warm"}
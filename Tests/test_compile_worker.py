@@ -0,0 +1,74 @@
+import unittest
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from Src.Graph import CompileWorker, SharedArray, ArrayInfo, GraphLink
+from Src.Exceptions import WorkerException
+from Tests.test_headless_runner import regression_graph
+
+
+
+class test_CompileWorker(unittest.TestCase):
+    '''
+    Проверка сборки графа в отдельном процессе
+    '''
+
+    def test_shared_array(self):
+        array = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+        shared = SharedArray.share(array)
+        received = shared.receive()
+
+        assert np.array_equal(received, array) and received.dtype == np.float32
+        # Блок освобождается после получения
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=shared.name)
+
+
+    def test_run(self):
+        worker = CompileWorker(max_runs=2)
+        try:
+            result = worker.run(regression_graph())
+            pid = worker.process.pid
+
+            assert result.visited == set(range(1, 8)) and not result.errors
+            # Массивы остаются в процессе сборки, в интерфейс передаются форма и тип
+            assert result.outputs[7]["OUTPUT"] == ArrayInfo((10000, 1), "<f4")
+            assert result.outputs[6]["history"].shape == (1,)
+
+            predicted = worker.fetch(7)
+            assert predicted.shape == (10000, 1) and predicted.dtype == np.float32
+            with self.assertRaises(WorkerException):
+                worker.fetch(5)
+            # Модели остаются в процессе сборки
+            assert result.outputs[5]["OUTPUT"] is None
+            assert result.memory > 0
+
+            worker.run(regression_graph())
+            assert worker.process.pid == pid
+
+            # После max_runs сборок процесс перезапускается
+            worker.run(regression_graph())
+            assert worker.process.pid != pid
+        finally:
+            worker.stop()
+
+        assert not worker.alive
+
+
+    def test_errors(self):
+        graph = regression_graph()
+        graph.node(6).params["epochs"] = 0
+        graph_cycle = regression_graph()
+        graph_cycle.links.append(GraphLink(7, "OUTPUT", 4, "INPUT"))
+
+        worker = CompileWorker()
+        try:
+            result = worker.run(graph)
+            assert "AttributeError" in result.errors[6] and 7 not in result.visited
+
+            with self.assertRaises(WorkerException):
+                worker.run(graph_cycle)
+        finally:
+            worker.stop()
@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from Src.Nodes.data_pipeline import make_dataset
+from Src.Utils import TableStream
+
+
+
+class test_DataPipeline(unittest.TestCase):
+    '''
+    Проверка входного конвейера tf.data
+    '''
+
+    def setUp(self):
+        self.x = np.arange(20, dtype=np.float32).reshape(10, 2)
+        self.y = np.arange(10, dtype=np.float32).reshape(10, 1)
+
+
+    def test_batches(self):
+        batches = [(x.numpy(), y.numpy()) for x, y in make_dataset(self.x, self.y, batch_size=4)]
+
+        assert [len(x) for x, _ in batches] == [4, 4, 2]
+        assert np.array_equal(np.concatenate([x for x, _ in batches]), self.x)
+        assert np.array_equal(np.concatenate([y for _, y in batches]), self.y)
+
+
+    def test_shuffle(self):
+        dataset = make_dataset(self.x, self.y, batch_size=3, shuffle_buffer=10, cache=True)
+
+        for _ in range(2):
+            x = np.concatenate([x.numpy() for x, _ in dataset])
+            y = np.concatenate([y.numpy() for _, y in dataset])
+
+            assert x.shape == self.x.shape
+            assert sorted(x[:, 0].tolist()) == self.x[:, 0].tolist()
+
+        pairs = [(x[1], y[0]) for x, y in zip(*(batch.numpy() for batch in next(iter(dataset))))]
+        assert all(x == 2 * y + 1 for x, y in pairs)
+
+
+    def test_shapes(self):
+        dataset = make_dataset(self.x, self.y, batch_size=4)
+
+        assert dataset.element_spec[0].shape.as_list() == [None, 2]
+        assert dataset.element_spec[1].shape.as_list() == [None, 1]
+
+
+    def test_batch_size(self):
+        with self.assertRaises(AttributeError):
+            make_dataset(self.x, self.y, batch_size=0)
+
+
+    def test_stream(self):
+        x = TableStream("./Tests/X.txt")
+        y = TableStream("./Tests/y.txt")
+
+        batches = list(make_dataset(x, y, batch_size=512, shuffle_buffer=1024))
+        predict = list(make_dataset(x, batch_size=512))
+
+        assert sum(len(x_batch) for x_batch, _ in batches) == 10000
+        assert batches[0][0].shape[1:] == (2,)
+        assert sum(len(x_batch) for x_batch in predict) == 10000
+
+
+    def test_stream_length(self):
+        import tensorflow as tf
+
+        with tempfile.TemporaryDirectory() as directory:
+            np.savetxt(Path(directory) / "x.csv", self.x, delimiter=',')
+            np.savetxt(Path(directory) / "y.csv", self.y[:6], delimiter=',')
+
+            # Y короче X на целое число батчей: обучение не должно молча идти на части данных
+            dataset = make_dataset(TableStream(Path(directory) / "x.csv"), TableStream(Path(directory) / "y.csv"), batch_size=2)
+            with self.assertRaisesRegex(tf.errors.UnknownError, "Размерности X и Y не совпадают!"):
+                list(dataset)
+
+
+    def test_fit_shuffle(self):
+        import keras
+        from unittest import mock
+        from Src.Nodes import FitNode
+
+        model = keras.Sequential([keras.Input((2,)), keras.layers.Dense(1)])
+        model.compile(loss="mse")
+
+        # Без конвейера массивы перемешиваются самим Keras, как до появления shuffle_buffer
+        with mock.patch.object(keras.Model, "fit") as fit:
+            FitNode.fit(model, self.x, self.y, epochs=1)
+        assert fit.call_args.kwargs["shuffle"] is True
@@ -0,0 +1,63 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from Src.Exceptions import NetworkException
+from Src.Utils import DatasetStore
+from Src.Nodes.dataset_node import DatasetNode
+
+
+
+class test_DatasetStore(unittest.TestCase):
+    '''
+    Проверка локального зеркала датасетов
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.defaults = DatasetStore.directory, DatasetStore.offline, DatasetStore.check_connection
+        DatasetStore.directory = Path(self.directory.name)
+        self.arrays = (np.arange(60, dtype=np.uint8).reshape(10, 3, 2), np.arange(10),
+                       np.zeros((4, 3, 2), np.uint8), np.ones(4))
+
+
+    def tearDown(self):
+        DatasetStore.directory, DatasetStore.offline, DatasetStore.check_connection = self.defaults
+        self.directory.cleanup()
+
+
+    def test_load(self):
+        DatasetStore.save("mnist", self.arrays)
+
+        assert DatasetStore.exists("mnist") and not DatasetStore.exists("cifar10")
+        assert list(DatasetStore.path("mnist").glob("*.tmp")) == []
+
+        for loaded, array in zip(DatasetStore.load("mnist"), self.arrays):
+            assert isinstance(loaded, np.memmap)
+            assert np.array_equal(loaded, array)
+
+
+    def test_objects(self):
+        sequences = np.array([[1, 2, 3], [4]], dtype=object)
+        DatasetStore.save("imdb", (sequences, np.arange(2), sequences, np.arange(2)))
+
+        X_train, y_train, _, _ = DatasetStore.load("imdb")
+        assert X_train[0] == [1, 2, 3] and isinstance(y_train, np.memmap)
+
+
+    def test_no_probe(self):
+        def fail(): raise AssertionError("сеть не должна проверяться")
+        DatasetStore.check_connection = staticmethod(fail)
+        DatasetStore.save("mnist", self.arrays)
+
+        dataset = DatasetNode.open_data("mnist")
+        assert isinstance(dataset.X_train, np.memmap)
+        assert dataset.shape == (10, 3, 2)
+
+
+    def test_offline(self):
+        DatasetStore.offline = True
+        with self.assertRaises(NetworkException):
+            DatasetStore.get("mnist")
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+import keras
+
+from Src.Nodes import EvaluateNode, MetricNode
+
+
+
+class test_EvaluateNode(unittest.TestCase):
+    '''
+    Проверка вычисления нескольких метрик за один проход
+    '''
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.y_true = rng.integers(0, 2, (1000, 1)).astype(np.float32)
+        self.y_pred = rng.random((1000, 1)).astype(np.float32)
+
+
+    def test_metrics(self):
+        metrics = ["mean_squared_error", "binary_accuracy", "auc", "precision"]
+        results = EvaluateNode.evaluate(self.y_true, self.y_pred, metrics, batch_size=128, model=[], x=[])
+
+        assert list(results) == metrics
+        # Результат по батчам совпадает с вычислением по всему массиву
+        for name in metrics:
+            assert np.isclose(results[name], MetricNode.calculate(self.y_true, self.y_pred, name)[0], rtol=1e-3)
+
+
+    def test_errors(self):
+        with self.assertRaises(AttributeError):
+            EvaluateNode.evaluate(self.y_true, self.y_pred, [])
+        with self.assertRaises(AttributeError):
+            EvaluateNode.evaluate(self.y_true, self.y_pred[:10], ["auc"])
+        with self.assertRaises(AttributeError):
+            EvaluateNode.evaluate([], self.y_pred, ["auc"])
+
+
+    def test_model(self):
+        x = np.random.rand(1000, 3).astype(np.float32)
+        model = keras.Sequential([keras.Input((3,)), keras.layers.Dense(1, activation="sigmoid")])
+
+        with self.assertRaises(AttributeError):
+            EvaluateNode.evaluate(self.y_true, model=model, x=x)
+
+        model.compile(loss="binary_crossentropy", metrics=["binary_accuracy"])
+        compiled = EvaluateNode.evaluate(self.y_true, model=model, x=x, batch_size=256)
+        assert set(compiled) == {"loss", "binary_accuracy"}
+
+        selected = EvaluateNode.evaluate(self.y_true, metrics=["auc", "mean_squared_error"], model=model, x=x)
+        assert set(selected) == {"loss", "auc", "mean_squared_error"}
+        assert np.isclose(selected["loss"], compiled["loss"], rtol=1e-4)
+
+        # Исходная модель не перекомпилирована
+        assert set(EvaluateNode.evaluate(self.y_true, model=model, x=x)) == {"loss", "binary_accuracy"}
@@ -0,0 +1,68 @@
+import unittest
+
+from Src.Graph import GraphScheduler
+from Src.Exceptions import CycleException
+from Src.Managers import TaskManager
+
+
+
+class test_GraphScheduler(unittest.TestCase):
+    '''
+    Проверка топологического планировщика графа
+    '''
+
+    def test_order(self):
+        scheduler = GraphScheduler({
+            "input": [],
+            "dense": ["input"],
+            "data": [],
+            "compile": ["dense"],
+            "fit": ["compile", "data", "data"],
+        })
+
+        order = scheduler.order()
+
+        assert len(order) == 5
+        assert order.index("input") < order.index("dense") < order.index("compile") < order.index("fit")
+        assert order.index("data") < order.index("fit")
+        assert scheduler.in_degree["fit"] == 2
+
+
+    def test_cycle(self):
+        scheduler = GraphScheduler({"a": ["c"], "b": ["a"], "c": ["b"], "d": []})
+
+        with self.assertRaises(CycleException):
+            scheduler.order()
+
+
+    def test_run(self):
+        scheduler = GraphScheduler({"a": [], "b": ["a"], "c": ["b"]})
+        executed = []
+
+        visited = scheduler.run(lambda node: executed.append(node) or node != "b")
+
+        assert executed == ["a", "b"]
+        assert visited == {"a"}
+        assert set(scheduler.timings.keys()) == {"a", "b"}
+
+
+    def test_start_background(self):
+        scheduler = GraphScheduler({"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"]})
+        finished = []
+
+        def execute(node, done):
+            if node in ("b", "c"):
+                TaskManager.submit(lambda: node, callback=lambda future: done(future.result() == node))
+            else:
+                done(True)
+
+        visited = scheduler.start(execute, on_finish=finished.append)
+
+        assert visited == {"a"}
+        assert not scheduler.finished
+
+        while not scheduler.finished:
+            TaskManager.process_ui_queue(block=True)
+
+        assert visited == {"a", "b", "c", "d"}
+        assert finished == [visited]
@@ -0,0 +1,139 @@
+import unittest
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import graphnet
+from Src.Graph import GraphModel, GraphNode, GraphLink, HeadlessRunner
+from Src.Exceptions import CycleException
+from Src.Config.node_annotation import NodeAnnotation
+from Src.Config.parameter import Parameter
+from Src.Config.Annotations import AFloat
+from Src.Enums import AttrType
+from Src.Managers import TaskManager
+from Src.Nodes import DataNode
+
+
+
+def regression_graph() -> GraphModel:
+    '''
+    Граф из редактора: данные -> вход -> Dense -> компиляция -> обучение -> предсказание.
+    '''
+    table = {"delimiter": ",", "skip_header": False, "skip_footer": False, "dtype": "float32"}
+    return GraphModel(
+        nodes=[
+            GraphNode(1, "Tables data", {"files": "./Tests/X.txt", **table}),
+            GraphNode(2, "Tables data", {"files": "./Tests/y.txt", **table}),
+            GraphNode(3, "Input"),
+            GraphNode(4, "Dense", {"units": 1, "activation": "linear", "use_bias": True}),
+            GraphNode(5, "Compile model", {"optimizer": "sgd", "loss": "mean_squared_error"}),
+            GraphNode(6, "Fit model", {"epochs": 1, "batch_size": 256}),
+            GraphNode(7, "Predict"),
+        ],
+        links=[
+            GraphLink(1, "shape", 3, "shape"),
+            GraphLink(3, "OUTPUT", 4, "INPUT"),
+            GraphLink(4, "OUTPUT", 5, "INPUT"),
+            GraphLink(5, "OUTPUT", 6, "INPUT"),
+            GraphLink(1, "OUTPUT", 6, "x"),
+            GraphLink(2, "OUTPUT", 6, "y"),
+            GraphLink(6, "OUTPUT", 7, "INPUT"),
+            GraphLink(1, "OUTPUT", 7, "x"),
+        ])
+
+
+
+class test_HeadlessRunner(unittest.TestCase):
+    '''
+    Проверка выполнения графа без DearPyGui
+    '''
+
+    def test_model(self):
+        graph = regression_graph()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "graph.json"
+            graph.save(path)
+            loaded = GraphModel.load(path)
+
+        assert loaded == graph
+        assert loaded.dependencies()[6] == {1, 2, 5}
+        assert [link.source for link in loaded.incoming(7, "x")] == [1]
+
+
+    def test_values(self):
+        runner = HeadlessRunner(regression_graph())
+
+        values = runner.values(4)
+
+        assert values["units"] == 1
+        assert values["INPUT"] == [runner.nodes[3].OUTPUT]
+        assert "progress" not in runner.values(6)
+        assert runner.values(6)["x"] is runner.nodes[1].OUTPUT
+
+
+    def test_run(self):
+        runner = HeadlessRunner(regression_graph())
+
+        visited = runner.run()
+
+        assert visited == set(range(1, 8))
+        assert runner.nodes[7].OUTPUT.shape == (10000, 1)
+        assert len(runner.nodes[6].history) == 1
+        assert "Predict" in runner.report()
+
+
+    def test_error(self):
+        graph = regression_graph()
+        graph.node(6).params["epochs"] = 0
+        runner = HeadlessRunner(graph)
+
+        visited = runner.run()
+
+        assert 6 in runner.errors and 7 not in visited
+        assert isinstance(runner.errors[6], AttributeError)
+
+
+    def test_cycle(self):
+        graph = regression_graph()
+        graph.links.append(GraphLink(7, "OUTPUT", 4, "INPUT"))
+
+        with self.assertRaises(CycleException):
+            HeadlessRunner(graph).run()
+
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "graph.json"
+            regression_graph().save(path)
+
+            assert graphnet.main(["run", str(path)]) == 0
+
+
+    def test_parallel(self):
+        def wait(*inputs, seconds: float):
+            time.sleep(seconds)
+            return seconds
+
+        catalog = {"Wait": NodeAnnotation("Wait", DataNode, wait, {"seconds": Parameter(AttrType.INPUT, AFloat)})}
+        # Две независимые ветки по 0.3 с и узел, который ждёт обе
+        graph = GraphModel(
+            nodes=[GraphNode(1, "Wait", {"seconds": 0.3}),
+                   GraphNode(2, "Wait", {"seconds": 0.3}),
+                   GraphNode(3, "Wait", {"seconds": 0.0})],
+            links=[GraphLink(1, "OUTPUT", 3, "INPUT"),
+                   GraphLink(2, "OUTPUT", 3, "INPUT")])
+
+        max_workers = TaskManager.max_workers
+        TaskManager.set_max_workers(2)
+        try:
+            start = time.perf_counter()
+            visited = HeadlessRunner(graph, catalog).run()
+            elapsed = time.perf_counter() - start
+        finally:
+            TaskManager.set_max_workers(max_workers)
+
+        assert visited == {1, 2, 3}
+        assert elapsed < 0.55
@@ -0,0 +1,83 @@
+import unittest
+import importlib.util
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from Src.Utils import ImageReader
+
+
+
+class ValueReader(ImageReader):
+    '''
+    Читатель, у которого изображение - это файл с одним числом, чтобы проверить запись результата без Pillow.
+    '''
+
+    def decode(self, file: Path) -> np.ndarray:
+        value = int(file.read_text())
+        return np.full((2, 3, 1) if value < 100 else (1, 1, 1), value, dtype=np.uint8)
+
+
+
+class test_ImageReader(unittest.TestCase):
+    '''
+    Проверка параллельного чтения изображений
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def test_order(self):
+        for index in range(20):
+            (self.path / f"{index:02}.txt").write_text(str(index))
+        progress = []
+
+        result = ValueReader(self.path, workers=4).read(progress=progress.append)
+
+        assert result.dtype == np.uint8
+        assert result.shape == (20, 2, 3, 1)
+        assert result[:, 0, 0, 0].tolist() == list(range(20))
+        assert progress[-1] == 1.0
+
+
+    def test_out(self):
+        images = self.path / "images"
+        images.mkdir()
+        for index in range(3):
+            (images / f"{index}.txt").write_text(str(index))
+        out = np.lib.format.open_memmap(self.path / "out.npy", mode='w+', dtype=np.uint8, shape=(3, 2, 3, 1))
+
+        result = ValueReader(images).read(out=out)
+
+        assert result is out
+        assert out[:, 1, 2, 0].tolist() == [0, 1, 2]
+
+
+    def test_different_sizes(self):
+        (self.path / "0.txt").write_text("1")
+        (self.path / "1.txt").write_text("200")
+
+        with self.assertRaises(AttributeError):
+            ValueReader(self.path).read()
+
+
+    @unittest.skipUnless(importlib.util.find_spec("PIL"), "Pillow не установлен")
+    def test_decode(self):
+        from PIL import Image
+
+        Image.new("RGB", (8, 4), (255, 0, 0)).save(self.path / "a.png")
+        Image.new("RGB", (6, 6), (0, 255, 0)).save(self.path / "b.png")
+
+        result = ImageReader(self.path, target_size=(5, 7)).read()
+        gray = ImageReader(self.path, target_size=(5, 7), color_mode="grayscale").read()
+
+        assert result.shape == (2, 5, 7, 3)
+        assert result[0, 2, 3].tolist() == [255, 0, 0]
+        assert gray.shape == (2, 5, 7, 1)
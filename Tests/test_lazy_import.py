@@ -0,0 +1,39 @@
+import unittest
+import inspect
+import subprocess
+import sys
+
+import numpy as np
+
+from Src.Utils import lazy, warm_up
+
+
+
+class test_LazyImport(unittest.TestCase):
+    '''
+    Проверка отложенного импорта Keras
+    '''
+
+    def test_lazy(self):
+        argmax = lazy("numpy.argmax")
+
+        assert argmax([1, 3, 2]) == 1
+        assert argmax.resolve() is np.argmax
+        assert inspect.getdoc(argmax) == inspect.getdoc(np.argmax)
+        assert "axis" in inspect.signature(argmax).parameters
+
+        with self.assertRaises(AttributeError):
+            lazy("numpy.not_a_function")()
+
+
+    def test_warm_up(self):
+        warm_up("json").join()
+        assert "json" in sys.modules
+
+
+    def test_editor_without_keras(self):
+        # Список узлов и редактор не должны импортировать Keras при запуске приложения
+        code = "import sys; import Src.node_editor; print('keras' in sys.modules, 'tensorflow' in sys.modules)"
+        completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert completed.stdout.split() == ["False", "False"]
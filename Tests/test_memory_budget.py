@@ -0,0 +1,118 @@
+import unittest
+import gc
+import weakref
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from Src.Managers import MemoryBudget, Budgeted
+from Src.Nodes.dataset_node import Dataset, DatasetNode
+
+
+
+class Holder:
+    OUTPUT = Budgeted()
+
+
+
+class test_MemoryBudget(unittest.TestCase):
+    '''
+    Проверка сброса результатов узлов на диск при превышении бюджета памяти
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.max_bytes = MemoryBudget.max_bytes
+        MemoryBudget.clear()
+        MemoryBudget.directory = Path(self.directory.name)
+        MemoryBudget.max_bytes = 10 * 8000
+
+
+    def tearDown(self):
+        MemoryBudget.clear()
+        MemoryBudget.max_bytes = self.max_bytes
+        MemoryBudget.directory = Path("Spill")
+        gc.collect()
+        self.directory.cleanup()
+
+
+    def test_spill(self):
+        holders = [Holder() for _ in range(3)]
+        arrays = [np.random.rand(5000) for _ in holders]
+
+        for holder, array in zip(holders, arrays):
+            holder.OUTPUT = array.copy()
+
+        # Бюджет вмещает только два массива, сбрасывается самый старый
+        assert isinstance(holders[0].__dict__["_OUTPUT"], np.memmap)
+        assert not isinstance(holders[2].__dict__["_OUTPUT"], np.memmap)
+        assert MemoryBudget.memory() <= MemoryBudget.max_bytes
+        assert MemoryBudget.spilled() > 0
+
+        for holder, array in zip(holders, arrays):
+            assert np.array_equal(holder.OUTPUT, array)
+
+
+    def test_lru(self):
+        first, second, third = Holder(), Holder(), Holder()
+        first.OUTPUT = np.zeros(5000)
+        second.OUTPUT = np.zeros(5000)
+
+        # Чтение делает first последним использованным, под сброс попадает second
+        first.OUTPUT
+        third.OUTPUT = np.zeros(5000)
+
+        assert not isinstance(first.__dict__["_OUTPUT"], np.memmap)
+        assert isinstance(second.__dict__["_OUTPUT"], np.memmap)
+
+
+    def test_dataclass(self):
+        holder = Holder()
+        holder.OUTPUT = Dataset(np.ones((10000, 2)), np.ones(10), np.ones((10, 2)), np.ones(10), (10000, 2))
+        MemoryBudget.set_max_bytes(0)
+
+        node = SimpleNamespace(OUTPUT=holder.OUTPUT)
+        assert isinstance(holder.OUTPUT.X_train, np.memmap)
+        assert holder.OUTPUT.shape == (10000, 2)
+        assert np.array_equal(DatasetNode.X_train.fget(node), np.ones((10000, 2)))
+
+
+    def test_remove(self):
+        holder = Holder()
+        holder.OUTPUT = np.zeros(20000)
+
+        assert len(list(MemoryBudget.directory.glob("*.npy"))) == 1
+        del holder
+        gc.collect()
+        assert list(MemoryBudget.directory.glob("*.npy")) == []
+        assert MemoryBudget.memory() == 0
+
+
+    def test_objects(self):
+        holder = Holder()
+        holder.OUTPUT = np.array([object()] * 20000)
+
+        # Массивы объектов нельзя сбросить в .npy, они остаются в памяти
+        assert not isinstance(holder.OUTPUT, np.memmap)
+        assert MemoryBudget.memory() > MemoryBudget.max_bytes
+
+
+    def test_cached_inputs(self):
+        from Src.Managers import OutputCache
+
+        OutputCache.clear()
+        holder = Holder()
+        array = np.random.rand(20000)
+        released = weakref.ref(array)
+
+        # Запомненный узел-потомок держит исходный массив среди входов записи кэша
+        OutputCache.get(("scale", id(array)), lambda: np.float64(array.sum()), ([array],))
+        holder.OUTPUT = array
+        del array
+        gc.collect()
+
+        assert isinstance(holder.__dict__["_OUTPUT"], np.memmap)
+        assert released() is None
+        assert OutputCache.count() == 0
@@ -1,10 +1,16 @@
 import json
+import tempfile
+from pathlib import Path
 
 import dearpygui.dearpygui as dpg
+import numpy as np
 
 from Src.node_builder import NodeBuilder
 from Src.Config.node_annotation import NodeAnnotation
-from Src.Nodes import AbstractNode, InputLayerNode
+from Src.Nodes import AbstractNode, InputLayerNode, DatasetNode, UtilsNode
+from Src.Nodes.abstract_node import NodeTask
+from Src.Managers import TaskManager, WriteManager
+from Src.Graph import WorkerResult
 from Src.Logging.logger_factory import Logger_factory
 from Tests.DPG_test import DPGUnitTest
 
@@ -81,3 +87,80 @@ class test_NodeBuilder(DPGUnitTest):
 
         assert isinstance(node, InputLayerNode)
         assert dpg.get_item_label(node_id) == "Input"
+
+
+    def test_apply_result(self):
+        builder = NodeBuilder({}, lambda x:x)
+        with dpg.window() as id:
+            with dpg.node_editor() as editor_id:
+                node_id = builder.build_node(
+                    NodeAnnotation(
+                                label="Load Dataset",
+                                node_type=DatasetNode,
+                                logic = DatasetNode.open_data,
+                                annotations={}
+                            ),
+                            editor_id
+                            )
+
+        node = dpg.get_item_user_data(node_id)
+        result = WorkerResult({1}, outputs={1: {"OUTPUT": None, "X_train": None, "shape": (28, 28)}})
+
+        # Свойства X_train, y_train... не имеют сеттера и пропускаются
+        builder.apply_result({1: node}, result)
+        assert node.shape == (28, 28) and node.OUTPUT is None and node.dirty
+
+
+    def test_save_data_error(self):
+        builder = NodeBuilder({}, lambda x:x)
+        with dpg.window() as id:
+            with dpg.node_editor() as editor_id:
+                node_id = builder.build_node(
+                    NodeAnnotation(
+                                label="Save data",
+                                node_type=UtilsNode,
+                                logic = UtilsNode.save_data,
+                                annotations={}
+                            ),
+                            editor_id
+                            )
+
+        node = dpg.get_item_user_data(node_id)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "result.npy"
+            np.save(path, np.zeros((3, 2)))
+            # Строки другой формы нельзя дописать к массиву
+            output = UtilsNode.save_data(np.zeros((3, 4)), str(path), append=True)
+
+            assert node.finish(NodeTask([], {}, 0), output) and not node.dirty
+            WriteManager.wait()
+            TaskManager.process_ui_queue(block=True)
+
+        # Ошибка фоновой записи показывается на узле, следующая сборка повторит запись
+        assert node.dirty and dpg.does_item_exist(node._error_id)
+
+
+    def test_compile_unchanged(self):
+        builder = NodeBuilder({}, lambda x:x)
+        with dpg.window() as id:
+            with dpg.node_editor() as editor_id:
+                node_id = builder.build_node(
+                    NodeAnnotation(
+                                label="Example",
+                                node_type=AbstractNode,
+                                logic = lambda: 1,
+                                annotations={}
+                            ),
+                            editor_id
+                            )
+
+        node = dpg.get_item_user_data(node_id)
+        statuses = []
+        builder.compile_node(node, statuses.append)
+        node.raise_error("Сборка графа отменена пользователем", "Выполнение отменено")
+
+        # Узел не изменился и берётся прошлый результат, ошибка прошлой сборки снимается
+        builder.compile_node(node, statuses.append)
+        assert statuses == [True, True]
+        assert not dpg.does_item_exist(node._error_id)
@@ -1,4 +1,6 @@
 import json
+import tempfile
+from pathlib import Path
 
 import dearpygui.dearpygui as dpg
 
@@ -6,6 +8,7 @@ from Src.node_editor import NodeEditor
 from Src.Config import NodeAnnotation, Parameter
 from Src.Config.Annotations import ANode
 from Src.Nodes import AbstractNode
+from Src.Graph import GraphModel, GraphNode, GraphLink
 from Src.Enums.attr_type import AttrType
 from Src.Logging.logger_factory import Logger_factory
 from Tests.DPG_test import DPGUnitTest
@@ -233,3 +236,94 @@ class test_NodeEditor(DPGUnitTest):
         assert node2 in self.node_editor._NodeEditor__start_nodes
 
 
+    def test_save_load(self):
+        graph = GraphModel(
+            nodes=[
+                GraphNode(1, "Input", position=[10.0, 20.0]),
+                GraphNode(2, "Dense", {"units": 4, "activation": "relu", "use_bias": True}, [200.0, 20.0]),
+                GraphNode(3, "Compile model", {"optimizer": "adam", "loss": "mean_squared_error"}, [400.0, 20.0]),
+            ],
+            links=[
+                GraphLink(1, "OUTPUT", 2, "INPUT"),
+                GraphLink(2, "OUTPUT", 3, "INPUT"),
+            ])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "graph.json"
+            graph.save(path)
+            self.node_editor.load(path)
+
+        saved = self.node_editor.to_graph()
+        labels = {node.id: node.label for node in saved.nodes}
+
+        assert [node.label for node in saved.nodes] == ["Input", "Dense", "Compile model"]
+        assert saved.nodes[1].params == graph.nodes[1].params
+        assert saved.nodes[2].position == [400.0, 20.0]
+        assert [(labels[link.source], link.output, labels[link.target], link.input) for link in saved.links] == \
+            [("Input", "OUTPUT", "Dense", "INPUT"), ("Dense", "OUTPUT", "Compile model", "INPUT")]
+        assert self.node_editor._NodeEditor__start_nodes == [dpg.get_item_user_data(saved.nodes[0].id)]
+
+
+    def test_compile_isolated(self):
+        from Tests.test_headless_runner import regression_graph
+
+        self.node_editor.from_graph(regression_graph())
+        graph = self.node_editor.to_graph()
+        builder = self.node_editor.builder
+
+        nodes = {node.label: dpg.get_item_user_data(node.id) for node in graph.nodes}
+
+        try:
+            builder.compile_isolated(graph, wait=True)
+            # Массивы остаются в процессе сборки и передаются по запросу
+            assert builder.worker.fetch(nodes["Predict"].node_tag).shape == (10000, 1)
+        finally:
+            builder.worker.stop()
+
+        assert nodes["Predict"].OUTPUT is None
+        # Узел обучения сам запросил историю потерь для графика
+        fit = nodes["Fit model"]
+        assert len(fit.annotations["progress"].get_value(fit.attribute("progress"))[1]) == 1
+        # Модели остались в процессе сборки, обычная сборка выполнит узлы заново
+        assert nodes["Compile model"].OUTPUT is None and nodes["Compile model"].dirty
+        assert not builder.running
+
+
+    def test_link_shapes(self):
+        from Tests.test_headless_runner import regression_graph
+        from Src.Config.node_list import node_catalog
+
+        self.node_editor.from_graph(regression_graph())
+        nodes = {node.label: dpg.get_item_user_data(node.id) for node in self.node_editor.to_graph().nodes}
+
+        conv_id = self.node_editor.builder.build_node(node_catalog["Conv2D"], parent="node_editor")
+        dense_id = self.node_editor.builder.build_node(node_catalog["Dense"], parent="node_editor")
+        conv, dense = dpg.get_item_user_data(conv_id), dpg.get_item_user_data(dense_id)
+
+        # Вход таблицы X.txt одномерный: Conv2D к нему не подключается, Dense подключается
+        self.node_editor.link_callback("node_editor", (nodes["Input"].attribute("OUTPUT"), conv.attribute("INPUT")))
+        self.node_editor.link_callback("node_editor", (nodes["Input"].attribute("OUTPUT"), dense.attribute("INPUT")))
+
+        assert not conv.incoming and dense.incoming
+        assert self.node_editor.shape_errors() == {}
+
+
+    def test_check_shapes(self):
+        from Tests.test_headless_runner import regression_graph
+
+        graph = regression_graph()
+        graph.nodes.append(GraphNode(8, "Conv2D", {"filters": 1, "kernel_size": 1}))
+        graph.links.append(GraphLink(3, "OUTPUT", 8, "INPUT"))
+
+        # Сохранённый граф восстанавливается без проверки форм, ошибка находится перед сборкой
+        self.node_editor.from_graph(graph)
+        nodes = {node.label: dpg.get_item_user_data(node.id) for node in self.node_editor.to_graph().nodes}
+        conv = nodes["Conv2D"]
+
+        assert not self.node_editor.check_shapes()
+        assert dpg.does_item_exist(conv._error_id)
+
+        # После исправления связи отметка ошибки снимается
+        self.node_editor.delink(nodes["Input"].attribute("OUTPUT"), conv.attribute("INPUT"))
+        assert self.node_editor.check_shapes()
+        assert not dpg.does_item_exist(conv._error_id)
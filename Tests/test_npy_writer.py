@@ -0,0 +1,105 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from Src.Utils import NpyWriter, save_array
+from Src.Managers import WriteManager
+from Src.Nodes import UtilsNode
+
+
+
+class test_NpyWriter(unittest.TestCase):
+    '''
+    Проверка записи .npy по частям
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "result.npy"
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def test_append(self):
+        parts = [np.random.rand(n, 3, 2).astype(np.float32) for n in (5, 1, 7)]
+
+        with NpyWriter(self.path) as writer:
+            for part in parts:
+                writer.append(part)
+
+        loaded = np.load(self.path, mmap_mode='r')
+        assert writer.rows == 13 and loaded.shape == (13, 3, 2)
+        assert np.array_equal(loaded, np.concatenate(parts))
+        assert list(self.path.parent.glob("*.tmp")) == []
+
+
+    def test_mismatch(self):
+        with self.assertRaises(AttributeError):
+            with NpyWriter(self.path) as writer:
+                writer.append(np.zeros((2, 3)))
+                writer.append(np.zeros((2, 4)))
+
+        # Прерванная запись не оставляет ни итоговый, ни временный файл
+        assert list(self.path.parent.iterdir()) == []
+
+
+    def test_empty(self):
+        with self.assertRaises(AttributeError):
+            NpyWriter(self.path).close()
+
+
+    def test_extend(self):
+        np.save(self.path, np.zeros((3, 2), np.float32))
+        NpyWriter.extend(self.path, np.ones((4, 2), np.float32))
+
+        loaded = np.load(self.path, mmap_mode='r')
+        assert loaded.shape == (7, 2) and loaded[3:].sum() == 8
+
+        with self.assertRaises(AttributeError):
+            NpyWriter.extend(self.path, np.ones((1, 3), np.float32))
+
+
+
+class test_save_array(unittest.TestCase):
+    '''
+    Проверка сохранения данных узлом «Save data»
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.data = np.arange(12, dtype=np.float32).reshape(6, 2)
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def test_formats(self):
+        save_array(self.folder / "a.npy", self.data)
+        save_array(self.folder / "a.npy", self.data, append=True)
+        assert np.array_equal(np.load(self.folder / "a.npy"), np.concatenate([self.data, self.data]))
+
+        save_array(self.folder / "a.npz", np.zeros(10000), compressed=True)
+        save_array(self.folder / "a.npz", self.data, compressed=True, append=True)
+        with np.load(self.folder / "a.npz") as archive:
+            assert archive.files == ["arr_0", "arr_1"]
+            assert np.array_equal(archive["arr_1"], self.data)
+        assert (self.folder / "a.npz").stat().st_size < 10000
+
+        save_array(self.folder / "a.txt", self.data)
+        save_array(self.folder / "a.txt", self.data, append=True)
+        assert np.loadtxt(self.folder / "a.txt").shape == (12, 2)
+
+
+    def test_background(self):
+        path = self.folder / "result.npy"
+        UtilsNode.save_data(self.data, str(path))
+
+        assert WriteManager.wait(timeout=10)
+        assert WriteManager.pending() == 0
+        assert np.array_equal(np.load(path), self.data)
@@ -0,0 +1,94 @@
+import unittest
+
+import numpy as np
+
+from Src.Managers import OutputCache
+from Src.Config import NodeAnnotation, Parameter
+from Src.Config.Annotations import ANode, AInteger
+from Src.Enums import AttrType
+from Src.Nodes import AbstractNode
+
+
+
+class test_OutputCache(unittest.TestCase):
+    '''
+    Проверка кэша результатов узлов
+    '''
+
+    def setUp(self):
+        OutputCache.clear()
+        self.max_bytes = OutputCache.max_bytes
+        self.calls = 0
+
+
+    def tearDown(self):
+        OutputCache.max_bytes = self.max_bytes
+        OutputCache.clear()
+
+
+    def compute(self, size: int = 10):
+        self.calls += 1
+        return np.zeros(size, dtype=np.uint8)
+
+
+    def test_get(self):
+        first = OutputCache.get(("a", 1), self.compute)
+        second = OutputCache.get(("a", 1), self.compute)
+        OutputCache.get(("a", 2), self.compute)
+
+        assert first is second
+        assert self.calls == 2
+        assert OutputCache.count() == 2
+        assert OutputCache.memory() == 20
+
+
+    def test_lru(self):
+        OutputCache.max_bytes = 25
+
+        OutputCache.get("a", self.compute)
+        OutputCache.get("b", self.compute)
+        OutputCache.get("a", self.compute)
+        OutputCache.get("c", self.compute)
+        OutputCache.get("a", self.compute)
+        OutputCache.get("b", self.compute)
+        OutputCache.get("big", lambda: self.compute(100))
+
+        assert self.calls == 5
+        assert OutputCache.count() == 2
+        assert OutputCache.memory() <= 25
+
+
+    def test_inputs(self):
+        OutputCache.max_bytes = 250
+        data = [np.zeros(100, dtype=np.uint8), np.zeros(100, dtype=np.uint8)]
+
+        # Небольшой результат держит большие входы: они входят в объём записи
+        OutputCache.get("first", lambda: data[0][:1], ([data[0]],))
+        assert OutputCache.memory() == 101
+
+        OutputCache.get("second", lambda: data[1][:1], ([data[1], data[1]],))
+        assert OutputCache.memory() == 202
+
+        OutputCache.get("third", lambda: np.zeros(1, dtype=np.uint8), ([np.zeros(100, dtype=np.uint8)],))
+        assert OutputCache.count() == 2 and OutputCache.memory() <= 250
+
+
+    def test_node(self):
+        annotation = NodeAnnotation(
+            label="Scale",
+            node_type=AbstractNode,
+            logic=lambda x, factor: self.compute() + factor,
+            annotations={"factor": Parameter(AttrType.INPUT, AInteger)},
+            input=AbstractNode,
+            memoize=True)
+
+        node = annotation.node_type(1, **annotation.kwargs)
+        other = annotation.node_type(2, **annotation.kwargs)
+        data, copy = np.ones(3), np.ones(3)
+
+        first = node.execute(node.make_task({"INPUT": [data], "factor": 2}))
+        assert other.execute(other.make_task({"INPUT": [data], "factor": 2})) is first
+        assert node.execute(node.make_task({"INPUT": [data], "factor": 3})) is not first
+        assert node.execute(node.make_task({"INPUT": [copy], "factor": 2})) is not first
+
+        assert self.calls == 3
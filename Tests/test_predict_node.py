@@ -0,0 +1,62 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import keras
+
+from Src.Nodes import PredictNode
+from Src.Utils import TableStream
+
+
+
+class test_PredictNode(unittest.TestCase):
+    '''
+    Проверка предсказания батчами с записью в файл
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "prediction.npy"
+        self.model = keras.Sequential([keras.Input((3,)), keras.layers.Dense(2)])
+        self.x = np.random.rand(1000, 3).astype(np.float32)
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def test_file(self):
+        fractions = []
+        result = PredictNode.predict(self.model, self.x, batch_size=128, filename=str(self.path),
+                                     progress=fractions.append)
+
+        assert isinstance(result, np.memmap) and result.shape == (1000, 2)
+        assert np.allclose(result, self.model.predict(self.x, verbose=False), atol=1e-5)
+        assert len(fractions) == 8 and fractions[-1] == 1.0
+
+
+    def test_stream(self):
+        table = Path(self.directory.name) / "x.csv"
+        np.savetxt(table, self.x, delimiter=',')
+
+        result = PredictNode.predict(self.model, TableStream(table), batch_size=300, filename=str(self.path))
+        assert result.shape == (1000, 2)
+        assert np.allclose(result, self.model.predict(self.x, verbose=False), atol=1e-5)
+
+
+    def test_memory(self):
+        result = PredictNode.predict(self.model, self.x, batch_size=100)
+        assert not isinstance(result, np.memmap) and result.shape == (1000, 2)
+        assert not self.path.exists()
+
+
+    def test_count_rows(self):
+        inputs = keras.Input((3,))
+        model = keras.Model(inputs, [keras.layers.Dense(2)(inputs), keras.layers.Dense(1)(inputs)])
+
+        result = PredictNode.predict(model, self.x, batch_size=100)
+        assert isinstance(result, list | tuple) and len(result) == 2
+        # Строки считаются по первому выходу, а не количество выходов
+        assert PredictNode.count_rows(result) == 1000
+        assert PredictNode.count_rows(self.model.predict(self.x, verbose=False)) == 1000
@@ -0,0 +1,78 @@
+import unittest
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from Src.Managers import Profiler
+from Src.Graph import HeadlessRunner
+from Tests.test_headless_runner import regression_graph
+
+
+
+class test_Profiler(unittest.TestCase):
+    '''
+    Проверка замеров выполнения узлов и экспорта трейса
+    '''
+
+    def setUp(self):
+        Profiler.clear()
+
+
+    def test_measure(self):
+        with Profiler.measure(1, "sleep") as profile:
+            time.sleep(0.05)
+        with Profiler.measure(2, "busy") as busy:
+            sum(range(10**6))
+
+        assert Profiler.records() == [profile, busy]
+        assert profile.wall >= 0.05 and profile.cpu < 0.04
+        assert busy.cpu > 0 and busy.rss >= 0
+        assert "с | CPU" in profile.badge()
+
+
+    def test_disabled(self):
+        Profiler.enabled = False
+        try:
+            with Profiler.measure(1) as profile:
+                pass
+        finally:
+            Profiler.enabled = True
+
+        assert profile is None and not Profiler.records()
+
+
+    def test_trace(self):
+        with Profiler.measure(1, "main"):
+            pass
+        worker = threading.Thread(target=self.__measure_in_thread)
+        worker.start()
+        worker.join()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "trace.json"
+            Profiler.export_trace(path)
+            trace = json.loads(path.read_text(encoding="utf-8"))
+
+        events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        names = {event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"}
+
+        assert [event["name"] for event in events] == ["main", "worker"]
+        assert events[0]["ts"] == 0 and events[1]["tid"] != events[0]["tid"]
+        assert "main" in names and len(names) == 2
+
+
+    @staticmethod
+    def __measure_in_thread():
+        with Profiler.measure(2, "worker"):
+            time.sleep(0.01)
+
+
+    def test_headless(self):
+        runner = HeadlessRunner(regression_graph())
+        runner.run()
+
+        assert {record.node for record in Profiler.records()} == set(range(1, 8))
+        assert runner.nodes[6].profile.wall > 0
+        assert "CPU, с" in runner.report()
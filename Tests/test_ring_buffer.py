@@ -0,0 +1,29 @@
+import unittest
+
+from Src.Utils import RingBuffer
+
+
+
+class test_RingBuffer(unittest.TestCase):
+
+    def test_append(self):
+        buffer = RingBuffer(4)
+        for value in range(3): buffer.append(value)
+
+        indices, values = buffer.values()
+
+        assert len(buffer) == 3
+        assert indices.tolist() == [0, 1, 2]
+        assert values.tolist() == [0, 1, 2]
+
+
+    def test_overflow(self):
+        buffer = RingBuffer(4)
+        for value in range(10): buffer.append(value)
+
+        indices, values = buffer.values()
+
+        assert len(buffer) == 4
+        assert buffer.count == 10
+        assert indices.tolist() == [6, 7, 8, 9]
+        assert values.tolist() == [6, 7, 8, 9]
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import keras
+
+from Src.Graph import GraphModel, GraphNode, GraphLink, HeadlessRunner, ShapeInference, SHAPE_RULES
+from Src.Graph.shape_inference import SHAPE_PROBES, PROBE_CACHE_SIZE, table_columns
+from Src.Exceptions import ShapeException
+from Tests.test_headless_runner import regression_graph
+
+
+
+def layer_graph(shape: tuple, *layers: tuple[str, dict]) -> GraphModel:
+    '''
+    Цепочка: данные формы shape -> вход -> слои layers.
+    '''
+    graph = GraphModel([GraphNode(1, "Tables data"), GraphNode(2, "Input")], [GraphLink(1, "shape", 2, "shape")])
+    for node_id, (label, params) in enumerate(layers, start=3):
+        graph.nodes.append(GraphNode(node_id, label, params))
+        graph.links.append(GraphLink(node_id - 1, "OUTPUT", node_id, "INPUT"))
+    return graph
+
+
+
+class test_ShapeInference(unittest.TestCase):
+    '''
+    Проверка статического вывода форм слоёв
+    '''
+
+    def test_rules(self):
+        # Правила считают формы так же, как сами слои Keras
+        cases = [
+            ("Dense", keras.layers.Dense, {"units": 7}, (5, 3)),
+            ("Conv1D", keras.layers.Conv1D, {"filters": 4, "kernel_size": 3, "strides": 2, "padding": "valid"}, (17, 2)),
+            ("Conv2D", keras.layers.Conv2D, {"filters": 4, "kernel_size": 3, "strides": 2, "padding": "same"}, (15, 16, 3)),
+            ("Conv3D", keras.layers.Conv3D, {"filters": 2, "kernel_size": 2, "strides": 1, "padding": "valid"}, (5, 6, 7, 1)),
+            ("DepthwiseConv2D", keras.layers.DepthwiseConv2D, {"kernel_size": 3, "depth_multiplier": 2, "padding": "valid"}, (9, 9, 3)),
+            ("SeparableConv2D", keras.layers.SeparableConv2D, {"filters": 5, "kernel_size": 3, "strides": 2, "padding": "same"}, (9, 9, 3)),
+            ("MaxPooling2D", keras.layers.MaxPooling2D, {"pool_size": (2, 3), "strides": 1, "padding": "valid"}, (8, 9, 3)),
+            ("AveragePooling1D", keras.layers.AveragePooling1D, {"pool_size": 2, "strides": 2, "padding": "same"}, (11, 4)),
+            ("Flatten", keras.layers.Flatten, {}, (4, 5, 6)),
+        ]
+
+        for label, layer, params, shape in cases:
+            expected = layer(**params).compute_output_shape((None, *shape))[1:]
+            assert SHAPE_RULES[label](label, [shape], params) == tuple(expected), label
+
+
+    def test_merge(self):
+        assert SHAPE_RULES["Concatenate"]("Concatenate", [(4, 3), (4, 5)], {}) == (4, 8)
+        assert SHAPE_RULES["Add"]("Add", [(4, 1), (4, 3)], {}) == (4, 3)
+
+        with self.assertRaises(ShapeException):
+            SHAPE_RULES["Concatenate"]("Concatenate", [(4, 3), (5, 3)], {})
+        with self.assertRaises(ShapeException):
+            SHAPE_RULES["Add"]("Add", [(4, 2), (4, 3)], {})
+
+
+    def test_graph(self):
+        graph = layer_graph((28, 28, 1), ("Conv2D", {"filters": 8, "kernel_size": 3, "padding": "valid"}),
+                            ("MaxPooling2D", {"pool_size": [2, 2], "strides": 2}), ("Flatten", {}), ("Dense", {"units": 10}))
+
+        shapes = ShapeInference(graph, {1: (28, 28, 1)}).check()
+        assert shapes[2] == (28, 28, 1)
+        assert shapes[4] == (13, 13, 8)
+        assert shapes[6] == (10,)
+
+        # Без известной формы данных слои не проверяются
+        assert ShapeInference(graph).check() == {}
+
+
+    def test_errors(self):
+        graph = layer_graph((10,), ("Dense", {"units": 4}), ("Conv1D", {"filters": 2, "kernel_size": 3}))
+        inference = ShapeInference(graph, {1: (10,)})
+
+        with self.assertRaises(ShapeException):
+            inference.check()
+        assert list(inference.errors) == [4]
+        assert inference.shapes[3] == (4,)
+
+        pooling = layer_graph((3, 1), ("MaxPooling1D", {"pool_size": 4, "strides": 1, "padding": "valid"}))
+        with self.assertRaises(ShapeException):
+            ShapeInference(pooling, {1: (3, 1)}).check()
+
+
+    def test_headless(self):
+        graph = regression_graph()
+        # Форма входа берётся из первой строки таблицы, данные не загружаются
+        assert ShapeInference(graph).check()[4] == (1,)
+
+        graph.nodes.append(GraphNode(8, "Conv2D", {"filters": 1, "kernel_size": 1}))
+        graph.links.append(GraphLink(3, "OUTPUT", 8, "INPUT"))
+        runner = HeadlessRunner(graph)
+
+        with self.assertRaises(ShapeException):
+            runner.run()
+        assert not runner.scheduler
+
+
+    def test_probe_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "x.csv"
+            path.write_text("1,2,3\n")
+            node = GraphNode(1, "Tables data", {"files": str(path)})
+
+            assert SHAPE_PROBES["Tables data"](node) == (3,)
+            hits = table_columns.cache_info().hits
+            # Пока файл не изменился, проба берётся из кэша, размер кэша ограничен
+            assert SHAPE_PROBES["Tables data"](node) == (3,) and table_columns.cache_info().hits == hits + 1
+            assert table_columns.cache_info().maxsize == PROBE_CACHE_SIZE
+
+            path.write_text("1,2\n")
+            os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+            assert SHAPE_PROBES["Tables data"](node) == (2,)
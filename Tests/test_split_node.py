@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from Src.Nodes import SplitNode, SplitIndex
+
+
+
+class test_SplitNode(unittest.TestCase):
+    '''
+    Проверка разбиения данных на обучающую, валидационную и тестовую части
+    '''
+
+    def setUp(self):
+        self.x = np.arange(200, dtype=np.float32).reshape(100, 2)
+        self.y = np.repeat([0, 1, 2, 3], 25)
+
+
+    def test_contiguous(self):
+        split = SplitNode.split(self.x, val_size=0.1, test_size=0.2, shuffle=False, stratify=[], split=[])
+
+        assert [len(part) for part in (split.train, split.val, split.test)] == [70, 10, 20]
+        assert isinstance(split.index.train, slice)
+        for part in (split.train, split.val, split.test):
+            assert np.shares_memory(part, self.x)
+        assert np.array_equal(np.concatenate([split.train, split.val, split.test]), self.x)
+
+
+    def test_shuffle(self):
+        split = SplitNode.split(self.x, shuffle=True, seed=1)
+        rows = np.concatenate([split.index.train, split.index.val, split.index.test])
+
+        assert np.array_equal(np.sort(rows), np.arange(100))
+        assert not np.array_equal(rows, np.arange(100))
+        assert np.array_equal(split.val, self.x[split.index.val])
+        assert np.array_equal(SplitNode.split(self.x, shuffle=True, seed=1).index.test, split.index.test)
+
+
+    def test_reuse(self):
+        x_split = SplitNode.split(self.x, seed=3)
+        y_split = SplitNode.split(self.y, split=x_split.index)
+
+        assert y_split.index is x_split.index
+        assert np.array_equal(x_split.test[:, 0] // 2, np.arange(100)[x_split.index.test])
+        assert np.array_equal(y_split.test, self.y[x_split.index.test])
+
+        with self.assertRaises(AttributeError):
+            SplitNode.split(self.y[:50], split=x_split.index)
+        with self.assertRaises(AttributeError):
+            SplitNode.split(self.y, split=x_split.train)
+
+
+    def test_stratify(self):
+        one_hot = np.eye(4)[self.y]
+        split = SplitNode.split(self.x, val_size=0.2, test_size=0.2, stratify=one_hot)
+
+        for part, count in ((split.index.train, 15), (split.index.val, 5), (split.index.test, 5)):
+            assert np.array_equal(np.bincount(self.y[part]), [count] * 4)
+
+        ordered = SplitNode.make_index(100, 0.2, 0.2, shuffle=False, stratify=self.y)
+        assert np.all(np.diff(ordered.test) > 0)
+
+
+    def test_sizes(self):
+        for val_size, test_size in ((0.5, 0.5), (-0.1, 0.2)):
+            with self.assertRaises(AttributeError):
+                SplitNode.make_index(100, val_size, test_size)
+
+        assert isinstance(SplitNode.make_index(10, 0, 0), SplitIndex)
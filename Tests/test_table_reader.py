@@ -0,0 +1,75 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from Src.Utils import TableReader
+
+
+
+class test_TableReader(unittest.TestCase):
+    '''
+    Проверка чтения таблиц по частям
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "table.csv"
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def test_read(self):
+        expected = np.genfromtxt("./Tests/X.txt", delimiter=',', ndmin=2)
+
+        result = TableReader("./Tests/X.txt", chunk_size=4096).read()
+
+        assert result.dtype == np.float32
+        assert result.shape == expected.shape
+        assert np.allclose(result, expected)
+
+
+    def test_dtype(self):
+        self.path.write_text("1,2\n3,4\n5,6")
+
+        result = TableReader(self.path, dtype='int64').read()
+
+        assert result.dtype == np.int64
+        assert result.tolist() == [[1, 2], [3, 4], [5, 6]]
+
+
+    def test_skip(self):
+        self.path.write_text("a;b\n1;2\n3;4\n\n5;6\n7;8\n")
+
+        result = TableReader(self.path, delimiter=';', skip_header=True, skip_footer=True, chunk_size=4).read()
+
+        assert result.tolist() == [[1, 2], [3, 4], [5, 6]]
+
+
+    def test_missing_values(self):
+        self.path.write_text("1,2\n3,\n5,6\n")
+
+        result = TableReader(self.path).read()
+
+        assert result.shape == (3, 2)
+        assert np.isnan(result[1, 1])
+
+
+    def test_columns_mismatch(self):
+        self.path.write_text("1,2\n" * 10 + "1,2,3\n" * 10)
+
+        with self.assertRaises((AttributeError, ValueError)):
+            TableReader(self.path, chunk_size=8).read()
+
+
+    def test_progress(self):
+        progress = []
+
+        TableReader("./Tests/X.txt", chunk_size=2**16).read(progress.append)
+
+        assert len(progress) > 1
+        assert progress == sorted(progress)
+        assert progress[-1] == 1.0
@@ -0,0 +1,52 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from Src.Utils import TableStream
+
+
+
+class test_TableStream(unittest.TestCase):
+    '''
+    Проверка потокового чтения таблиц
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "table.csv"
+        self.path.write_text("a,b\n" + "".join(f"{i},{2 * i}\n" for i in range(50)) + "end,end\n")
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def test_shape(self):
+        stream = TableStream(self.path, skip_header=True)
+
+        assert stream.shape == (None, 2)
+        assert stream.ndim == 2
+        assert stream.dtype == np.float32
+
+
+    def test_batches(self):
+        stream = TableStream(self.path, skip_header=True, skip_footer=True, chunk_size=16)
+
+        batches = list(stream.batches(8))
+
+        assert all(len(batch) == 8 for batch in batches[:-1])
+        assert len(batches[-1]) == 2
+        assert np.concatenate(batches)[:, 0].tolist() == list(range(50))
+        assert stream.rows() == 50
+
+
+    def test_repeat(self):
+        stream = TableStream("./Tests/X.txt")
+
+        first = np.concatenate(list(stream.batches(1000)))
+        second = np.concatenate(list(stream.batches(333)))
+
+        assert np.array_equal(first, second)
+        assert np.allclose(first, np.genfromtxt("./Tests/X.txt", delimiter=',', ndmin=2))
@@ -0,0 +1,77 @@
+'''
+Запуск графов без интерфейса, например на сервере для обучения:
+
+    python -m graphnet run graph.json
+
+Заполнение локального зеркала датасетов для запуска без сети (GRAPHNET_OFFLINE=1 или --offline):
+
+    python -m graphnet mirror mnist cifar10
+'''
+from pathlib import Path
+import argparse
+import sys
+
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="graphnet", description="Выполнение графов graphNet без интерфейса")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="выполнить сохранённый граф и вывести время выполнения узлов")
+    run.add_argument("graph", type=Path, help="путь до графа в формате JSON")
+    run.add_argument("--trace", type=Path, help="сохранить замеры узлов в формате Chrome trace events")
+    run.add_argument("--offline", action="store_true", help="не обращаться к сети, датасеты только из зеркала")
+
+    mirror = commands.add_parser("mirror", help="скачать датасеты Keras в локальное зеркало")
+    mirror.add_argument("datasets", nargs="*", help="названия датасетов, по умолчанию все")
+    mirror.add_argument("--directory", type=Path, help="папка зеркала")
+
+    args = parser.parse_args(argv)
+    if args.command == "mirror": return mirror_datasets(args.datasets, args.directory)
+
+    # Тяжёлые модули (keras, tensorflow) загружаются только после разбора аргументов
+    from Src.Graph import GraphModel, HeadlessRunner
+    from Src.Exceptions import CycleException, ShapeException
+    from Src.Managers import Profiler, WriteManager
+    from Src.Utils import DatasetStore
+
+    if args.offline: DatasetStore.set_offline(True)
+    runner = HeadlessRunner(GraphModel.load(args.graph))
+
+    try:
+        visited = runner.run()
+    except (CycleException, ShapeException) as ex:
+        print(ex, file=sys.stderr)
+        return 2
+    finally:
+        # Узлы сохранения пишут файлы в фоне, процесс завершается только после записи
+        WriteManager.wait()
+
+    print(runner.report())
+    if args.trace: Profiler.export_trace(args.trace)
+    return 0 if len(visited) == len(runner.nodes) else 1
+
+
+def mirror_datasets(names: list[str], directory: Path = None) -> int:
+    from Src.Enums import Datasets
+    from Src.Exceptions import NetworkException
+    from Src.Utils import DatasetStore
+
+    if directory: DatasetStore.directory = directory
+    names = names or [dataset.value for dataset in Datasets]
+
+    for name in names:
+        if DatasetStore.exists(name):
+            print(f"{name}: уже в {DatasetStore.path(name)}")
+            continue
+        try:
+            DatasetStore.download(name)
+        except (NetworkException, AttributeError, OSError) as ex:
+            print(f"{name}: {ex}", file=sys.stderr)
+            return 1
+        print(f"{name}: сохранён в {DatasetStore.path(name)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,42 +1,64 @@
-import json
+import multiprocessing
 import sys
 from pathlib import Path
 
 import dearpygui.dearpygui as dpg
 
 from Src.Logging import logging
-from Src.Managers import ThemeManager
+from Src.Managers import ThemeManager, TaskManager, MemoryBudget, WriteManager
+from Src.Utils import warm_up
 from Src.node_editor import NodeEditor
 
 
-dpg.create_context()
-dpg.create_viewport(title='Custom Title')
 
-base_path = Path(sys._MEIPASS if hasattr(sys, '_MEIPASS') else '.')
-font_path = base_path / "Assets/notomono-regular.ttf"
-themes_path = base_path / "Assets/themes.json"
+def main():
+    dpg.create_context()
+    dpg.create_viewport(title='Custom Title')
 
-ThemeManager.load_themes(themes_path)
-node_editor = NodeEditor(minimap=True, minimap_location=dpg.mvNodeMiniMap_Location_TopRight)
-main_logger = logging()("main")
+    base_path = Path(sys._MEIPASS if hasattr(sys, '_MEIPASS') else '.')
+    font_path = base_path / "Assets/notomono-regular.ttf"
+    themes_path = base_path / "Assets/themes.json"
 
+    ThemeManager.load_themes(themes_path)
+    node_editor = NodeEditor(minimap=True, minimap_location=dpg.mvNodeMiniMap_Location_TopRight)
+    main_logger = logging()("main")
 
 
-with dpg.font_registry():
-    with dpg.font(font_path, 18, default_font=True, tag="Default font") as f:
-        dpg.add_font_range_hint(dpg.mvFontRangeHint_Cyrillic)
-dpg.bind_font("Default font")
 
-with dpg.window(tag="Prime"):
-    node_editor.show("Prime")
-    main_logger.warning("НАЧАЛИ")
+    with dpg.font_registry():
+        with dpg.font(font_path, 18, default_font=True, tag="Default font") as f:
+            dpg.add_font_range_hint(dpg.mvFontRangeHint_Cyrillic)
+    dpg.bind_font("Default font")
 
+    with dpg.window(tag="Prime"):
+        node_editor.show("Prime")
+        main_logger.warning("НАЧАЛИ")
 
-dpg.setup_dearpygui()
-dpg.show_viewport()
-dpg.set_primary_window("Prime", True)
-dpg.set_global_font_scale(1)
-dpg.start_dearpygui()
 
+    dpg.setup_dearpygui()
+    dpg.show_viewport()
 
-dpg.destroy_context()
+    # Окно появляется сразу, а Keras и TensorFlow загружаются в фоне к первой сборке графа
+    warm_up("keras", "Src.Nodes.keras_callbacks", "Src.Nodes.data_pipeline")
+    dpg.set_primary_window("Prime", True)
+    dpg.set_global_font_scale(1)
+
+    # Результаты фоновых задач применяются к интерфейсу между кадрами
+    while dpg.is_dearpygui_running():
+        TaskManager.process_ui_queue()
+        dpg.render_dearpygui_frame()
+
+    TaskManager.shutdown()
+    # Данные, поставленные узлами «Save data» в очередь, дописываются до выхода
+    WriteManager.wait()
+    node_editor.builder.worker.stop()
+    MemoryBudget.clear()
+
+
+    dpg.destroy_context()
+
+
+# Процесс сборки запускается через spawn и импортирует этот модуль заново, интерфейс создаётся только в основном процессе
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()